@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Benchmark: keyword classifier vs. the original any(word in title) scans
+مقایسه سرعت دسته‌بندی تسک‌ها
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+from typing import List, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from issuegen.classifier import CATEGORY_KEYWORDS, PRIORITY_KEYWORDS, KeywordClassifier
+
+VOCABULARY = (
+    "setup fastapi project with docker configuration and environment variables "
+    "implement pydantic models for validation of user input data create flutter "
+    "screen widget write documentation polish login flow add jwt tokens performance "
+    "tuning integrate github webhooks obsidian sync ci/cd pipeline schema migration "
+    "endpoint route openai suggestion engine security audit unit test coverage "
+    "advanced caching critical fix comment cleanup build email guide quick"
+).split()
+
+
+def legacy_classify(title: str) -> Tuple[str, str]:
+    """Reference implementation copied from the original generator scripts"""
+    task_lower = title.lower()
+    priority = 'medium'
+    for label, words in PRIORITY_KEYWORDS:
+        if any(word in task_lower for word in words):
+            priority = label
+            break
+    category = 'development'
+    for label, words in CATEGORY_KEYWORDS:
+        if any(word in task_lower for word in words):
+            category = label
+            break
+    return priority, category
+
+
+def make_titles(count: int, seed: int) -> List[str]:
+    rng = random.Random(seed)
+    return [
+        ' '.join(rng.choice(VOCABULARY) for _ in range(rng.randint(4, 14))).capitalize()
+        for _ in range(count)
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the task keyword classifier')
+    parser.add_argument('--titles', type=int, default=1_000_000, help='Number of synthetic titles')
+    parser.add_argument('--seed', type=int, default=42, help='Random seed for the title corpus')
+    args = parser.parse_args()
+
+    titles = make_titles(args.titles, args.seed)
+    print(f"📚 Generated {len(titles):,} titles")
+
+    start = time.perf_counter()
+    expected = [legacy_classify(title) for title in titles]
+    legacy_time = time.perf_counter() - start
+    print(f"⏱️  legacy any() scans:   {legacy_time:8.3f}s  ({len(titles) / legacy_time:,.0f} titles/s)")
+
+    classifier = KeywordClassifier()
+    start = time.perf_counter()
+    actual = classifier.classify_many(titles)
+    batch_time = time.perf_counter() - start
+    print(f"⏱️  KeywordClassifier:    {batch_time:8.3f}s  ({len(titles) / batch_time:,.0f} titles/s)")
+
+    if actual != expected:
+        mismatches = sum(1 for a, b in zip(actual, expected) if a != b)
+        print(f"❌ {mismatches} classifications differ from the legacy implementation")
+        sys.exit(1)
+    print(f"✅ Results identical, speedup x{legacy_time / batch_time:.2f}")
+
+
+if __name__ == "__main__":
+    main()
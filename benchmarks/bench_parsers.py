@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+Benchmark: parser throughput and peak memory, with a regression baseline
+بنچمارک سرعت و حافظه‌ی پارسرها
+
+Measures the roadmap sources that replaced ``parse_markdown_roadmap``,
+``parse_yaml_roadmap`` and ``load_parsed_from_file``:
+
+* markdown          - MarkdownSource, serial
+* markdown-parallel - MarkdownSource with one parse worker per CPU
+* yaml              - YamlSource (compose + schema check + construct)
+* json              - JsonCacheSource reading a --save-parsed cache
+
+Every measurement runs in a fresh interpreter, so its peak RSS belongs to
+that parser and size alone. Results are compared with a baseline file;
+throughput below ``1 - tolerance`` times the baseline, or peak RSS above
+``1 + tolerance`` times it, is a regression and the script exits with 1.
+Baselines are machine-specific: regenerate with --update-baseline on the
+machine that runs the comparison.
+
+Usage:
+    python benchmarks/bench_parsers.py                      # 10^3..10^5, compare
+    python benchmarks/bench_parsers.py --sizes 1000000 --formats markdown json
+    python benchmarks/bench_parsers.py --update-baseline
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+from corpus import CORPUS_FORMATS, write_corpus  # noqa: E402
+
+PARSER_FORMATS = ('markdown', 'markdown-parallel', 'yaml', 'json')
+DEFAULT_SIZES = (1_000, 10_000, 100_000)
+DEFAULT_BASELINE = Path(__file__).resolve().parent / 'parser_baseline.json'
+DEFAULT_TOLERANCE = 0.25
+
+
+def _peak_rss_mib() -> float:
+    # Linux keeps ru_maxrss across fork+exec, so a worker started by a parent that
+    # just parsed a large corpus would report the parent's peak; VmHWM is per process
+    try:
+        with open('/proc/self/status', encoding='ascii') as f:
+            for line in f:
+                if line.startswith('VmHWM:'):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    import resource
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Kilobytes on Linux, bytes on macOS
+    return peak / 1024 / 1024 if sys.platform == 'darwin' else peak / 1024
+
+
+def run_worker(parser_format: str, file_path: str) -> None:
+    """Child process: parse once and print {"tasks", "seconds", "peak_rss_mib"} as JSON"""
+    from issuegen.sources import get_source
+
+    source_name = 'markdown' if parser_format == 'markdown-parallel' else parser_format
+    source = get_source(source_name)()
+    if parser_format == 'markdown-parallel':
+        source.parse_workers = os.cpu_count() or 1
+    started = time.perf_counter()
+    tasks = sum(len(phase.tasks) for phase in source.iter_phases(file_path))
+    seconds = time.perf_counter() - started
+    print(json.dumps({'tasks': tasks, 'seconds': seconds, 'peak_rss_mib': _peak_rss_mib()}))
+
+
+def measure(parser_format: str, file_path: str, repeat: int) -> Dict[str, float]:
+    """Best of ``repeat`` runs (highest throughput, lowest peak RSS)"""
+    best: Optional[Dict[str, float]] = None
+    for _ in range(repeat):
+        output = subprocess.run([sys.executable, __file__, '--worker', parser_format, file_path],
+                                check=True, capture_output=True, text=True).stdout
+        result = json.loads(output.strip().splitlines()[-1])
+        result['tasks_per_sec'] = result['tasks'] / result['seconds'] if result['seconds'] else float('inf')
+        if best is None:
+            best = result
+        else:
+            best['tasks_per_sec'] = max(best['tasks_per_sec'], result['tasks_per_sec'])
+            best['peak_rss_mib'] = min(best['peak_rss_mib'], result['peak_rss_mib'])
+    return best
+
+
+def _write(directory: Path, corpus_format: str, size: int, seed: int) -> Path:
+    path = directory / f"roadmap-{size}{CORPUS_FORMATS[corpus_format][1]}"
+    if not path.exists():
+        with open(path, 'w', encoding='utf-8') as f:
+            write_corpus(f, corpus_format, size, seed)
+    return path
+
+
+def prepare_corpus(directory: Path, size: int, formats: List[str], seed: int) -> Dict[str, Path]:
+    """The input file of each parser format for ``size`` tasks (the JSON cache is saved from the Markdown parse)"""
+    files: Dict[str, Path] = {}
+    for parser_format in formats:
+        if parser_format == 'yaml':
+            files[parser_format] = _write(directory, 'yaml', size, seed)
+            continue
+        markdown = _write(directory, 'markdown', size, seed)
+        if parser_format != 'json':
+            files[parser_format] = markdown
+            continue
+        path = directory / f"roadmap-{size}.json"
+        if not path.exists():
+            from issuegen.sources import get_source
+            from issuegen.sources.json_cache import save_parsed_to_file
+            save_parsed_to_file(get_source('markdown')().parse(str(markdown)), str(path))
+        files[parser_format] = path
+    return files
+
+
+def compare(key: str, result: Dict[str, float], baseline: Dict[str, Dict[str, float]], tolerance: float) -> List[str]:
+    reference = baseline.get(key)
+    if reference is None:
+        return []
+    problems = []
+    if result['tasks_per_sec'] < reference['tasks_per_sec'] * (1 - tolerance):
+        problems.append(f"{key}: {result['tasks_per_sec']:,.0f} tasks/s vs baseline "
+                        f"{reference['tasks_per_sec']:,.0f}")
+    if result['peak_rss_mib'] > reference['peak_rss_mib'] * (1 + tolerance):
+        problems.append(f"{key}: peak RSS {result['peak_rss_mib']:.1f} MiB vs baseline "
+                        f"{reference['peak_rss_mib']:.1f} MiB")
+    return problems
+
+
+def main():
+    if len(sys.argv) == 4 and sys.argv[1] == '--worker':
+        run_worker(sys.argv[2], sys.argv[3])
+        return
+
+    parser = argparse.ArgumentParser(description='Benchmark roadmap parser throughput and memory')
+    parser.add_argument('--sizes', type=int, nargs='+', default=list(DEFAULT_SIZES),
+                        help='Task counts to generate (default: 1000 10000 100000)')
+    parser.add_argument('--formats', nargs='+', choices=PARSER_FORMATS, default=list(PARSER_FORMATS),
+                        help='Parsers to measure (default: all)')
+    parser.add_argument('--repeat', type=int, default=3, help='Runs per measurement; the best is kept')
+    parser.add_argument('--seed', type=int, default=42, help='Random seed for the corpus')
+    parser.add_argument('--corpus-dir', help='Keep generated roadmaps here (default: a temporary directory)')
+    parser.add_argument('--baseline', default=str(DEFAULT_BASELINE), help='Baseline JSON file')
+    parser.add_argument('--tolerance', type=float, default=DEFAULT_TOLERANCE,
+                        help=f'Allowed relative slowdown / RSS growth (default: {DEFAULT_TOLERANCE})')
+    parser.add_argument('--update-baseline', action='store_true', help='Write the results as the new baseline')
+    args = parser.parse_args()
+
+    baseline_path = Path(args.baseline)
+    baseline = json.loads(baseline_path.read_text(encoding='utf-8')) if baseline_path.exists() else {}
+    results: Dict[str, Dict[str, float]] = {}
+    regressions: List[str] = []
+
+    with tempfile.TemporaryDirectory() as tmp:
+        directory = Path(args.corpus_dir or tmp)
+        directory.mkdir(parents=True, exist_ok=True)
+        print(f"{'parser':<18} {'tasks':>10} {'tasks/s':>12} {'peak RSS':>10}  vs baseline")
+        for size in args.sizes:
+            files = prepare_corpus(directory, size, args.formats, args.seed)
+            for parser_format in args.formats:
+                key = f"{parser_format}@{size}"
+                result = measure(parser_format, str(files[parser_format]), args.repeat)
+                if result['tasks'] != size:
+                    print(f"❌ {key}: parsed {result['tasks']} tasks, expected {size}")
+                    sys.exit(1)
+                results[key] = {'tasks_per_sec': round(result['tasks_per_sec'], 1),
+                                'peak_rss_mib': round(result['peak_rss_mib'], 1)}
+                reference = baseline.get(key)
+                delta = (f"{result['tasks_per_sec'] / reference['tasks_per_sec'] - 1:+.0%} speed, "
+                         f"{result['peak_rss_mib'] / reference['peak_rss_mib'] - 1:+.0%} RSS"
+                         if reference else "-")
+                print(f"{parser_format:<18} {size:>10,} {result['tasks_per_sec']:>12,.0f} "
+                      f"{result['peak_rss_mib']:>7.1f}MiB  {delta}")
+                regressions += compare(key, result, baseline, args.tolerance)
+
+    if args.update_baseline:
+        baseline.update(results)
+        baseline_path.write_text(json.dumps(baseline, indent=2, sort_keys=True) + "\n", encoding='utf-8')
+        print(f"✅ Baseline updated: {baseline_path}")
+        return
+    if regressions:
+        print(f"❌ {len(regressions)} regression(s) beyond {args.tolerance:.0%}:")
+        for problem in regressions:
+            print(f"  - {problem}")
+        sys.exit(1)
+    print("✅ No regressions" if baseline else "⚠️ No baseline yet; run with --update-baseline")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Synthetic roadmap corpus in the shapes of docs/Grok_Road_Map_v1.md and v2
+تولید نقشه راه مصنوعی برای بنچمارک
+
+Markdown files follow the checklist layout (``## 📋 Phase`` / ``### Week`` /
+``**Day X-Y: ...**`` / ``- [ ]``) with the prose sections the AI prompts put
+around it; YAML files follow docs/ai_prompt_claudev2.md (project / phases /
+weeks / categories / tasks) with estimates, priorities and some subtasks.
+Both are written line by line, so 10^6-task files need no more memory than
+10^3-task ones. The same seed always gives the same file.
+"""
+
+import argparse
+import random
+from typing import Iterator, TextIO
+
+WEEKS_PER_PHASE = 3
+CATEGORIES_PER_WEEK = 4
+TASKS_PER_CATEGORY = 5
+TASKS_PER_PHASE = WEEKS_PER_PHASE * CATEGORIES_PER_WEEK * TASKS_PER_CATEGORY
+
+PHASE_NAMES = (
+    "Backend Foundation", "Mobile App Core Development", "Integration & Advanced Features",
+    "Testing, Deployment & Launch", "Infrastructure Hardening", "Analytics & Reporting",
+)
+CATEGORY_NAMES = (
+    "Project Setup and Configuration", "Authentication Implementation", "Core API Endpoints",
+    "Local Storage & State Management", "Third-party Integrations", "Performance Optimization",
+    "Testing Strategy", "Documentation",
+)
+VERBS = ("Setup", "Implement", "Create", "Integrate", "Write", "Add", "Configure", "Polish", "Optimize", "Document")
+OBJECTS = (
+    "FastAPI project with Docker configuration", "PostgreSQL schema with Alembic migrations",
+    "Pydantic models for task validation", "JWT authentication with OAuth2 flow",
+    "Flutter home screen widget", "Mobx store for schedules", "GitHub webhook handler",
+    "Obsidian Markdown sync watcher", "OpenAI suggestion endpoint", "SMS notification service",
+    "unit tests with pytest and httpx", "CI/CD pipeline for Docker images", "Redis cache for schedules",
+    "WebSocket channel for real-time updates", "security audit of the login flow",
+)
+DETAILS = (
+    "for development", "for the mobile client", "with error handling", "and document the endpoints",
+    "behind a feature flag", "with integration tests", "for production", "",
+)
+PROSE = (
+    "This phase builds on the previous one and keeps the scope small enough to test early. "
+    "Each week ends with a working increment that can be demoed and reviewed."
+)
+
+
+def _title(rng: random.Random) -> str:
+    return f"{rng.choice(VERBS)} {rng.choice(OBJECTS)} {rng.choice(DETAILS)}".strip()
+
+
+def _phases(tasks: int) -> int:
+    return max(1, -(-tasks // TASKS_PER_PHASE))
+
+
+def iter_markdown(tasks: int, seed: int = 42) -> Iterator[str]:
+    """Lines of a Markdown roadmap with exactly ``tasks`` checklist items"""
+    rng = random.Random(seed)
+    yield "# Intelligent Task Management App - Development Roadmap\n\n"
+    yield f"## 🎯 Project Overview\n{PROSE}\n\n"
+    yield "## 🏗️ Architecture Analysis\nBased on your project requirements, I've identified the main phases:\n\n"
+    yield f"## ⏰ Timeline Overview\n- **Total Duration:** {_phases(tasks) * WEEKS_PER_PHASE} weeks\n\n---\n\n"
+    remaining = tasks
+    for phase_number in range(1, _phases(tasks) + 1):
+        name = PHASE_NAMES[(phase_number - 1) % len(PHASE_NAMES)]
+        yield f"## 📋 Phase {phase_number}: {name} ({WEEKS_PER_PHASE} weeks)\n\n"
+        yield f"### 🎯 Phase Goals\n{PROSE}\n\n"
+        # Weeks restart at 1 in every phase, as in the docs/ roadmaps
+        for week_number in range(1, WEEKS_PER_PHASE + 1):
+            yield f"### Week {week_number}: {rng.choice(CATEGORY_NAMES)}\n"
+            yield f"#### 🎯 Sprint Goals\n{PROSE}\n\n#### 📝 Tasks\n"
+            for category_index in range(CATEGORIES_PER_WEEK):
+                first_day = category_index * 2 + 1
+                yield f"**Day {first_day}-{first_day + 1}: {rng.choice(CATEGORY_NAMES)}**\n"
+                for _ in range(min(TASKS_PER_CATEGORY, remaining)):
+                    remaining -= 1
+                    yield f"- [ ] {_title(rng)}.\n"
+                yield "\n"
+        yield "#### 🔍 Definition of Done\n- ✅ All tasks reviewed\n\n---\n\n"
+
+
+def _yaml_text(value: str) -> str:
+    return '"' + value.replace('\\', '\\\\').replace('"', '\\"') + '"'
+
+
+def iter_yaml(tasks: int, seed: int = 42) -> Iterator[str]:
+    """Lines of a YAML roadmap with exactly ``tasks`` tasks"""
+    rng = random.Random(seed)
+    yield "project:\n  name: \"Intelligent Task Management App\"\n  total_duration_weeks: "
+    yield f"{_phases(tasks) * WEEKS_PER_PHASE}\nphases:\n"
+    remaining = tasks
+    for phase_number in range(1, _phases(tasks) + 1):
+        name = PHASE_NAMES[(phase_number - 1) % len(PHASE_NAMES)]
+        yield f"  - name: \"Phase {phase_number}: {name}\"\n"
+        yield f"    duration_weeks: {WEEKS_PER_PHASE}\n"
+        yield f"    description: {_yaml_text(PROSE)}\n"
+        yield "    goals:\n      - \"Ship a working increment\"\n      - \"Keep tests green\"\n"
+        yield "    weeks:\n"
+        for week_number in range(1, WEEKS_PER_PHASE + 1):
+            yield f"      - week_number: {week_number}\n"
+            yield f"        title: {_yaml_text(rng.choice(CATEGORY_NAMES))}\n"
+            yield "        categories:\n"
+            for category_index in range(CATEGORIES_PER_WEEK):
+                first_day = category_index * 2 + 1
+                yield f"          - category: \"{rng.choice(CATEGORY_NAMES)} (Day {first_day}-{first_day + 1})\"\n"
+                yield "            tasks:\n" if remaining else "            tasks: []\n"
+                for _ in range(min(TASKS_PER_CATEGORY, remaining)):
+                    remaining -= 1
+                    yield f"              - title: {_yaml_text(_title(rng))}\n"
+                    yield f"                description: {_yaml_text(rng.choice(OBJECTS))}\n"
+                    yield f"                estimated_hours: {rng.choice((1, 2, 3, 4, 6, 8))}\n"
+                    yield f"                priority: {rng.choice(('high', 'medium', 'low'))}\n"
+                    if rng.random() < 0.1:
+                        yield "                subtasks:\n"
+                        for _ in range(rng.randint(2, 4)):
+                            yield f"                  - {_yaml_text(_title(rng))}\n"
+
+
+CORPUS_FORMATS = {'markdown': (iter_markdown, '.md'), 'yaml': (iter_yaml, '.yaml')}
+
+
+def write_corpus(stream: TextIO, corpus_format: str, tasks: int, seed: int = 42) -> None:
+    generate, _ = CORPUS_FORMATS[corpus_format]
+    stream.writelines(generate(tasks, seed))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Write a synthetic roadmap')
+    parser.add_argument('--format', choices=sorted(CORPUS_FORMATS), default='markdown', help='Roadmap format')
+    parser.add_argument('--tasks', type=int, default=1000, help='Number of tasks (default: 1000)')
+    parser.add_argument('--seed', type=int, default=42, help='Random seed')
+    parser.add_argument('--output', required=True, help='File to write')
+    args = parser.parse_args()
+    with open(args.output, 'w', encoding='utf-8') as f:
+        write_corpus(f, args.format, args.tasks, args.seed)
+    print(f"✅ Wrote {args.tasks:,} {args.format} tasks to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+"""
+Local stand-in for GitHub's Issue Import API
+سرور محلی برای آزمایش Issue Import API
+
+Implements just what issuegen.importer uses, in memory:
+
+* POST  /repos/{owner}/{repo}/import/issues           -> 202, status "pending"
+* GET   /repos/{owner}/{repo}/import/issues?since=    -> every import status
+* GET   /repos/{owner}/{repo}/import/issues/{id}      -> one import status
+* PATCH /repos/{owner}/{repo}/issues/{number}         -> update an imported issue's body
+
+Imports turn into issues ``--delay`` seconds after they were queued, in
+queue order, like GitHub's background worker. ``--fail-every N`` fails every
+Nth import with a validation error. Every request is counted; GET /stats
+returns the counters and the created issues.
+
+Labels, milestones and duplicate checks still go through PyGithub, so point
+an ``IssueImporter`` (or ``--import-api-url``) at this server and keep the
+rest of the run on a scratch repository.
+
+Usage:
+    python devtools/issue_import_server.py --port 8090 --delay 0.5
+"""
+
+import argparse
+import json
+import re
+import threading
+import time
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse
+
+IMPORTS_RE = re.compile(r'^/repos/([^/]+)/([^/]+)/import/issues(?:/(\d+))?$')
+ISSUE_RE = re.compile(r'^/repos/([^/]+)/([^/]+)/issues/(\d+)$')
+
+
+class ImportStore:
+    def __init__(self, delay: float, fail_every: int):
+        self.delay = delay
+        self.fail_every = fail_every
+        self.imports = {}
+        self.issues = {}
+        self.requests = {}
+        self._next_number = {}
+        self._lock = threading.Lock()
+
+    def count(self, method: str) -> None:
+        with self._lock:
+            self.requests[method] = self.requests.get(method, 0) + 1
+
+    def queue(self, owner: str, repo: str, issue: dict) -> dict:
+        with self._lock:
+            import_id = len(self.imports) + 1
+            now = datetime.now(timezone.utc).isoformat()
+            self.imports[import_id] = {
+                'id': import_id,
+                'status': 'pending',
+                'url': f"/repos/{owner}/{repo}/import/issues/{import_id}",
+                'repository_url': f"/repos/{owner}/{repo}",
+                'created_at': now,
+                'updated_at': now,
+                '_repo': f"{owner}/{repo}",
+                '_issue': issue,
+                '_ready_at': time.monotonic() + self.delay,
+            }
+            return self._public(self.imports[import_id])
+
+    def _advance(self) -> None:
+        now = time.monotonic()
+        for record in self.imports.values():
+            if record['status'] != 'pending' or record['_ready_at'] > now:
+                continue
+            record['updated_at'] = datetime.now(timezone.utc).isoformat()
+            if self.fail_every and record['id'] % self.fail_every == 0:
+                record['status'] = 'failed'
+                record['errors'] = [{'location': '/issue/title', 'resource': 'Issue', 'field': 'title',
+                                     'value': record['_issue'].get('title'), 'code': 'invalid'}]
+                continue
+            repo = record['_repo']
+            number = self._next_number.get(repo, 1)
+            self._next_number[repo] = number + 1
+            self.issues[(repo, number)] = dict(record['_issue'], number=number)
+            record['status'] = 'imported'
+            record['issue_url'] = f"/repos/{repo}/issues/{number}"
+
+    def status(self, owner: str, repo: str, import_id=None):
+        with self._lock:
+            self._advance()
+            if import_id is not None:
+                record = self.imports.get(import_id)
+                return self._public(record) if record and record['_repo'] == f"{owner}/{repo}" else None
+            return [self._public(r) for r in self.imports.values() if r['_repo'] == f"{owner}/{repo}"]
+
+    def edit(self, owner: str, repo: str, number: int, body: str) -> bool:
+        with self._lock:
+            issue = self.issues.get((f"{owner}/{repo}", number))
+            if issue is None:
+                return False
+            issue['body'] = body
+            return True
+
+    @staticmethod
+    def _public(record: dict) -> dict:
+        return {key: value for key, value in record.items() if not key.startswith('_')}
+
+
+class ImportHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def _reply(self, status: int, payload) -> None:
+        body = json.dumps(payload).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _body(self) -> dict:
+        length = int(self.headers.get('Content-Length') or 0)
+        return json.loads(self.rfile.read(length) or b'{}')
+
+    def _authorized(self) -> bool:
+        if self.headers.get('Authorization'):
+            return True
+        self._reply(401, {'message': 'Requires authentication'})
+        return False
+
+    def do_GET(self) -> None:
+        store = self.server.store
+        path = urlparse(self.path).path
+        if path == '/stats':
+            issues = [dict(issue, repo=repo) for (repo, _), issue in sorted(store.issues.items())]
+            self._reply(200, {'requests': store.requests, 'issues': issues})
+            return
+        store.count('GET')
+        match = IMPORTS_RE.match(path)
+        if not match:
+            self._reply(404, {'message': 'Not Found'})
+            return
+        if not self._authorized():
+            return
+        owner, repo, import_id = match.groups()
+        result = store.status(owner, repo, int(import_id) if import_id else None)
+        self._reply(200 if result is not None else 404, result if result is not None else {'message': 'Not Found'})
+
+    def do_POST(self) -> None:
+        store = self.server.store
+        store.count('POST')
+        match = IMPORTS_RE.match(urlparse(self.path).path)
+        payload = self._body()
+        if not match or match.group(3):
+            self._reply(404, {'message': 'Not Found'})
+            return
+        if not self._authorized():
+            return
+        issue = payload.get('issue')
+        if not isinstance(issue, dict) or not issue.get('title') or 'body' not in issue:
+            self._reply(422, {'message': 'Validation Failed'})
+            return
+        self._reply(202, store.queue(match.group(1), match.group(2), issue))
+
+    def do_PATCH(self) -> None:
+        store = self.server.store
+        store.count('PATCH')
+        match = ISSUE_RE.match(urlparse(self.path).path)
+        payload = self._body()
+        if not match:
+            self._reply(404, {'message': 'Not Found'})
+            return
+        if not self._authorized():
+            return
+        owner, repo, number = match.groups()
+        if store.edit(owner, repo, int(number), payload.get('body', '')):
+            self._reply(200, {'number': int(number), 'body': payload.get('body', '')})
+        else:
+            self._reply(404, {'message': 'Not Found'})
+
+    def log_message(self, format, *args) -> None:
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+
+def make_server(host: str = '127.0.0.1', port: int = 0, delay: float = 0.0, fail_every: int = 0,
+                verbose: bool = False) -> ThreadingHTTPServer:
+    server = ThreadingHTTPServer((host, port), ImportHandler)
+    server.daemon_threads = True
+    server.store = ImportStore(delay, fail_every)
+    server.verbose = verbose
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Local stand-in for the GitHub Issue Import API')
+    parser.add_argument('--host', default='127.0.0.1', help='Address to bind (default: 127.0.0.1)')
+    parser.add_argument('--port', type=int, default=8090, help='Port (default: 8090)')
+    parser.add_argument('--delay', type=float, default=0.5, help='Seconds before a queued import is created')
+    parser.add_argument('--fail-every', type=int, default=0, help='Fail every Nth import (0 = never)')
+    parser.add_argument('--verbose', action='store_true', help='Log every request')
+    args = parser.parse_args()
+    server = make_server(args.host, args.port, args.delay, args.fail_every, args.verbose)
+    print(f"🚀 Issue import stand-in on http://{args.host}:{server.server_address[1]}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\n⏹️ Shutting down")
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+OpenAI-compatible stub that streams a roadmap file as a chat completion
+سرور آزمایشی سازگار با OpenAI برای تولید جریانی نقشه راه
+
+``POST /v1/chat/completions`` answers with the given roadmap, ignoring the
+prompt. With ``"stream": true`` the text is sent as server-sent events of
+``--chunk-chars`` characters every ``--delay`` seconds (roughly a model's
+token rate), ending in ``data: [DONE]``; otherwise as one JSON completion.
+``--fence`` wraps the reply in a code fence the way chat models often do.
+
+Usage:
+    python devtools/openai_stub_server.py --roadmap docs/Grok_Road_Map_v1.md --port 8091 --delay 0.02
+    python issue_generator.py ... --generate brief.txt --ai-url http://127.0.0.1:8091/v1 --pipeline
+"""
+
+import argparse
+import json
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class CompletionHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def _json(self, status: int, payload) -> None:
+        body = json.dumps(payload).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self) -> None:
+        length = int(self.headers.get('Content-Length') or 0)
+        try:
+            request = json.loads(self.rfile.read(length) or b'{}')
+        except ValueError:
+            self._json(400, {'error': {'message': 'Invalid JSON'}})
+            return
+        if self.path.rstrip('/') not in ('/v1/chat/completions', '/chat/completions'):
+            self._json(404, {'error': {'message': 'Not Found'}})
+            return
+        if not request.get('messages'):
+            self._json(400, {'error': {'message': "'messages' is required"}})
+            return
+        server = self.server
+        server.requests += 1
+        model = request.get('model', 'stub')
+        if not request.get('stream'):
+            self._json(200, {'id': 'chatcmpl-stub', 'object': 'chat.completion', 'model': model,
+                             'choices': [{'index': 0, 'finish_reason': 'stop',
+                                          'message': {'role': 'assistant', 'content': server.text}}]})
+            return
+
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/event-stream')
+        self.send_header('Cache-Control', 'no-cache')
+        self.send_header('Connection', 'close')
+        self.end_headers()
+        self.close_connection = True
+        try:
+            self._event({'role': 'assistant', 'content': ''}, model)
+            for start in range(0, len(server.text), server.chunk_chars):
+                time.sleep(server.delay)
+                self._event({'content': server.text[start:start + server.chunk_chars]}, model)
+            self._event({}, model, finish_reason='stop')
+            self.wfile.write(b'data: [DONE]\n\n')
+            self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+    def _event(self, delta, model: str, finish_reason=None) -> None:
+        event = {'id': 'chatcmpl-stub', 'object': 'chat.completion.chunk', 'created': int(time.time()),
+                 'model': model, 'choices': [{'index': 0, 'delta': delta, 'finish_reason': finish_reason}]}
+        self.wfile.write(b'data: ' + json.dumps(event).encode('utf-8') + b'\n\n')
+        self.wfile.flush()
+
+    def log_message(self, format, *args) -> None:
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+
+def make_server(text: str, host: str = '127.0.0.1', port: int = 0, chunk_chars: int = 16, delay: float = 0.0,
+                verbose: bool = False) -> ThreadingHTTPServer:
+    server = ThreadingHTTPServer((host, port), CompletionHandler)
+    server.daemon_threads = True
+    server.text = text
+    server.chunk_chars = max(1, chunk_chars)
+    server.delay = delay
+    server.verbose = verbose
+    server.requests = 0
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Stream a roadmap file as an OpenAI-compatible chat completion')
+    parser.add_argument('--roadmap', required=True, help='Roadmap file to send back')
+    parser.add_argument('--host', default='127.0.0.1', help='Address to bind (default: 127.0.0.1)')
+    parser.add_argument('--port', type=int, default=8091, help='Port (default: 8091)')
+    parser.add_argument('--chunk-chars', type=int, default=16, help='Characters per streamed chunk (default: 16)')
+    parser.add_argument('--delay', type=float, default=0.02, help='Seconds between chunks (default: 0.02)')
+    parser.add_argument('--fence', action='store_true', help='Wrap the reply in a ``` code fence')
+    parser.add_argument('--verbose', action='store_true', help='Log every request')
+    args = parser.parse_args()
+    with open(args.roadmap, 'r', encoding='utf-8') as f:
+        text = f.read()
+    if args.fence:
+        text = "Here is your roadmap:\n\n```\n" + text.rstrip('\n') + "\n```\n"
+    server = make_server(text, args.host, args.port, args.chunk_chars, args.delay, args.verbose)
+    print(f"🚀 Chat completion stub on http://{args.host}:{server.server_address[1]}/v1 "
+          f"({len(text):,} characters in {args.chunk_chars}-character chunks)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\n⏹️ Shutting down")
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,3 @@
+"""
+Shared building blocks for the roadmap -> GitHub issue generators
+"""
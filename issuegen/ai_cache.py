@@ -0,0 +1,110 @@
+"""
+Content-addressed cache of AI model responses
+کش پاسخ‌های مدل هوش مصنوعی
+
+A generation request is identified by the SHA-256 of its prompt template,
+its filled variables (the brief, or one phase's section of it) and the model
+parameters (endpoint, model). The raw response text is stored under that
+key, so an identical request is answered from disk without calling the
+model. Entries live one per file; reading one refreshes its mtime, and
+``put`` evicts the least recently used files once the cache holds more
+than ``max_entries`` entries or ``max_bytes`` bytes.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from issuegen.defaults import DEFAULT_MAX_BYTES, DEFAULT_MAX_ENTRIES
+from issuegen.state import default_state_dir
+
+CACHE_VERSION = 1
+SUFFIX = '.txt'
+
+
+def default_cache_dir() -> Path:
+    return default_state_dir() / 'ai-cache'
+
+
+def request_key(template: str, variables: Dict[str, Any], model: Dict[str, Any]) -> str:
+    """Key of a request: every input that can change the model's answer"""
+    material = json.dumps({'version': CACHE_VERSION, 'template': template, 'variables': variables, 'model': model},
+                          sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(material.encode('utf-8')).hexdigest()
+
+
+class ResponseCache:
+    """Raw responses keyed by ``request_key``, bounded by entry count and total size"""
+
+    def __init__(self, directory: Optional[str] = None, max_bytes: int = DEFAULT_MAX_BYTES,
+                 max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.directory = Path(directory) if directory else default_cache_dir()
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+
+    def _path(self, key: str) -> Path:
+        return self.directory / (key + SUFFIX)
+
+    def get(self, key: str) -> Optional[str]:
+        path = self._path(key)
+        try:
+            text = path.read_text(encoding='utf-8')
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        except (OSError, UnicodeDecodeError) as e:
+            print(f"⚠️ Ignoring unreadable cached response {path}: {e}")
+            self.misses += 1
+            return None
+        try:
+            # Mark as recently used
+            os.utime(path)
+        except OSError:
+            pass
+        self.hits += 1
+        return text
+
+    def put(self, key: str, text: str) -> None:
+        """Store a complete response (written atomically), then evict down to the bounds"""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, prefix=key, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                f.write(text)
+            os.replace(tmp_path, self._path(key))
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+        self.evict()
+
+    def evict(self) -> int:
+        """Delete least recently used entries beyond ``max_entries`` / ``max_bytes``; returns how many"""
+        entries = []
+        for path in self.directory.glob('*' + SUFFIX):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        total = sum(size for _, size, _ in entries)
+        count = len(entries)
+        removed = 0
+        for _, size, path in sorted(entries, key=lambda entry: entry[0]):
+            if count <= self.max_entries and total <= self.max_bytes:
+                break
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+            total -= size
+            count -= 1
+            removed += 1
+        return removed
+
+    def summary(self) -> str:
+        return f"{self.hits} cached, {self.misses} generated"
@@ -0,0 +1,191 @@
+"""
+Capacity, overload and burndown analytics over estimated hours (NumPy)
+تحلیل ظرفیت، اضافه‌بار و نمودار burndown
+
+Every task of every roadmap is loaded once into flat arrays (hours, week,
+phase, assignee, roadmap); week numbers that restart in each phase are moved
+past the phases before it, so weeks count from the roadmap's start. Each
+aggregate is then a single ``np.bincount`` over a combined index, e.g.
+roadmap * weeks + week for the per-week load of all roadmaps at once, so
+dozens of roadmaps cost the same number of passes as one. Milestone due dates come from a per-roadmap cumulative sum of
+``duration_weeks`` rather than re-summing the earlier phases for each one.
+
+NumPy is an optional dependency: this module is only imported for
+--analytics.
+"""
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from issuegen.models import Phase
+
+DEFAULT_WEEKLY_CAPACITY = 35.0  # hours; the prompts plan ~30-35 hours a week
+UNASSIGNED = '(unassigned)'
+
+
+@dataclass
+class Overload:
+    roadmap: str
+    scope: str  # phase name or "assignee, Week N"
+    hours: float
+    capacity: float
+
+    def format(self) -> str:
+        return f"{self.roadmap}: {self.scope} has {self.hours:g}h planned for {self.capacity:g}h of capacity"
+
+
+class CapacityAnalytics:
+    """Vectorized aggregates over the tasks of one or more parsed roadmaps"""
+
+    def __init__(self, roadmaps: Dict[str, List[Phase]]):
+        """
+        Args:
+            roadmaps: Parsed phases keyed by a roadmap name (e.g. its file name)
+        """
+        self.roadmap_names = list(roadmaps)
+        phase_names: List[str] = []
+        phase_roadmap: List[int] = []
+        durations: List[int] = []
+        hours: List[float] = []
+        weeks: List[int] = []
+        task_phase: List[int] = []
+        assignees: List[str] = []
+        for roadmap_index, phases in enumerate(roadmaps.values()):
+            for phase in phases:
+                phase_index = len(phase_names)
+                phase_names.append(phase.name)
+                phase_roadmap.append(roadmap_index)
+                durations.append(phase.duration_weeks)
+                for task in phase.tasks:
+                    hours.append(task.estimated_hours or 0.0)
+                    weeks.append(task.week)
+                    task_phase.append(phase_index)
+                    assignees.append(task.assignee or UNASSIGNED)
+
+        self.phase_names = phase_names
+        self.phase_roadmap = np.asarray(phase_roadmap, dtype=np.intp)
+        self.duration_weeks = np.asarray(durations, dtype=np.int64)
+        self.hours = np.asarray(hours, dtype=np.float64)
+        self.task_phase = np.asarray(task_phase, dtype=np.intp)
+        self.task_roadmap = self.phase_roadmap[self.task_phase] if len(task_phase) else np.zeros(0, dtype=np.intp)
+        week_array = np.asarray(weeks, dtype=np.intp)
+        # Weeks are 1-based in every source; clamp stray zeros/negatives into week 1
+        self.task_week = np.maximum(week_array, 1) - 1
+        self.task_week += self._phase_week_offsets()[self.task_phase] if len(task_phase) else 0
+        self.assignee_names, self.task_assignee = np.unique(np.asarray(assignees, dtype=object),
+                                                             return_inverse=True)
+        self.weeks = int(self.task_week.max()) + 1 if len(self.task_week) else 0
+
+    def _phase_week_offsets(self) -> np.ndarray:
+        """
+        Weeks to add to each phase's week numbers to place them in its roadmap
+
+        The prompts restart at Week 1 in every phase, so a phase's weeks start
+        after the ``duration_weeks`` of the phases before it. A phase whose
+        weeks already start at or after that point is numbered roadmap-wide
+        and is left as it is.
+        """
+        starts = self.milestone_offsets() - self.duration_weeks
+        first_week = np.full(len(starts), np.iinfo(np.intp).max, dtype=np.intp)
+        np.minimum.at(first_week, self.task_phase, self.task_week)
+        return np.where(first_week < starts, starts, 0)
+
+    @property
+    def roadmaps(self) -> int:
+        return len(self.roadmap_names)
+
+    def phase_load(self) -> np.ndarray:
+        """Planned hours per phase (in ``phase_names`` order)"""
+        return np.bincount(self.task_phase, weights=self.hours, minlength=len(self.phase_names))
+
+    def week_load(self) -> np.ndarray:
+        """Planned hours per (roadmap, week) as a roadmaps x weeks matrix"""
+        index = self.task_roadmap * self.weeks + self.task_week
+        return np.bincount(index, weights=self.hours,
+                           minlength=self.roadmaps * self.weeks).reshape(self.roadmaps, self.weeks)
+
+    def assignee_load(self) -> Dict[str, float]:
+        """Planned hours per assignee across every roadmap"""
+        totals = np.bincount(self.task_assignee, weights=self.hours, minlength=len(self.assignee_names))
+        return {name: float(total) for name, total in zip(self.assignee_names, totals)}
+
+    def assignee_week_load(self) -> np.ndarray:
+        """Planned hours per (roadmap, assignee, week)"""
+        assignees = len(self.assignee_names)
+        index = (self.task_roadmap * assignees + self.task_assignee) * self.weeks + self.task_week
+        size = self.roadmaps * assignees * self.weeks
+        return np.bincount(index, weights=self.hours, minlength=size).reshape(self.roadmaps, assignees, self.weeks)
+
+    def overloads(self, weekly_capacity: float = DEFAULT_WEEKLY_CAPACITY) -> List[Overload]:
+        """Phases planned beyond ``duration_weeks * weekly_capacity``, and assignee-weeks beyond one week of capacity"""
+        found: List[Overload] = []
+        phase_capacity = self.duration_weeks * weekly_capacity
+        phase_load = self.phase_load()
+        for index in np.flatnonzero(phase_load > phase_capacity):
+            found.append(Overload(self.roadmap_names[self.phase_roadmap[index]], self.phase_names[index],
+                                  float(phase_load[index]), float(phase_capacity[index])))
+        load = self.assignee_week_load()
+        for roadmap, assignee, week in zip(*np.nonzero(load > weekly_capacity)):
+            found.append(Overload(self.roadmap_names[roadmap], f"{self.assignee_names[assignee]}, Week {week + 1}",
+                                  float(load[roadmap, assignee, week]), weekly_capacity))
+        return found
+
+    def burndown(self, weekly_capacity: float = DEFAULT_WEEKLY_CAPACITY) -> Dict[str, np.ndarray]:
+        """
+        Remaining hours at the end of each week, per roadmap
+
+        ``planned`` follows the weeks the tasks are scheduled in; ``projected``
+        burns ``weekly_capacity`` hours a week from the same total, so the week
+        where it reaches zero is the realistic finish. Both are roadmaps x weeks.
+        """
+        load = self.week_load()
+        totals = load.sum(axis=1, keepdims=True)
+        planned = totals - np.cumsum(load, axis=1)
+        burned = weekly_capacity * np.arange(1, self.weeks + 1)
+        projected = np.maximum(totals - burned, 0.0)
+        finish_weeks = np.ceil(totals[:, 0] / weekly_capacity).astype(np.int64) if weekly_capacity > 0 else None
+        return {'planned': planned, 'projected': projected, 'totals': totals[:, 0], 'finish_weeks': finish_weeks}
+
+    def milestone_offsets(self) -> np.ndarray:
+        """Weeks from the start of its roadmap to each phase's due date"""
+        offsets = np.cumsum(self.duration_weeks)
+        if not len(offsets):
+            return offsets
+        # Restart the running total at the first phase of each roadmap
+        first = np.flatnonzero(np.r_[True, self.phase_roadmap[1:] != self.phase_roadmap[:-1]])
+        before = offsets[first] - self.duration_weeks[first]
+        return offsets - np.repeat(before, np.diff(np.r_[first, len(offsets)]))
+
+    def milestone_due_dates(self, base_date: Optional[datetime] = None) -> List[datetime]:
+        """Due date of each phase's milestone, as ``create_milestones`` computes it"""
+        base_date = base_date or datetime.now()
+        return [base_date + timedelta(weeks=int(weeks)) for weeks in self.milestone_offsets()]
+
+    def format(self, weekly_capacity: float = DEFAULT_WEEKLY_CAPACITY, base_date: Optional[datetime] = None) -> str:
+        lines = [f"📊 Capacity analytics ({weekly_capacity:g}h per assignee-week):"]
+        phase_load = self.phase_load()
+        due_dates = self.milestone_due_dates(base_date)
+        burndown = self.burndown(weekly_capacity)
+        planned_weeks = np.count_nonzero(self.week_load(), axis=1)
+        for roadmap_index, roadmap in enumerate(self.roadmap_names):
+            if self.roadmaps > 1:
+                lines.append(f"\n  {roadmap}")
+            for phase_index in np.flatnonzero(self.phase_roadmap == roadmap_index):
+                lines.append(f"  {self.phase_names[phase_index]}: {phase_load[phase_index]:g}h over "
+                             f"{self.duration_weeks[phase_index]} weeks, due {due_dates[phase_index]:%Y-%m-%d}")
+            line = (f"  🔥 Burndown: {burndown['totals'][roadmap_index]:g}h over "
+                    f"{planned_weeks[roadmap_index]} planned weeks")
+            if burndown['finish_weeks'] is not None:
+                line += f"; at {weekly_capacity:g}h/week done after {burndown['finish_weeks'][roadmap_index]} weeks"
+            lines.append(line)
+        if len(self.assignee_names):
+            lines.append("  👤 Load per assignee: " + ", ".join(f"{name} {hours:g}h"
+                                                              for name, hours in self.assignee_load().items()))
+        overloads = self.overloads(weekly_capacity)
+        lines.extend(f"⚠️ {overload.format()}" for overload in overloads)
+        if not overloads:
+            lines.append("✅ No phase or assignee-week is over capacity")
+        return "\n".join(lines)
@@ -0,0 +1,195 @@
+"""
+GitHub App authentication with cached installation tokens
+احراز هویت با GitHub App و کش توکن نصب
+
+A personal access token shares one 5000 requests/hour core budget with
+everything else its user runs; a GitHub App installation has its own budget,
+which grows with the organization's repositories and users. Authenticating
+as an installation takes two steps: a JWT signed with the app's private key
+(RS256, valid for at most ten minutes) is exchanged at
+``POST /app/installations/{id}/access_tokens`` for an installation token
+that is valid for an hour.
+
+``InstallationTokenAuth`` is a PyGithub ``Auth`` that returns the current
+installation token from memory. A new one is minted only when less than
+``REFRESH_MARGIN`` seconds of validity are left, so requests do not wait on
+minting except about once an hour. Tokens and installation ids are cached on
+disk (one file per app, mode 0600, next to the state cache), so consecutive
+runs and daemon restarts reuse them instead of minting one per process.
+
+JWT signing uses PyJWT with the cryptography backend, both dependencies of
+PyGithub.
+"""
+
+import json
+import os
+import tempfile
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import requests
+from github import Auth
+
+from issuegen.importer import DEFAULT_API_URL
+from issuegen.state import default_state_dir
+
+JWT_LIFETIME = 540  # seconds; GitHub rejects app JWTs valid for more than 10 minutes
+JWT_CLOCK_SKEW = 60  # backdate iat so a slightly fast local clock is not rejected
+REFRESH_MARGIN = 300  # mint a new installation token once less than this is left
+REQUEST_TIMEOUT = 30
+
+
+class AppAuthError(ValueError):
+    """The app credentials could not be turned into an installation token"""
+
+
+def load_private_key(path: str) -> str:
+    try:
+        return Path(path).expanduser().read_text(encoding='ascii')
+    except (OSError, UnicodeDecodeError) as e:
+        raise AppAuthError(f"Cannot read GitHub App private key {path}: {e}")
+
+
+def _parse_expiry(value: str) -> float:
+    return datetime.fromisoformat(value.replace('Z', '+00:00')).timestamp()
+
+
+class GitHubApp:
+    """An app's credentials plus its on-disk cache of installation ids and tokens"""
+
+    def __init__(self, app_id: str, private_key: str, api_url: str = DEFAULT_API_URL,
+                 cache_dir: Optional[str] = None):
+        """
+        Args:
+            app_id: The app's numeric id (or its client id)
+            private_key: PEM private key generated in the app settings
+            api_url: REST API root
+            cache_dir: Directory of the token cache (default: next to the state cache)
+        """
+        self.app_id = str(app_id)
+        self.private_key = private_key
+        self.api_url = api_url.rstrip('/')
+        directory = Path(cache_dir) if cache_dir else default_state_dir()
+        self.cache_path = directory / f"app-{self.app_id}.json"
+        self._lock = threading.Lock()
+
+    def jwt(self) -> str:
+        """A freshly signed app JWT (only needed to look up installations and mint tokens)"""
+        import jwt
+
+        now = int(time.time())
+        payload = {'iat': now - JWT_CLOCK_SKEW, 'exp': now + JWT_LIFETIME, 'iss': self.app_id}
+        try:
+            return jwt.encode(payload, self.private_key, algorithm='RS256')
+        except (ValueError, TypeError, jwt.PyJWTError) as e:
+            raise AppAuthError(f"Cannot sign a JWT with the GitHub App private key: {e}")
+
+    def _app_request(self, method: str, path: str) -> Dict[str, Any]:
+        headers = {
+            'Authorization': f'Bearer {self.jwt()}',
+            'Accept': 'application/vnd.github+json',
+            'User-Agent': 'issuegen',
+        }
+        try:
+            response = requests.request(method, self.api_url + path, headers=headers, timeout=REQUEST_TIMEOUT)
+        except requests.RequestException as e:
+            raise AppAuthError(f"GitHub App request {method} {path} failed: {e}")
+        if response.status_code >= 400:
+            message = response.json().get('message', response.text) if response.content else response.reason
+            raise AppAuthError(f"GitHub App request {method} {path} failed ({response.status_code}): {message}")
+        return response.json()
+
+    def _load_cache(self) -> Dict[str, Any]:
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            print(f"⚠️ Ignoring unreadable token cache {self.cache_path}: {e}")
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    def _update_cache(self, section: str, key: str, value: Any) -> None:
+        """Merge one entry into the cache file, written atomically and readable by the owner only"""
+        data = self._load_cache()
+        data.setdefault(section, {})[key] = value
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        # mkstemp creates the file with mode 0600
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_path.parent, prefix=self.cache_path.name, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(data, f)
+            os.replace(tmp_path, self.cache_path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    def installation_id(self, repo: str) -> str:
+        """The id of the app's installation on ``owner/name``, cached after the first lookup"""
+        with self._lock:
+            cached = self._load_cache().get('installations', {}).get(repo)
+            if cached:
+                return str(cached)
+            installation = self._app_request('GET', f'/repos/{repo}/installation')
+            installation_id = str(installation['id'])
+            self._update_cache('installations', repo, installation_id)
+            return installation_id
+
+    def installation_token(self, installation_id: str, min_validity: float = REFRESH_MARGIN) -> Dict[str, Any]:
+        """
+        ``{'token', 'expires_at'}`` valid for at least ``min_validity`` seconds
+
+        Taken from the disk cache when another run already minted one.
+        """
+        with self._lock:
+            cached = self._load_cache().get('tokens', {}).get(installation_id)
+            if cached and cached.get('expires_at', 0) - time.time() > min_validity:
+                return cached
+            result = self._app_request('POST', f'/app/installations/{installation_id}/access_tokens')
+            token = {'token': result['token'], 'expires_at': _parse_expiry(result['expires_at'])}
+            self._update_cache('tokens', installation_id, token)
+            return token
+
+    def installation_auth(self, repo: str, installation_id: Optional[str] = None) -> 'InstallationTokenAuth':
+        """PyGithub auth for ``owner/name`` (the installation is looked up unless given)"""
+        return InstallationTokenAuth(self, str(installation_id) if installation_id else self.installation_id(repo))
+
+
+class InstallationTokenAuth(Auth.Auth):
+    """PyGithub auth that serves a cached installation token and refreshes it shortly before expiry"""
+
+    def __init__(self, app: GitHubApp, installation_id: str, refresh_margin: float = REFRESH_MARGIN):
+        self.app = app
+        self.installation_id = installation_id
+        self.refresh_margin = refresh_margin
+        self._token: Optional[str] = None
+        self._expires_at = 0.0
+        self._lock = threading.Lock()
+        # Fail on bad credentials now rather than on the first API call
+        self._refresh()
+
+    def _refresh(self) -> None:
+        cached = self.app.installation_token(self.installation_id, self.refresh_margin)
+        self._token = cached['token']
+        self._expires_at = cached['expires_at']
+
+    @property
+    def expires_at(self) -> float:
+        return self._expires_at
+
+    @property
+    def token_type(self) -> str:
+        return 'token'
+
+    @property
+    def token(self) -> str:
+        # Read on every request: a clock comparison unless the token is about to expire
+        if self._expires_at - time.time() <= self.refresh_margin:
+            with self._lock:
+                if self._expires_at - time.time() <= self.refresh_margin:
+                    self._refresh()
+        return self._token
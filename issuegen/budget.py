@@ -0,0 +1,145 @@
+"""
+Deadline, API-call and rate-limit budgets for issue creation runs
+محدودیت زمان و تعداد درخواست برای اجراهای زمان‌بندی‌شده
+
+The engine charges every request it sends to ``RunBudget.charge`` and asks
+``RunBudget.admit`` before starting each task, passing an upper-bound
+estimate of the task's requests. Requests outside any task (labels,
+milestones, listings page by page) go through ``RunBudget.spend``, which
+admits them before they are sent. Once a budget would be exceeded no new
+task is admitted, but tasks already admitted (and their sub-issues) are
+allowed to finish. The import backend sends its tasks' requests later, in
+batches; those are drawn from the tasks' reservations with ``RunBudget.draw``
+and refused once the deadline has passed. Created issues are recorded in the state cache as they happen, so
+rerunning the same command resumes where the run stopped.
+"""
+
+import re
+import threading
+import time
+from datetime import datetime
+from typing import Optional, Tuple
+
+from issuegen.models import Task
+
+_DURATION_RE = re.compile(r'^(\d+(?:\.\d+)?)\s*([smh]?)$', re.IGNORECASE)
+_UNIT_SECONDS = {'': 1, 's': 1, 'm': 60, 'h': 3600}
+
+
+def parse_deadline(value: str) -> float:
+    """A duration from now (``90``, ``45m``, ``2h``) or an ISO date-time, as an epoch timestamp"""
+    match = _DURATION_RE.match(value.strip())
+    if match:
+        return time.time() + float(match.group(1)) * _UNIT_SECONDS[match.group(2).lower()]
+    try:
+        return datetime.fromisoformat(value.strip()).timestamp()
+    except ValueError:
+        raise ValueError(f"Invalid deadline '{value}': use seconds, 30m, 2h or an ISO date-time")
+
+
+class BudgetExhausted(RuntimeError):
+    """A request outside any task was refused by the run budget"""
+
+
+def estimate_task_calls(task: Task, source=None, create_retries: int = 0) -> Tuple[int, int]:
+    """
+    Upper bound on (all requests, core requests) needed for one task
+
+    Assumes every duplicate search misses and every create goes as badly as
+    it can: each of its ``create_retries`` retries follows an ambiguous
+    failure and a one-request recovery lookup, and the whole sequence runs
+    twice when the assignee is rejected. Search requests have their own rate
+    limit and so only count towards the first number.
+    """
+    per_issue = 2 * (1 + 2 * create_retries)
+    if task.subtasks:
+        # search + create main, search + create per sub-issue, one edit linking them
+        issues = 1 + len(task.subtasks)
+        return issues + per_issue * issues + 1, per_issue * issues + 1
+    issues = len(source.expand_task(task)) if source is not None else 1
+    if issues == 1:
+        return 1 + per_issue, per_issue
+    # search the original, then search + create each split sub-issue
+    return 1 + issues + per_issue * issues, per_issue * issues
+
+
+class RunBudget:
+    """Central admission control shared by the sequential engine and the pipeline"""
+
+    def __init__(self, deadline: Optional[float] = None, max_api_calls: Optional[int] = None,
+                 reserve_rate_limit: Optional[int] = None, github=None):
+        """
+        Args:
+            deadline: Epoch time after which no new task is started
+            max_api_calls: Requests this run may send in total
+            reserve_rate_limit: Core requests to leave for other tools sharing the token
+            github: PyGithub client whose last response headers give the remaining rate limit
+        """
+        self.deadline = deadline
+        self.max_api_calls = max_api_calls
+        self.reserve_rate_limit = reserve_rate_limit
+        self.github = github
+        self.calls = 0
+        self._reserved = 0
+        self._reserved_core = 0
+        self.stop_reason: Optional[str] = None
+        self._lock = threading.Lock()
+
+    def charge(self, count: int = 1) -> None:
+        with self._lock:
+            self.calls += count
+
+    def _core_remaining(self) -> Optional[int]:
+        if self.github is None:
+            return None
+        try:
+            remaining, _ = self.github.rate_limiting
+        except Exception:
+            return None
+        return remaining if remaining >= 0 else None
+
+    def admit(self, calls: int, core_calls: int) -> bool:
+        """Reserve room for a task, or record why no more work can start"""
+        with self._lock:
+            if self.stop_reason is not None:
+                return False
+            if self.deadline is not None and time.time() >= self.deadline:
+                self.stop_reason = "Deadline reached"
+            elif self.max_api_calls is not None and self.calls + self._reserved + calls > self.max_api_calls:
+                self.stop_reason = f"API call budget of {self.max_api_calls} reached ({self.calls} used)"
+            elif self.reserve_rate_limit is not None:
+                remaining = self._core_remaining()
+                if remaining is not None and remaining - self._reserved_core - core_calls < self.reserve_rate_limit:
+                    self.stop_reason = (f"Rate limit reserve of {self.reserve_rate_limit} reached "
+                                        f"({remaining} core requests left)")
+            if self.stop_reason is not None:
+                return False
+            self._reserved += calls
+            self._reserved_core += core_calls
+            return True
+
+    def spend(self, calls: int = 1, core_calls: Optional[int] = None) -> None:
+        """Admit and charge requests about to be sent outside any task; raises BudgetExhausted if refused"""
+        core_calls = calls if core_calls is None else core_calls
+        if not self.admit(calls, core_calls):
+            raise BudgetExhausted(self.stop_reason)
+        with self._lock:
+            self._reserved -= calls
+            self._reserved_core -= core_calls
+            self.calls += calls
+
+    def draw(self, calls: int, core_calls: int) -> None:
+        """Turn reserved room into requests about to be sent; raises BudgetExhausted past the deadline"""
+        with self._lock:
+            if self.deadline is not None and time.time() >= self.deadline:
+                self.stop_reason = self.stop_reason or "Deadline reached"
+                raise BudgetExhausted("Deadline reached")
+            self._reserved -= calls
+            self._reserved_core -= core_calls
+            self.calls += calls
+
+    def release(self, calls: int, core_calls: int) -> None:
+        """A task admitted with this estimate has finished (its real requests are already charged)"""
+        with self._lock:
+            self._reserved -= calls
+            self._reserved_core -= core_calls
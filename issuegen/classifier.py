@@ -0,0 +1,132 @@
+"""
+Keyword classifier for roadmap task titles
+دسته‌بندی و اولویت‌بندی تسک‌ها بر اساس کلمات کلیدی
+"""
+
+import re
+from functools import reduce
+from operator import or_
+from typing import Iterable, List, Pattern, Sequence, Tuple
+
+# Ordered (label, keywords) tiers: the first tier with a keyword inside the title wins
+KeywordTiers = Sequence[Tuple[str, Sequence[str]]]
+
+PRIORITY_KEYWORDS: KeywordTiers = (
+    ('high', ('critical', 'urgent', 'security', 'auth')),
+    ('medium', ('optimization', 'performance', 'advanced')),
+    ('low', ('documentation', 'comment', 'polish')),
+)
+
+YAML_PRIORITY_KEYWORDS: KeywordTiers = (
+    ('high', ('critical', 'urgent', 'security', 'auth', 'authentication')),
+    ('medium', ('optimization', 'performance', 'advanced', 'integration')),
+    ('low', ('documentation', 'comment', 'polish', 'cleanup')),
+)
+
+CATEGORY_KEYWORDS: KeywordTiers = (
+    ('testing', ('test', 'unit', 'integration', 'coverage')),
+    ('ui-ux', ('ui', 'screen', 'widget', 'design')),
+    ('api', ('api', 'endpoint', 'route')),
+    ('database', ('database', 'migration', 'model', 'schema')),
+    ('authentication', ('auth', 'login', 'token', 'jwt')),
+    ('ai-integration', ('ai', 'openai', 'suggestion', 'intelligent')),
+    ('devops', ('docker', 'deploy', 'ci/cd', 'pipeline')),
+    ('integration', ('github', 'obsidian', 'external', 'integration')),
+)
+
+# Token masks are memoized per distinct token; clear the table past this size
+_MAX_CACHED_TOKENS = 1 << 20
+
+
+def _compile_tiers(tiers: KeywordTiers) -> List[Pattern]:
+    return [
+        re.compile('|'.join(re.escape(word) for word in sorted(words, key=len, reverse=True)))
+        for _, words in tiers
+    ]
+
+
+class _TokenMasks(dict):
+    """token -> bit of its best priority tier | bit of its best category tier"""
+
+    def __init__(self, priority_tiers: KeywordTiers, category_tiers: KeywordTiers):
+        super().__init__()
+        self._priority_patterns = _compile_tiers(priority_tiers)
+        self._category_patterns = _compile_tiers(category_tiers)
+        self._category_shift = len(priority_tiers)
+
+    def __missing__(self, token: str) -> int:
+        if len(self) >= _MAX_CACHED_TOKENS:
+            self.clear()
+        mask = 0
+        for rank, pattern in enumerate(self._priority_patterns):
+            if pattern.search(token):
+                mask |= 1 << rank
+                break
+        for rank, pattern in enumerate(self._category_patterns):
+            if pattern.search(token):
+                mask |= 1 << (self._category_shift + rank)
+                break
+        self[token] = mask
+        return mask
+
+
+class _MaskLabels(dict):
+    """OR-ed title mask -> (priority, category): the lowest set bit of each half wins"""
+
+    def __init__(self, priority_labels: List[str], category_labels: List[str]):
+        super().__init__()
+        self._priority_labels = priority_labels
+        self._category_labels = category_labels
+        self._category_shift = len(priority_labels) - 1
+
+    def __missing__(self, mask: int) -> Tuple[str, str]:
+        priority_mask = mask & ((1 << self._category_shift) - 1)
+        category_mask = mask >> self._category_shift
+        labels = (
+            self._priority_labels[(priority_mask & -priority_mask).bit_length() - 1],
+            self._category_labels[(category_mask & -category_mask).bit_length() - 1],
+        )
+        self[mask] = labels
+        return labels
+
+
+class KeywordClassifier:
+    """
+    Classify task titles into (priority, category) in a single pass
+
+    Keywords never contain whitespace, so every keyword occurrence lies inside
+    one whitespace-delimited token. Each distinct token is matched against the
+    compiled tier patterns once and cached as a bit mask; a title is then
+    classified by OR-ing its token masks and looking the result up.
+    """
+
+    def __init__(self, priority_tiers: KeywordTiers = PRIORITY_KEYWORDS,
+                 category_tiers: KeywordTiers = CATEGORY_KEYWORDS,
+                 default_priority: str = 'medium', default_category: str = 'development'):
+        for _, words in list(priority_tiers) + list(category_tiers):
+            if any(not word or any(ch.isspace() for ch in word) for word in words):
+                raise ValueError("Keywords must be non-empty and contain no whitespace")
+        self._token_masks = _TokenMasks(priority_tiers, category_tiers)
+        # Index -1 (no bit set) falls through to the defaults
+        self._labels = _MaskLabels(
+            [label for label, _ in priority_tiers] + [default_priority],
+            [label for label, _ in category_tiers] + [default_category],
+        )
+
+    def classify(self, title: str) -> Tuple[str, str]:
+        """Return (priority, category) for a single title"""
+        return self._labels[reduce(or_, map(self._token_masks.__getitem__, title.lower().split()), 0)]
+
+    def priority(self, title: str) -> str:
+        """Return only the priority label for a title"""
+        return self.classify(title)[0]
+
+    def category(self, title: str) -> str:
+        """Return only the category label for a title"""
+        return self.classify(title)[1]
+
+    def classify_many(self, titles: Iterable[str]) -> List[Tuple[str, str]]:
+        """Return (priority, category) for every title in one pass over the batch"""
+        token_mask = self._token_masks.__getitem__
+        labels = self._labels
+        return [labels[reduce(or_, map(token_mask, title.lower().split()), 0)] for title in titles]
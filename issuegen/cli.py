@@ -0,0 +1,685 @@
+"""
+Command-line front end shared by the generator scripts
+"""
+
+import argparse
+import itertools
+import os
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+from typing import List, Optional
+
+from issuegen.budget import BudgetExhausted, RunBudget, parse_deadline
+from issuegen.defaults import (DEFAULT_AI_MODEL, DEFAULT_AI_URL, DEFAULT_API_URL, DEFAULT_BATCH_SIZE,
+                               DEFAULT_CONCURRENCY, DEFAULT_MAX_BYTES, DEFAULT_MAX_ENTRIES, DEFAULT_QUEUE_SIZE)
+from issuegen.models import Phase, has_estimates
+from issuegen.planner import DEFAULT_REQUEST_LATENCY, plan_run
+from issuegen.profiling import StageProfiler, profile_stage
+from issuegen.prune import DEFAULT_PRUNE_LABEL, DEFAULT_PRUNE_WORKERS, PRUNE_ACTIONS, roadmap_signatures
+from issuegen.render import CONVENTIONS_PATH
+from issuegen.report import REPORT_FORMATS, make_report_writer, report_format_for
+from issuegen.sources import get_source
+from issuegen.state import RepoStateCache
+
+# PyGithub (via issuegen.engine) is imported only once a run needs the network,
+# so --parse-only and --dry-run start fast and work offline. The same goes for
+# the pipeline (asyncio), --generate, the import backend and the AI cache.
+
+# Options whose value is a credential; never echoed into reports
+SECRET_OPTIONS = ('--token', '--ai-key')
+
+
+def build_parser(default_source: str, description: str) -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument('--token', default=os.environ.get('GITHUB_TOKEN'),
+                        help='GitHub personal access token (default: $GITHUB_TOKEN; not needed for --dry-run)')
+    parser.add_argument('--app-id', default=os.environ.get('GITHUB_APP_ID'),
+                        help='Authenticate as this GitHub App\'s installation instead of --token, for the '
+                             'installation\'s own rate limit (default: $GITHUB_APP_ID)')
+    parser.add_argument('--app-private-key', default=os.environ.get('GITHUB_APP_PRIVATE_KEY'), metavar='PEM',
+                        help='Private key file of the GitHub App (default: $GITHUB_APP_PRIVATE_KEY)')
+    parser.add_argument('--app-installation-id',
+                        help='Installation to authenticate as (default: looked up from --repo and cached)')
+    parser.add_argument('--repo', help='Repository in format owner/repo-name (not needed for --dry-run)')
+    parser.add_argument('--file', help='Path to roadmap file')
+    parser.add_argument('--source', default=default_source,
+                        help=f'Roadmap format of --file: markdown, markdown-keywords, yaml, json '
+                             f'or an installed plugin (default: {default_source})')
+    parser.add_argument('--parse-workers', type=int, default=1,
+                        help='Processes for parsing large Markdown roadmaps (0 = one per CPU, default: 1)')
+    parser.add_argument('--output', help='Output file for summary report (written while issues are created)')
+    parser.add_argument('--report-format', choices=REPORT_FORMATS,
+                        help='Report format (default: from the --output extension, .json/.csv, else markdown)')
+    parser.add_argument('--dry-run', action='store_true', help='Parse only, do not create issues')
+    parser.add_argument('--parse-only', action='store_true',
+                        help='Parse (and optionally --save-parsed) without listing tasks or touching GitHub')
+    parser.add_argument('--save-parsed', metavar='PATH', help='Save parsed phases to this JSON file without prompting')
+    parser.add_argument('--from-parsed', help='Load parsed phases from JSON file instead of parsing the roadmap')
+    parser.add_argument('--no-legacy-signatures', action='store_true',
+                        help='Do not treat issues carrying the old MD5 signature marker as duplicates')
+    parser.add_argument('--max-tasks', type=int, help='Create at most this many tasks without prompting')
+    parser.add_argument('--state-dir', help='Directory of the per-repository state cache (default: ~/.cache/issuegen)')
+    parser.add_argument('--no-state', action='store_true', help='Neither read nor write the state cache')
+    parser.add_argument('--refresh-state', action='store_true',
+                        help='List every issue once to rebuild the signature cache before creating')
+    parser.add_argument('--trust-state', action='store_true',
+                        help='Skip duplicate searches for signatures missing from a fully refreshed cache')
+    parser.add_argument('--request-latency', type=float, default=DEFAULT_REQUEST_LATENCY,
+                        help=f'Seconds per request assumed by the --dry-run plan (default: {DEFAULT_REQUEST_LATENCY})')
+    parser.add_argument('--rate-limit-remaining', type=int,
+                        help='Core requests left this hour for the --dry-run plan (default: cached value or 5000)')
+    parser.add_argument('--pipeline', action='store_true',
+                        help='Stream parse, duplicate checks and issue creation as overlapping stages '
+                             '(no task-count prompt; use --max-tasks)')
+    parser.add_argument('--sync', action='store_true',
+                        help='Pull open/closed state of issues updated since the last sync and mark tasks '
+                             'done in --file (- [x] in Markdown, status: in YAML)')
+    parser.add_argument('--export-vault', metavar='DIR',
+                        help='Write one Obsidian/Markdown note per signed issue into DIR, fetching only issues '
+                             'updated since the last export and rewriting only notes whose content changed')
+    parser.add_argument('--vault-rescan', action='store_true',
+                        help='With --export-vault: list every issue instead of those updated since the last export '
+                             '(restores deleted notes)')
+    parser.add_argument('--prune', choices=PRUNE_ACTIONS,
+                        help='Close, lock or relabel open issues whose task is no longer in the roadmap '
+                             '(with --dry-run: only list them)')
+    parser.add_argument('--prune-label', default=DEFAULT_PRUNE_LABEL,
+                        help=f'Label used by --prune relabel (default: {DEFAULT_PRUNE_LABEL})')
+    parser.add_argument('--prune-workers', type=int, default=DEFAULT_PRUNE_WORKERS,
+                        help=f'Concurrent edits for --prune (default: {DEFAULT_PRUNE_WORKERS})')
+    parser.add_argument('--similarity-threshold', type=float,
+                        help='Also treat tasks whose title is this similar (0-1, e.g. 0.7) to an existing '
+                             'issue title as near duplicates')
+    parser.add_argument('--similarity-action', choices=('flag', 'skip'), default='flag',
+                        help='flag: create near duplicates with a possible-duplicate label; skip: do not create them')
+    parser.add_argument('--queue-size', type=int, default=DEFAULT_QUEUE_SIZE,
+                        help=f'Items buffered between --pipeline stages (default: {DEFAULT_QUEUE_SIZE})')
+    parser.add_argument('--deadline', type=_deadline_arg,
+                        help='Start no new task after this time: seconds, 30m, 2h or an ISO date-time; '
+                             'rerun the same command later to resume')
+    parser.add_argument('--max-api-calls', type=int, help='Start no new task once this many requests could be exceeded')
+    parser.add_argument('--reserve-rate-limit', type=int,
+                        help='Start no new task once fewer than this many core requests would be left this hour')
+    parser.add_argument('--analytics', action='store_true',
+                        help='Print per-phase and per-assignee load, overloads, burndown and milestone due dates '
+                             '(needs NumPy)')
+    parser.add_argument('--weekly-capacity', type=float, default=35.0,
+                        help='Hours one assignee can work per week, for --analytics (default: 35)')
+    parser.add_argument('--profile', metavar='REPORT',
+                        help='Write per-stage timings (parse, render, dedup, create, ...) to this Markdown file')
+    parser.add_argument('--profile-cprofile', action='store_true',
+                        help='With --profile: also run under cProfile (top functions in the report, raw stats in REPORT.prof)')
+    parser.add_argument('--profile-tracemalloc', type=int, default=0, metavar='N',
+                        help='With --profile: report the N largest allocation sites and peak traced memory')
+    parser.add_argument('--create-retries', type=int, default=3,
+                        help='Retries of an issue create that timed out or got a 5xx; each one first checks '
+                             'whether the issue was created after all (default: 3)')
+    parser.add_argument('--retry-delay', type=float, default=2.0,
+                        help='Seconds before the first of those checks, doubled for each retry (default: 2)')
+    parser.add_argument('--lean-bodies', action='store_true',
+                        help='Keep issue bodies to the task itself plus a link to one shared conventions document '
+                             f'(committed once as {CONVENTIONS_PATH} unless --conventions-url is given)')
+    parser.add_argument('--conventions-url',
+                        help='Existing conventions page (pinned issue, wiki page, ...) for lean bodies to link to; '
+                             'implies --lean-bodies')
+    parser.add_argument('--generate', metavar='BRIEF',
+                        help='Have an AI model write the roadmap from this project brief file (- for stdin) and parse '
+                             'it while it streams, instead of reading --file; with --pipeline, issues are created '
+                             'while later phases are still being written')
+    parser.add_argument('--ai-url', default=os.environ.get('OPENAI_BASE_URL', DEFAULT_AI_URL),
+                        help=f'OpenAI-compatible API root for --generate (default: $OPENAI_BASE_URL or {DEFAULT_AI_URL})')
+    parser.add_argument('--ai-key', default=os.environ.get('OPENAI_API_KEY'),
+                        help='API key for --ai-url (default: $OPENAI_API_KEY)')
+    parser.add_argument('--ai-model', default=os.environ.get('OPENAI_MODEL', DEFAULT_AI_MODEL),
+                        help=f'Model for --generate (default: $OPENAI_MODEL or {DEFAULT_AI_MODEL})')
+    parser.add_argument('--ai-prompt', help='System prompt file (default: the docs/ prompt for --source)')
+    parser.add_argument('--ai-save', metavar='PATH', help='Write the generated roadmap here as it streams')
+    parser.add_argument('--ai-phases', action='store_true',
+                        help="Generate one phase per request: per '## ' section of the brief (editing a section only "
+                             "regenerates that phase), or per line of a phase outline the model writes first")
+    parser.add_argument('--ai-concurrency', type=int, default=DEFAULT_CONCURRENCY,
+                        help=f'Phase requests of --ai-phases in flight at once (default: {DEFAULT_CONCURRENCY})')
+    parser.add_argument('--ai-cache-dir',
+                        help='Where model responses are cached by prompt, brief and model (default: ai-cache in the '
+                             'state directory)')
+    parser.add_argument('--ai-cache-size', type=float, default=DEFAULT_MAX_BYTES / 2 ** 20, metavar='MB',
+                        help=f'Evict least recently used responses beyond this size (default: {DEFAULT_MAX_BYTES // 2 ** 20})')
+    parser.add_argument('--ai-cache-entries', type=int, default=DEFAULT_MAX_ENTRIES,
+                        help=f'Evict least recently used responses beyond this count (default: {DEFAULT_MAX_ENTRIES})')
+    parser.add_argument('--no-ai-cache', action='store_true', help='Always call the model and cache nothing')
+    parser.add_argument('--backend', choices=('api', 'import'), default='api',
+                        help='api: one create request per issue; import: queue issues in batches through the '
+                             'Issue Import API (no notifications, far fewer secondary rate limits)')
+    parser.add_argument('--import-api-url', default=DEFAULT_API_URL,
+                        help=f'REST API root for --backend import (default: {DEFAULT_API_URL})')
+    parser.add_argument('--import-batch-size', type=int, default=DEFAULT_BATCH_SIZE,
+                        help=f'Imports queued between two status checks (default: {DEFAULT_BATCH_SIZE})')
+    return parser
+
+
+def _deadline_arg(value: str) -> float:
+    try:
+        return parse_deadline(value)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e))
+
+
+def _app_auth(args, repo_owner: str, repo_name: str):
+    """Installation auth for --app-id, or None to use --token"""
+    if not args.app_id:
+        return None
+    from issuegen.app_auth import GitHubApp, load_private_key
+    app = GitHubApp(args.app_id, load_private_key(args.app_private_key), cache_dir=args.state_dir)
+    auth = app.installation_auth(f"{repo_owner}/{repo_name}", args.app_installation_id)
+    print(f"🔑 Authenticated as GitHub App {args.app_id} (installation {auth.installation_id})")
+    return auth
+
+
+def _build_generator(args, repo_owner: str, repo_name: str, state: Optional[RepoStateCache]):
+    from issuegen.engine import GitHubIssueGenerator
+    auth = _app_auth(args, repo_owner, repo_name)
+    generator = GitHubIssueGenerator(args.token, repo_owner, repo_name,
+                                     legacy_signatures=not args.no_legacy_signatures,
+                                     state=state, trust_state=args.trust_state, auth=auth)
+    generator.create_retries = max(0, args.create_retries)
+    generator.retry_delay = args.retry_delay
+    if args.deadline is not None or args.max_api_calls is not None or args.reserve_rate_limit is not None:
+        generator.budget = RunBudget(args.deadline, args.max_api_calls, args.reserve_rate_limit,
+                                     github=generator.github)
+    if args.backend == 'import':
+        from issuegen.importer import IssueImporter
+        generator.importer = IssueImporter(args.token, repo_owner, repo_name, api_url=args.import_api_url,
+                                           batch_size=args.import_batch_size, auth=auth)
+    print(f"🚀 Target repository: {args.repo}")
+    if args.refresh_state and state is not None:
+        print("\n🔄 Refreshing state cache...")
+        print(f"✅ Cached {generator.refresh_state()} issue signatures")
+    if args.similarity_threshold is not None:
+        print("\n🔎 Indexing existing issue titles for near-duplicate checks...")
+        print(f"✅ Indexed {generator.build_similarity_index(args.similarity_threshold, args.similarity_action)} issues")
+    return generator
+
+
+def _conventions_url(args) -> Optional[str]:
+    """Where lean bodies link to; None for full bodies"""
+    if args.conventions_url:
+        return args.conventions_url
+    if args.lean_bodies and args.repo:
+        return f"https://github.com/{args.repo}/blob/HEAD/{CONVENTIONS_PATH}"
+    return None
+
+
+def _prepare_conventions(args, generator) -> None:
+    generator.conventions_url = _conventions_url(args)
+    if generator.conventions_url and not args.conventions_url:
+        print("\n📘 Checking the shared issue conventions document...")
+        generator.ensure_conventions_doc()
+
+
+def _generated_roadmap(args, source):
+    """--generate: the roadmap lines as the model writes them; None (after an error message) on bad input"""
+    from issuegen.generation import (GenerationError, RoadmapStream, brief_sections, build_requests, default_prompt,
+                                     fetch_completion, outline_request, parse_outline)
+
+    if not hasattr(source, 'iter_lines'):
+        print(f"❌ --generate needs a source that parses while reading (markdown or yaml), not '{source.name}'")
+        return None
+    try:
+        prompt_path = Path(args.ai_prompt) if args.ai_prompt else default_prompt(args.source)
+        brief = sys.stdin.read() if args.generate == '-' else Path(args.generate).read_text(encoding='utf-8')
+        system_prompt = prompt_path.read_text(encoding='utf-8')
+    except (OSError, GenerationError) as e:
+        print(f"❌ {e}")
+        return None
+    cache = None
+    if not args.no_ai_cache:
+        cache_dir = args.ai_cache_dir or (str(Path(args.state_dir) / 'ai-cache') if args.state_dir else None)
+        from issuegen.ai_cache import ResponseCache
+        cache = ResponseCache(cache_dir, int(args.ai_cache_size * 2 ** 20), args.ai_cache_entries)
+    outline = None
+    try:
+        if args.ai_phases and not brief_sections(brief)[1]:
+            print(f"🗂️ Asking {args.ai_model} for the phase outline...")
+            outline = parse_outline(fetch_completion(outline_request(system_prompt, brief), args.ai_url,
+                                                     args.ai_key, args.ai_model, cache))
+            for line in outline:
+                print(f"   {line}")
+        requests = build_requests(system_prompt, brief, args.source, per_phase=args.ai_phases, outline=outline)
+    except GenerationError as e:
+        print(f"❌ {e}")
+        return None
+    phases = f" in {len(requests)} per-phase requests, {args.ai_concurrency} at a time" if args.ai_phases else ""
+    print(f"🤖 Generating a {source.name} roadmap with {args.ai_model} ({args.ai_url}){phases}...")
+    return RoadmapStream(requests, args.ai_url, args.ai_key, args.ai_model, args.ai_save, cache=cache,
+                         source_name=args.source, concurrency=args.ai_concurrency)
+
+
+def _save_state(generator, state: Optional[RepoStateCache]) -> None:
+    # Keep whatever was learned, even from an interrupted run
+    if state is not None:
+        generator.snapshot_rate_limit()
+        state.save()
+
+
+def _print_analytics(args, phases: List[Phase]) -> None:
+    try:
+        from issuegen.analytics import CapacityAnalytics
+    except ImportError:
+        print("❌ --analytics needs NumPy (pip install numpy)")
+        return
+    name = Path(args.from_parsed or args.file).name
+    print()
+    print(CapacityAnalytics({name: phases}).format(args.weekly_capacity))
+
+
+def _report_budget(generator, state: Optional[RepoStateCache]) -> None:
+    budget = generator.budget
+    if budget is None:
+        return
+    print(f"📊 API requests sent: {budget.calls}")
+    if budget.stop_reason is None:
+        return
+    if state is not None:
+        print(f"⏸️ Stopped early ({budget.stop_reason}); progress is saved in {state.path}. "
+              f"Rerun the same command to resume.")
+    else:
+        print(f"⚠️ Stopped early ({budget.stop_reason}) with --no-state; "
+              f"rerunning will search GitHub again for every task.")
+
+
+def _open_report(args, generator) -> None:
+    """Attach a streaming report writer so every created issue is reported as it happens"""
+    report_format = args.report_format or report_format_for(args.output)
+    if args.output:
+        stream = open(args.output, 'w', encoding='utf-8', newline='')
+    else:
+        # Printed once the run is over rather than interleaved with progress output
+        stream = tempfile.TemporaryFile('w+', encoding='utf-8')
+    generator.report = make_report_writer(report_format, stream, generator.repo.full_name)
+
+
+def _close_report(args, generator, phases: List[Phase]) -> None:
+    writer, generator.report = generator.report, None
+    if writer is None:
+        return
+    try:
+        writer.close(phases)
+        if not args.output:
+            print("\n" + "="*50)
+            writer.stream.seek(0)
+            shutil.copyfileobj(writer.stream, sys.stdout)
+            print()
+    finally:
+        writer.stream.close()
+    if args.output:
+        print(f"📊 Report saved to: {args.output}")
+
+
+def _run_sync(args, source, repo_owner: str, repo_name: str, state: Optional[RepoStateCache]) -> None:
+    """--sync: fetch changed issue states, then rewrite the roadmap in one pass"""
+    from issuegen.sync import sync_roadmap
+
+    if state is None:
+        print("❌ --sync needs the state cache (drop --no-state)")
+        return
+    if not args.file or not Path(args.file).exists():
+        print(f"❌ File not found: {args.file}")
+        return
+
+    generator = _build_generator(args, repo_owner, repo_name, state)
+    since = state.synced_until
+    print(f"\n🔄 Fetching issues updated since {since}..." if since else "\n🔄 Fetching all issues (first sync)...")
+    try:
+        seen = generator.sync_issue_states()
+    finally:
+        _save_state(generator, state)
+    print(f"✅ {seen} signed issues updated")
+
+    changed = sync_roadmap(args.file, source, state, legacy_signatures=not args.no_legacy_signatures)
+    if changed:
+        print(f"✅ Updated {changed} tasks in {args.file}")
+    else:
+        print(f"⏭️ {args.file} is already in sync")
+
+
+def _run_vault_export(args, repo_owner: str, repo_name: str, state: Optional[RepoStateCache]) -> None:
+    """--export-vault: fetch changed issues and rewrite only the notes whose hash changed"""
+    from issuegen.vault import IssueVault
+
+    vault = IssueVault(args.export_vault, args.repo)
+    vault.load()
+    generator = _build_generator(args, repo_owner, repo_name, state)
+    since = None if args.vault_rescan else vault.exported_until
+    print(f"\n📝 Fetching issues updated since {since}..." if since else "\n📝 Fetching all issues...")
+    try:
+        seen = generator.export_vault(vault, rescan=args.vault_rescan)
+    finally:
+        _save_state(generator, state)
+    print(f"✅ {seen} signed issues: {vault.written} notes written, {vault.unchanged} unchanged in {args.export_vault}")
+
+
+def _run_prune(args, source, phases: List[Phase], repo_owner: str, repo_name: str,
+               state: Optional[RepoStateCache]) -> None:
+    """--prune: one listing, then one concurrent wave of edits for the orphaned issues"""
+    if not any(phase.tasks for phase in phases):
+        print("❌ The roadmap has no tasks; refusing to prune every issue in the repository")
+        return
+    keep = roadmap_signatures(phases, source, legacy_signatures=not args.no_legacy_signatures)
+
+    generator = _build_generator(args, repo_owner, repo_name, state)
+    print("\n🔍 Listing issues...")
+    orphans = generator.find_orphans(keep, args.prune, args.prune_label)
+    if not orphans:
+        print("✅ No orphaned issues")
+        return
+    print(f"🧹 {len(orphans)} issues have no task in the roadmap:")
+    for issue in orphans:
+        print(f"  - #{issue.number} {issue.title}")
+    if args.dry_run:
+        print(f"\n🔍 DRY RUN - No issues will be changed (--prune {args.prune})")
+        return
+
+    prune_response = input(f"Do you want to {args.prune} these {len(orphans)} issues? (y/n): ").strip().lower()
+    if prune_response != 'y':
+        print("❌ Aborting prune.")
+        return
+    try:
+        pruned = generator.prune_issues(orphans, args.prune, args.prune_label, args.prune_workers)
+    finally:
+        _save_state(generator, state)
+    print(f"\n🎉 Pruned {pruned} of {len(orphans)} orphaned issues")
+
+
+def _run_pipeline(args, source, repo_owner: str, repo_name: str, state: Optional[RepoStateCache],
+                  profiler: Optional[StageProfiler] = None) -> None:
+    """--pipeline: parse lazily and create issues while later phases are still being read"""
+    import asyncio
+
+    from issuegen.pipeline import IssuePipeline
+
+    if args.from_parsed:
+        if not Path(args.from_parsed).exists():
+            print(f"❌ File not found: {args.from_parsed}")
+            return
+        phase_iter = get_source('json')().iter_phases(args.from_parsed)
+    elif args.generate:
+        roadmap = _generated_roadmap(args, source)
+        if roadmap is None:
+            return
+        phase_iter = source.iter_lines(roadmap)
+    else:
+        if not args.file or not Path(args.file).exists():
+            print(f"❌ File not found: {args.file}")
+            return
+        phase_iter = source.iter_phases(args.file)
+
+    # Pull the first phase now: a malformed roadmap fails here, before any request.
+    # A generated roadmap is not read ahead, so its stream never waits on the prompt below.
+    if not args.generate:
+        try:
+            first_phase = next(phase_iter, None)
+        except ValueError as e:
+            print(f"❌ {e}")
+            return
+        if first_phase is None:
+            print("❌ The roadmap has no phases")
+            return
+        phase_iter = itertools.chain([first_phase], phase_iter)
+
+    limit = f"up to {args.max_tasks} tasks" if args.max_tasks is not None else "every task"
+    create_response = input(f"Do you want to create issues in GitHub for {limit}? (y/n): ").strip().lower()
+    if create_response != 'y':
+        print("❌ Aborting issue creation.")
+        return
+
+    with profile_stage(profiler, 'connect'):
+        generator = _build_generator(args, repo_owner, repo_name, state)
+        _open_report(args, generator)
+    generator.profiler = profiler
+    _prepare_conventions(args, generator)
+    pipeline = IssuePipeline(generator, source, args.max_tasks, args.queue_size)
+    try:
+        print(f"\n📝 Streaming {source.name} roadmap into labels, milestones and issues...")
+        with profile_stage(profiler, 'pipeline'):
+            created_issues = asyncio.run(pipeline.run(phase_iter))
+    finally:
+        with profile_stage(profiler, 'report'):
+            _save_state(generator, state)
+            _close_report(args, generator, pipeline.phases)
+
+    if args.save_parsed:
+        from issuegen.sources.json_cache import save_parsed_to_file
+        save_parsed_to_file(pipeline.phases, args.save_parsed)
+    if args.generate:
+        print(f"🤖 Generated {roadmap.summary()}")
+    print(f"\n🎉 Successfully created {len(created_issues)} issues!")
+    _report_budget(generator, state)
+
+
+def main(default_source: str = 'markdown', description: str = 'Generate GitHub issues from a roadmap',
+         assign_owner: bool = True):
+    """
+    Main function
+
+    Args:
+        default_source: Adapter used for --file when --source is not given
+        description: argparse description of the calling script
+        assign_owner: Assign every task to the repository owner by default
+    """
+    args = build_parser(default_source, description).parse_args()
+    if not args.profile:
+        _main(args, assign_owner, None)
+        return
+
+    profiler = StageProfiler(use_cprofile=args.profile_cprofile, tracemalloc_top=args.profile_tracemalloc)
+    profiler.start()
+    try:
+        _main(args, assign_owner, profiler)
+    finally:
+        profiler.stop()
+        profiler.write(args.profile, command=' '.join(_redacted_argv()))
+        print(f"⏱️ Profile saved to: {args.profile}")
+
+
+def _is_secret_option(arg: str) -> bool:
+    # argparse also accepts unambiguous prefixes (--tok, --ai-k)
+    return len(arg) > 2 and arg.startswith('--') and any(option.startswith(arg) for option in SECRET_OPTIONS)
+
+
+def _redacted_argv() -> List[str]:
+    """sys.argv for the profile report, without the values of SECRET_OPTIONS"""
+    argv = list(sys.argv)
+    for i, arg in enumerate(argv):
+        option, has_value, _ = arg.partition('=')
+        if has_value and _is_secret_option(option):
+            argv[i] = f'{option}=***'
+        elif not has_value and _is_secret_option(arg) and i + 1 < len(argv):
+            argv[i + 1] = '***'
+    return argv
+
+
+def _main(args, assign_owner: bool, profiler: Optional[StageProfiler]) -> None:
+    # --prune --dry-run still lists the repository, so it needs credentials
+    offline = (args.dry_run and not args.prune) or args.parse_only
+
+    repo_owner = repo_name = None
+    if args.repo:
+        try:
+            repo_owner, repo_name = args.repo.split('/')
+        except ValueError:
+            print("❌ Repository format should be: owner/repo-name")
+            return
+    elif not offline:
+        print("❌ --repo is required unless --dry-run or --parse-only is given")
+        return
+    if not offline and not args.token and not args.app_id:
+        print("❌ --token (or $GITHUB_TOKEN) is required unless --dry-run or --parse-only is given")
+        return
+    if args.app_id and not args.app_private_key:
+        print("❌ --app-id needs --app-private-key (or $GITHUB_APP_PRIVATE_KEY)")
+        return
+
+    state = None
+    if args.repo and not args.no_state:
+        state = RepoStateCache.for_repo(args.repo, args.state_dir)
+
+    # The format adapter also decides how tasks expand into issues, even for --from-parsed
+    source = get_source(args.source)(assignee=repo_owner if assign_owner else None)
+    if args.parse_workers != 1 and hasattr(source, 'parse_workers'):
+        source.parse_workers = args.parse_workers or os.cpu_count() or 1
+    if args.lean_bodies or args.conventions_url:
+        source.conventions_url = _conventions_url(args)
+        if source.conventions_url is None:
+            print("❌ --lean-bodies needs --repo (or --conventions-url) to link to the conventions document")
+            return
+        if args.from_parsed:
+            print(f"⚠️ --from-parsed keeps the bodies saved in {args.from_parsed}; only split sub-issues are lean")
+
+    try:
+        if (args.sync or args.export_vault) and not offline:
+            if args.sync:
+                _run_sync(args, source, repo_owner, repo_name, state)
+            if args.export_vault:
+                _run_vault_export(args, repo_owner, repo_name, state)
+            return
+
+        if args.pipeline and not offline:
+            if args.backend == 'import':
+                print("❌ --pipeline creates issues one by one; drop it to use --backend import")
+                return
+            _run_pipeline(args, source, repo_owner, repo_name, state, profiler)
+            return
+
+        if args.from_parsed:
+            if not Path(args.from_parsed).exists():
+                print(f"❌ File not found: {args.from_parsed}")
+                return
+            phases = get_source('json')().parse(args.from_parsed)
+            print(f"✅ Loaded parsed data from: {args.from_parsed}")
+        else:
+            roadmap = None
+            if args.generate:
+                roadmap = _generated_roadmap(args, source)
+                if roadmap is None:
+                    return
+            elif not args.file or not Path(args.file).exists():
+                print(f"❌ File not found: {args.file}")
+                return
+            print(f"📖 Parsing {source.name} roadmap...")
+            try:
+                with profile_stage(profiler, 'parse'):
+                    phases = list(source.iter_lines(roadmap)) if roadmap is not None else source.parse(args.file)
+            except ValueError as e:
+                # Schema errors are reported in full before any GitHub request
+                print(f"❌ {e}")
+                return
+            if roadmap is not None:
+                print(f"🤖 Generated {roadmap.summary()}")
+            total_tasks = sum(len(p.tasks) for p in phases)
+            if has_estimates(phases):
+                total_hours = sum(task.estimated_hours or 0 for p in phases for task in p.tasks)
+                print(f"✅ Found {len(phases)} phases with {total_tasks} tasks ({total_hours} estimated hours)")
+            else:
+                print(f"✅ Found {len(phases)} phases with {total_tasks} tasks")
+
+            if args.save_parsed:
+                from issuegen.sources.json_cache import save_parsed_to_file
+                save_parsed_to_file(phases, args.save_parsed)
+            elif not offline and not args.prune:
+                save_response = input("Do you want to save the parsed data in JSON? (y/n): ").strip().lower()
+                if save_response == 'y':
+                    from issuegen.sources.json_cache import save_parsed_to_file
+                    save_file = input("Enter filename to save (default: parsed_phases.json): ").strip() or 'parsed_phases.json'
+                    save_parsed_to_file(phases, save_file)
+
+        if args.analytics:
+            _print_analytics(args, phases)
+
+        if args.parse_only:
+            return
+
+        if args.prune:
+            _run_prune(args, source, phases, repo_owner, repo_name, state)
+            return
+
+        total_tasks = sum(len(phase.tasks) for phase in phases)
+        if args.dry_run:
+            with_hours = has_estimates(phases)
+            print("\n🔍 DRY RUN - No issues will be created")
+            for phase in phases:
+                print(f"\nPhase: {phase.name} ({phase.duration_weeks} weeks)")
+                print(f"Tasks: {len(phase.tasks)}")
+                if with_hours:
+                    print(f"Estimated Hours: {sum(task.estimated_hours or 0 for task in phase.tasks)}")
+                for task in phase.tasks[:3]:
+                    hours_info = f" ({task.estimated_hours}h)" if task.estimated_hours else ""
+                    print(f"  - {task.title}{hours_info}")
+                if len(phase.tasks) > 3:
+                    print(f"  ... and {len(phase.tasks) - 3} more tasks")
+            with profile_stage(profiler, 'plan'):
+                plan = plan_run(phases, state, source, args.max_tasks,
+                                legacy_signatures=not args.no_legacy_signatures, trust_state=args.trust_state,
+                                request_latency=args.request_latency,
+                                rate_limit_remaining=args.rate_limit_remaining,
+                                conventions_doc=bool(_conventions_url(args)) and not args.conventions_url,
+                                refresh_state=args.refresh_state and state is not None,
+                                similarity_index=args.similarity_threshold is not None,
+                                import_batch_size=args.import_batch_size if args.backend == 'import' else None)
+            print()
+            print(plan.format())
+            return
+
+        if args.max_tasks is not None:
+            max_tasks = min(max(args.max_tasks, 1), total_tasks)
+        else:
+            # Prompt for number of tasks to convert to issues
+            max_tasks = total_tasks
+            prompt = f"You have {total_tasks} tasks. How many tasks do you want to create as GitHub issues? (1-{total_tasks}, default {total_tasks}): "
+            try:
+                task_limit = input(prompt).strip()
+                max_tasks = int(task_limit) if task_limit else total_tasks
+                if max_tasks < 1 or max_tasks > total_tasks:
+                    raise ValueError
+            except ValueError:
+                print(f"❌ Invalid input. Using default: {total_tasks} tasks")
+                max_tasks = total_tasks
+
+        create_response = input("Do you want to create issues in GitHub? (y/n): ").strip().lower()
+        if create_response != 'y':
+            print("❌ Aborting issue creation.")
+            return
+
+        with profile_stage(profiler, 'connect'):
+            generator = _build_generator(args, repo_owner, repo_name, state)
+            _open_report(args, generator)
+        generator.profiler = profiler
+        try:
+            _prepare_conventions(args, generator)
+
+            print("\n🏷️  Creating labels...")
+            with profile_stage(profiler, 'labels'):
+                generator.create_labels(phases)
+
+            print("\n🎯 Creating milestones...")
+            with profile_stage(profiler, 'milestones'):
+                milestones = generator.create_milestones(phases)
+
+            print("\n📝 Creating issues...")
+            with profile_stage(profiler, 'issues'):
+                created_issues = generator.create_issues(phases, milestones, max_tasks, source=source)
+        finally:
+            with profile_stage(profiler, 'report'):
+                _save_state(generator, state)
+                _close_report(args, generator, phases)
+
+        print(f"\n🎉 Successfully created {len(created_issues)} issues!")
+        _report_budget(generator, state)
+
+    except BudgetExhausted as e:
+        # A setup request (labels, milestones, listings) was refused; whatever ran before it is saved
+        print(f"⏹️ {e}. Stopping before any further request.")
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        raise
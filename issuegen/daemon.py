@@ -0,0 +1,488 @@
+"""
+Long-running daemon that keeps one warm generator per repository
+سرویس ماندگار برای ارسال سریع نقشه راه
+
+Every CLI run pays for Python start-up, importing PyGithub, ``get_repo`` and
+the label, milestone and collaborator listings before the first issue is
+created. The daemon pays that once per repository and keeps the
+``GitHubIssueGenerator`` (and its state cache) in memory, so submitting a
+small roadmap change only costs local parsing plus the requests that change
+really needs: tasks whose signature is cached are skipped without a search.
+
+The API is plain HTTP/1.1 with JSON bodies, served on a Unix socket (created
+with mode 0600, in the state directory by default) or, with --tcp, on a
+loopback port:
+
+* ``GET /status``  - warm repositories and uptime
+* ``POST /warm``   - ``{"repo": "owner/name"}``: list everything up front
+* ``POST /submit`` - ``{"repo": ..., "content": ... | "file": ..., "source":
+  "markdown", "max_tasks": N}``: create the roadmap's missing issues
+
+Whoever can talk to the daemon creates issues with its token. Over TCP every
+request must therefore carry the shared secret in ``X-Issuegen-Secret``
+(generated into ``daemon-secret`` in the state directory unless given) and a
+loopback ``Host``, which keeps out other users' processes and browser pages
+(CSRF, DNS rebinding); POST bodies must be ``application/json``. ``file`` is
+only accepted with --file-root, for paths inside it.
+
+Submissions to the same repository run one at a time; different
+repositories are served concurrently.
+
+Usage:
+    python -m issuegen.daemon serve --token TOKEN
+    python -m issuegen.daemon submit --repo owner/repo --file roadmap.md
+"""
+
+import argparse
+import hmac
+import http.client
+import io
+import json
+import os
+import secrets
+import socket
+import socketserver
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from issuegen.models import Phase
+from issuegen.sources import get_source
+from issuegen.state import RepoStateCache, default_state_dir
+
+DEFAULT_PORT = 8765
+SOCKET_NAME = 'daemon.sock'
+SECRET_NAME = 'daemon-secret'
+SECRET_HEADER = 'X-Issuegen-Secret'
+LOOPBACK_HOSTS = ('127.0.0.1', 'localhost', '[::1]')
+# Roadmaps are a few hundred KiB at most; refuse anything far larger
+MAX_BODY_BYTES = 64 * 1024 * 1024
+
+
+class SubmissionError(ValueError):
+    """A submission the daemon cannot act on (answered with HTTP 400)"""
+
+
+def default_socket_path(state_dir: Optional[str] = None) -> str:
+    return str((Path(state_dir) if state_dir else default_state_dir()) / SOCKET_NAME)
+
+
+def secret_path(state_dir: Optional[str] = None) -> Path:
+    return (Path(state_dir) if state_dir else default_state_dir()) / SECRET_NAME
+
+
+def load_secret(state_dir: Optional[str] = None, create: bool = False) -> Optional[str]:
+    """The shared secret in the state directory, generated (mode 0600) when ``create`` and missing"""
+    path = secret_path(state_dir)
+    try:
+        return path.read_text(encoding='utf-8').strip() or None
+    except FileNotFoundError:
+        if not create:
+            return None
+    path.parent.mkdir(parents=True, exist_ok=True)
+    secret = secrets.token_urlsafe(32)
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+    with os.fdopen(fd, 'w', encoding='utf-8') as f:
+        f.write(secret + "\n")
+    return secret
+
+
+class IssueDaemon:
+    """Warm generators keyed by ``owner/name``"""
+
+    def __init__(self, token: str, state_dir: Optional[str] = None, use_state: bool = True,
+                 legacy_signatures: bool = True, trust_state: bool = False, assign_owner: bool = True,
+                 app: Any = None, file_root: Optional[str] = None):
+        self.token = token
+        # GitHubApp: each repository gets its installation's token instead of ``token``
+        self.app = app
+        self.state_dir = state_dir
+        self.use_state = use_state
+        self.legacy_signatures = legacy_signatures
+        self.trust_state = trust_state
+        self.assign_owner = assign_owner
+        # Only roadmaps below this directory may be submitted by path
+        self.file_root = Path(file_root).resolve() if file_root else None
+        self.started = time.time()
+        self._generators: Dict[str, Any] = {}
+        self._repo_locks: Dict[str, threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    def _generator(self, repo: str) -> Tuple[Any, threading.Lock]:
+        try:
+            owner, name = repo.split('/')
+        except ValueError:
+            raise SubmissionError("Repository format should be: owner/repo-name")
+        with self._lock:
+            if repo not in self._generators:
+                from issuegen.engine import GitHubIssueGenerator
+                state = RepoStateCache.for_repo(repo, self.state_dir) if self.use_state else None
+                try:
+                    auth = self.app.installation_auth(repo) if self.app is not None else None
+                except ValueError as e:
+                    raise SubmissionError(str(e))
+                self._generators[repo] = GitHubIssueGenerator(self.token, owner, name,
+                                                              legacy_signatures=self.legacy_signatures,
+                                                              state=state, trust_state=self.trust_state,
+                                                              auth=auth)
+                self._repo_locks[repo] = threading.Lock()
+            return self._generators[repo], self._repo_locks[repo]
+
+    def warm(self, repo: str) -> Dict[str, Any]:
+        generator, lock = self._generator(repo)
+        started = time.perf_counter()
+        with lock:
+            try:
+                generator.warm()
+            finally:
+                self._save_state(generator)
+        return {'repo': repo, 'elapsed': round(time.perf_counter() - started, 3)}
+
+    def _parse(self, request: Dict[str, Any], assignee: Optional[str]) -> Tuple[Any, List[Phase]]:
+        source = get_source(request.get('source', 'markdown'))(assignee=assignee)
+        if 'content' in request:
+            content = request['content']
+            if hasattr(source, 'iter_lines'):
+                return source, list(source.iter_lines(io.StringIO(content, newline=None)))
+            # Other adapters only read files
+            suffix = '.json' if source.name == 'json' else '.yaml'
+            with tempfile.NamedTemporaryFile('w', encoding='utf-8', suffix=suffix, delete=False) as f:
+                f.write(content)
+            try:
+                return source, source.parse(f.name)
+            finally:
+                os.unlink(f.name)
+        if 'file' in request:
+            if self.file_root is None:
+                raise SubmissionError("Submitting by 'file' is disabled (serve with --file-root); send 'content'")
+            path = (self.file_root / request['file']).resolve()
+            if not path.is_relative_to(self.file_root):
+                raise SubmissionError(f"{request['file']} is outside {self.file_root}")
+            if not path.is_file():
+                raise SubmissionError(f"File not found: {request['file']}")
+            return source, source.parse(str(path))
+        raise SubmissionError("A submission needs 'content' or 'file'")
+
+    def submit(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Create the missing issues of one roadmap; returns the created issue records"""
+        repo = request.get('repo')
+        if not repo:
+            raise SubmissionError("A submission needs 'repo'")
+        generator, lock = self._generator(repo)
+        started = time.perf_counter()
+        source, phases = self._parse(request, generator.repo_owner if self.assign_owner else None)
+        parsed = time.perf_counter()
+        total_tasks = sum(len(phase.tasks) for phase in phases)
+
+        with lock:
+            generator.start_roadmap()
+            try:
+                generator.create_labels(phases)
+                milestones = generator.create_milestones(phases)
+                created_issues = generator.create_issues(phases, milestones, request.get('max_tasks'),
+                                                         source=source)
+            finally:
+                self._save_state(generator)
+        return {
+            'repo': repo,
+            'tasks': total_tasks,
+            'created': created_issues,
+            'parse_seconds': round(parsed - started, 3),
+            'elapsed': round(time.perf_counter() - started, 3),
+        }
+
+    @staticmethod
+    def _save_state(generator) -> None:
+        if generator.state is not None:
+            generator.snapshot_rate_limit()
+            generator.state.save()
+
+    def status(self) -> Dict[str, Any]:
+        with self._lock:
+            repos = sorted(self._generators)
+        return {'repos': repos, 'uptime': round(time.time() - self.started, 1)}
+
+
+class DaemonRequestHandler(BaseHTTPRequestHandler):
+    server_version = 'issuegen-daemon'
+    protocol_version = 'HTTP/1.1'
+
+    def address_string(self) -> str:
+        # Unix socket peers have no (host, port)
+        return self.client_address[0] if self.client_address else 'unix'
+
+    def _reply(self, status: int, payload: Dict[str, Any]) -> None:
+        body = json.dumps(payload, ensure_ascii=False, default=str).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _refuse(self) -> Optional[Tuple[int, str]]:
+        """Why this request may not be served (HTTP status, message), or None"""
+        secret = self.server.secret
+        if secret is not None and not hmac.compare_digest(self.headers.get(SECRET_HEADER, '').encode('utf-8'),
+                                                          secret.encode('utf-8')):
+            return 401, f"Missing or wrong {SECRET_HEADER} header"
+        allowed_hosts = self.server.allowed_hosts
+        if allowed_hosts is not None and self.headers.get('Host', '').lower() not in allowed_hosts:
+            return 403, f"Unexpected Host header {self.headers.get('Host')!r}"
+        return None
+
+    def _read_json(self) -> Dict[str, Any]:
+        content_type = (self.headers.get('Content-Type') or '').split(';')[0].strip().lower()
+        if content_type != 'application/json':
+            # Leave the unread body with the connection rather than parse it as the next request
+            self.close_connection = True
+            raise SubmissionError("The request body must be application/json")
+        length = int(self.headers.get('Content-Length') or 0)
+        if length > MAX_BODY_BYTES:
+            self.close_connection = True
+            raise SubmissionError(f"Request body larger than {MAX_BODY_BYTES} bytes")
+        try:
+            payload = json.loads(self.rfile.read(length) or b'{}')
+        except ValueError as e:
+            raise SubmissionError(f"Invalid JSON: {e}")
+        if not isinstance(payload, dict):
+            raise SubmissionError("The request body must be a JSON object")
+        return payload
+
+    def do_GET(self) -> None:
+        refused = self._refuse()
+        if refused:
+            self._reply(refused[0], {'error': refused[1]})
+        elif self.path == '/status':
+            self._reply(200, self.server.issue_daemon.status())
+        else:
+            self._reply(404, {'error': f"Unknown path {self.path}"})
+
+    def do_POST(self) -> None:
+        refused = self._refuse()
+        if refused:
+            self.close_connection = True
+            self._reply(refused[0], {'error': refused[1]})
+            return
+        handlers = {'/submit': self.server.issue_daemon.submit,
+                    '/warm': lambda request: self.server.issue_daemon.warm(request.get('repo', ''))}
+        handler = handlers.get(self.path)
+        if handler is None:
+            # The unread body would otherwise be taken for the next request
+            self.close_connection = True
+            self._reply(404, {'error': f"Unknown path {self.path}"})
+            return
+        try:
+            self._reply(200, handler(self._read_json()))
+        except SubmissionError as e:
+            self._reply(400, {'error': str(e)})
+        except Exception as e:
+            print(f"❌ {self.path} failed: {e}")
+            self._reply(500, {'error': str(e)})
+
+
+class TcpDaemonServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address: Tuple[str, int], daemon: IssueDaemon, secret: str):
+        if not secret:
+            raise ValueError("A TCP daemon needs a shared secret")
+        super().__init__(address, DaemonRequestHandler)
+        self.issue_daemon = daemon
+        self.secret = secret
+        port = self.server_address[1]
+        hosts = set(LOOPBACK_HOSTS) | {address[0].lower()}
+        self.allowed_hosts = {f"{host}:{port}" for host in hosts}
+
+
+class DaemonRunningError(RuntimeError):
+    """Another daemon is already accepting connections on the socket"""
+
+
+def _socket_in_use(path: str) -> bool:
+    """True when something accepts connections on the Unix socket at ``path``"""
+    probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        probe.connect(path)
+    except (ConnectionRefusedError, FileNotFoundError):
+        return False
+    finally:
+        probe.close()
+    return True
+
+
+class UnixDaemonServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, path: str, daemon: IssueDaemon, secret: Optional[str] = None):
+        if os.path.exists(path):
+            # Two daemons on one state cache would overwrite each other's writes
+            if _socket_in_use(path):
+                raise DaemonRunningError(f"An issuegen daemon is already running on {path}")
+            # A socket left behind by a daemon that did not shut down cleanly
+            os.unlink(path)
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        old_umask = os.umask(0o177)
+        try:
+            super().__init__(path, DaemonRequestHandler)
+        finally:
+            os.umask(old_umask)
+        self.issue_daemon = daemon
+        # The socket's file mode already limits it to its owner
+        self.secret = secret
+        self.allowed_hosts = None
+
+    def server_close(self) -> None:
+        super().server_close()
+        try:
+            os.unlink(self.server_address)
+        except OSError:
+            pass
+
+
+class UnixHTTPConnection(http.client.HTTPConnection):
+    def __init__(self, path: str, timeout: Optional[float] = None):
+        super().__init__('localhost', timeout=timeout)
+        self.socket_path = path
+
+    def connect(self) -> None:
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        if self.timeout is not None:
+            self.sock.settimeout(self.timeout)
+        self.sock.connect(self.socket_path)
+
+
+def request(method: str, path: str, payload: Optional[Dict[str, Any]] = None, socket_path: Optional[str] = None,
+            host: str = '127.0.0.1', port: int = DEFAULT_PORT,
+            secret: Optional[str] = None) -> Tuple[int, Dict[str, Any]]:
+    """Send one request to a running daemon (Unix socket unless ``socket_path`` is None); returns (HTTP status, decoded JSON)"""
+    if socket_path:
+        connection = UnixHTTPConnection(socket_path)
+    else:
+        connection = http.client.HTTPConnection(host, port)
+    try:
+        body = json.dumps(payload).encode('utf-8') if payload is not None else None
+        headers = {'Content-Type': 'application/json'} if body is not None else {}
+        if secret:
+            headers[SECRET_HEADER] = secret
+        connection.request(method, path, body=body, headers=headers)
+        response = connection.getresponse()
+        return response.status, json.loads(response.read() or b'{}')
+    finally:
+        connection.close()
+
+
+def _serve(args) -> None:
+    if not args.token and not args.app_id:
+        print("❌ --token (or $GITHUB_TOKEN) is required")
+        return
+    app = None
+    if args.app_id:
+        from issuegen.app_auth import GitHubApp, load_private_key
+        if not args.app_private_key:
+            print("❌ --app-id needs --app-private-key (or $GITHUB_APP_PRIVATE_KEY)")
+            return
+        app = GitHubApp(args.app_id, load_private_key(args.app_private_key), cache_dir=args.state_dir)
+    daemon = IssueDaemon(args.token, args.state_dir, use_state=not args.no_state,
+                         legacy_signatures=not args.no_legacy_signatures, trust_state=args.trust_state, app=app,
+                         file_root=args.file_root)
+    for repo in args.warm or []:
+        print(f"🔄 Warming {repo}...")
+        print(f"✅ Warm in {daemon.warm(repo)['elapsed']}s")
+
+    if args.tcp:
+        secret = args.secret or load_secret(args.state_dir, create=True)
+        server = TcpDaemonServer((args.host, args.port), daemon, secret)
+        where = f"http://{args.host}:{args.port}"
+        if not args.secret:
+            print(f"🔑 Clients must send the secret in {secret_path(args.state_dir)}")
+    else:
+        try:
+            server = UnixDaemonServer(args.socket or default_socket_path(args.state_dir), daemon, args.secret)
+        except DaemonRunningError as e:
+            print(f"❌ {e}")
+            sys.exit(1)
+        where = server.server_address
+    print(f"🚀 issuegen daemon listening on {where}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\n⏹️ Shutting down")
+    finally:
+        server.server_close()
+
+
+def _submit(args) -> None:
+    payload: Dict[str, Any] = {'repo': args.repo, 'source': args.source}
+    if args.max_tasks is not None:
+        payload['max_tasks'] = args.max_tasks
+    if args.file == '-':
+        payload['content'] = sys.stdin.read()
+    else:
+        # Send the text so the daemon does not need access to the caller's working directory
+        payload['content'] = Path(args.file).read_text(encoding='utf-8')
+    socket_path = None if args.tcp else args.socket or default_socket_path(args.state_dir)
+    secret = args.secret or (load_secret(args.state_dir) if args.tcp else None)
+    status, result = request('POST', '/submit', payload, socket_path, args.host, args.port, secret)
+    if status != 200:
+        print(f"❌ {result.get('error', status)}")
+        sys.exit(1)
+    for issue in result['created']:
+        print(f"✅ Created issue #{issue['number']}: {issue['title']}")
+    print(f"\n🎉 Created {len(result['created'])} issues from {result['tasks']} tasks "
+          f"in {result['elapsed']}s (parse {result['parse_seconds']}s)")
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description='Keep warm issue generators behind a local submit API')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    def add_address(command) -> None:
+        command.add_argument('--socket', help=f'Unix socket path (default: {SOCKET_NAME} in the state directory)')
+        command.add_argument('--tcp', action='store_true', help='Use a TCP port instead of the Unix socket')
+        command.add_argument('--host', default='127.0.0.1', help='TCP address (default: 127.0.0.1)')
+        command.add_argument('--port', type=int, default=DEFAULT_PORT, help=f'TCP port (default: {DEFAULT_PORT})')
+        command.add_argument('--secret', default=os.environ.get('ISSUEGEN_DAEMON_SECRET'),
+                             help=f'Shared secret sent as {SECRET_HEADER} (default: $ISSUEGEN_DAEMON_SECRET, or with '
+                                  f'--tcp the {SECRET_NAME} file in the state directory)')
+        command.add_argument('--state-dir',
+                             help='Directory of the state cache, socket and secret (default: ~/.cache/issuegen)')
+
+    serve = commands.add_parser('serve', help='Run the daemon')
+    add_address(serve)
+    serve.add_argument('--token', default=os.environ.get('GITHUB_TOKEN'),
+                       help='GitHub personal access token (default: $GITHUB_TOKEN)')
+    serve.add_argument('--app-id', default=os.environ.get('GITHUB_APP_ID'),
+                       help='Authenticate as this GitHub App\'s installation on each repository instead of --token '
+                            '(default: $GITHUB_APP_ID)')
+    serve.add_argument('--app-private-key', default=os.environ.get('GITHUB_APP_PRIVATE_KEY'), metavar='PEM',
+                       help='Private key file of the GitHub App (default: $GITHUB_APP_PRIVATE_KEY)')
+    serve.add_argument('--warm', action='append', metavar='OWNER/REPO',
+                       help='Fetch this repository\'s labels, milestones and collaborators at start-up (repeatable)')
+    serve.add_argument('--file-root', metavar='DIR',
+                       help="Accept submissions by 'file' for roadmaps below DIR (default: content only)")
+    serve.add_argument('--no-state', action='store_true', help='Neither read nor write the state cache')
+    serve.add_argument('--no-legacy-signatures', action='store_true',
+                       help='Do not treat issues carrying the old MD5 signature marker as duplicates')
+    serve.add_argument('--trust-state', action='store_true',
+                       help='Skip duplicate searches for signatures missing from a fully refreshed cache')
+
+    submit = commands.add_parser('submit', help='Send a roadmap to a running daemon')
+    add_address(submit)
+    submit.add_argument('--repo', required=True, help='Repository in format owner/repo-name')
+    submit.add_argument('--file', required=True, help='Path to roadmap file (- for stdin)')
+    submit.add_argument('--source', default='markdown', help='Roadmap format (default: markdown)')
+    submit.add_argument('--max-tasks', type=int, help='Create at most this many tasks')
+
+    args = parser.parse_args(argv)
+    if args.command == 'serve':
+        _serve(args)
+    else:
+        _submit(args)
+
+
+if __name__ == "__main__":
+    main()
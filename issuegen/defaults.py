@@ -0,0 +1,26 @@
+"""
+Defaults shown by the command-line parser
+مقادیر پیش‌فرض گزینه‌های خط فرمان
+
+The modules behind --pipeline, --generate, --backend import and the AI
+response cache pull in asyncio, thread pools and HTTP clients. The CLI only
+imports them in the branches that run them, but ``--help`` still has to
+print their defaults, so those values live here and each module imports
+(and re-exports) its own.
+"""
+
+# issuegen.pipeline
+DEFAULT_QUEUE_SIZE = 64
+
+# issuegen.generation
+DEFAULT_AI_URL = 'https://api.openai.com/v1'
+DEFAULT_AI_MODEL = 'gpt-4o-mini'
+DEFAULT_CONCURRENCY = 4
+
+# issuegen.importer
+DEFAULT_API_URL = 'https://api.github.com'
+DEFAULT_BATCH_SIZE = 50
+
+# issuegen.ai_cache
+DEFAULT_MAX_BYTES = 200 * 1024 * 1024
+DEFAULT_MAX_ENTRIES = 1000
@@ -0,0 +1,732 @@
+"""
+Issue creation engine shared by every generator CLI
+ساخت لیبل، مایلستون و ایشو در GitHub
+"""
+
+import io
+import itertools
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from typing import Any, ContextManager, Dict, List, Optional, Set, Tuple
+
+import requests
+from github import Github
+from github.GithubException import GithubException
+
+from issuegen.budget import RunBudget, estimate_task_calls
+from issuegen.importer import ImportBatch, IssueImporter, sub_issue_section
+from issuegen.labels import build_label_specs
+from issuegen.models import Phase, Task, epic_subtask_titles, has_estimates
+from issuegen.prune import DEFAULT_PRUNE_LABEL, DEFAULT_PRUNE_WORKERS
+from issuegen.profiling import StageProfiler, profile_stage
+from issuegen.render import CONVENTIONS_PATH, render_conventions, render_yaml_description
+from issuegen.report import ReportWriter, render_report
+from issuegen.similarity import SimilarityIndex
+from issuegen.signature import compute_signature, compute_signatures, extract_signature, legacy_signature
+from issuegen.sources.base import RoadmapSource
+from issuegen.state import RepoStateCache
+
+DEFAULT_CREATE_RETRIES = 3
+DEFAULT_RETRY_DELAY = 2.0  # seconds before the first signature check; doubles per retry
+MAX_RETRY_DELAY = 60.0
+# Issues created up to this long before the local clock says the attempt started still count
+RECOVERY_CLOCK_SKEW = timedelta(minutes=5)
+
+
+def _is_ambiguous(error: Exception) -> bool:
+    """Whether the request may have been carried out even though it failed"""
+    if isinstance(error, (requests.Timeout, requests.ConnectionError)):
+        return True
+    return isinstance(error, GithubException) and (error.status or 0) >= 500
+
+
+class GitHubIssueGenerator:
+    """GitHub Issue Generator از roadmap"""
+
+    def __init__(self, token: Optional[str], repo_owner: str, repo_name: str, legacy_signatures: bool = True,
+                 state: Optional[RepoStateCache] = None, trust_state: bool = False, auth: Any = None):
+        """
+        Initialize GitHub client
+
+        Args:
+            token: GitHub personal access token
+            repo_owner: Repository owner username
+            repo_name: Repository name
+            legacy_signatures: Also treat issues carrying the old MD5 signature as duplicates
+            state: Repository state cache to read known signatures from and record into
+            trust_state: Skip the duplicate search for signatures missing from a complete cache
+            auth: PyGithub ``Auth`` used instead of ``token`` (e.g. a GitHub App installation)
+        """
+        self.github = Github(auth=auth) if auth is not None else Github(token)
+        self.token = token
+        self.auth = auth
+        self.repo_owner = repo_owner
+        self.repo_name = repo_name
+        self.legacy_signatures = legacy_signatures
+        self.state = state
+        self.trust_state = trust_state
+        self._repo = None
+        self._collaborators: Optional[Set[str]] = None
+        # Remote labels/milestones, listed once and kept across calls so the
+        # pipeline can set up one phase at a time
+        self._labels: Optional[Set[str]] = None
+        self._labels_done: Set[str] = set()
+        self._milestones: Optional[Dict[str, Any]] = None
+        self._base_date: Optional[datetime] = None
+        self._weeks_offset = 0
+        # Streaming report that receives every created issue as it happens
+        self.report: Optional[ReportWriter] = None
+        # Near-duplicate index of existing issue titles ('skip' or 'flag' matches)
+        self.similarity: Optional[SimilarityIndex] = None
+        self.similarity_action = 'flag'
+        # Deadline / API-call / rate-limit budget checked before each task
+        self.budget: Optional[RunBudget] = None
+        # --profile stage timings (dedup searches, issue creation)
+        self.profiler: Optional[StageProfiler] = None
+        # Issue Import API client; when set, create_issues imports in batches
+        self.importer: Optional[IssueImporter] = None
+        # Lean epic/sub-issue bodies linking here (sources render the task bodies)
+        self.conventions_url: Optional[str] = None
+        # Retries of a create whose outcome is unknown (timeout, 5xx), each after a signature check
+        self.create_retries = DEFAULT_CREATE_RETRIES
+        self.retry_delay = DEFAULT_RETRY_DELAY
+
+    @property
+    def repo(self):
+        """The target repository, fetched on first use rather than at construction"""
+        if self._repo is None:
+            self._spend()
+            self._repo = self.github.get_repo(f"{self.repo_owner}/{self.repo_name}")
+        return self._repo
+
+    def _stage(self, name: str) -> ContextManager:
+        return profile_stage(self.profiler, name)
+
+    def _charge(self, count: int = 1) -> None:
+        if self.budget is not None:
+            self.budget.charge(count)
+
+    def _spend(self, count: int = 1) -> None:
+        """Admit requests outside any task before sending them (raises BudgetExhausted)"""
+        if self.budget is not None:
+            self.budget.spend(count)
+
+    def _listed(self, paginated) -> List[Any]:
+        """Materialize a paginated listing; with a budget, each page is admitted before it is fetched"""
+        if self.budget is None:
+            return list(paginated)
+        per_page = getattr(self.github, 'per_page', None) or 30
+        items: List[Any] = []
+        for page in itertools.count():
+            self._spend()
+            batch = paginated.get_page(page)
+            items.extend(batch)
+            if len(batch) < per_page:
+                return items
+
+    def _issue_exists(self, signature: str, task_title: str, phase_name: str, week_number: int,
+                      legacy: Optional[str] = None) -> bool:
+        """Check if an issue with the given signature (or its legacy MD5 marker) already exists"""
+        if not self.legacy_signatures:
+            legacy = None
+        elif legacy is None:
+            legacy = legacy_signature(task_title, phase_name, week_number)
+        if self.state is not None:
+            if self.state.knows_signature(signature, legacy):
+                return True
+            if self.trust_state and self.state.complete_at is not None:
+                # The cache rules out an exact duplicate, not a near one
+                return self._similar_exists(task_title)
+
+        terms = f"\"{signature}\""
+        if legacy:
+            terms += f" OR \"{legacy}\""
+        query = f"repo:{self.repo.full_name} is:issue {terms} in:body"
+        try:
+            self._charge()
+            with self._stage('dedup'):
+                issues = self.github.search_issues(query=query)
+                found = issues.totalCount > 0
+        except GithubException as e:
+            print(f"❌ Error searching for existing issue with signature {signature}: {e}")
+            return False
+        if found and self.state is not None:
+            self.state.record_signature(signature)
+        return found or self._similar_exists(task_title)
+
+    def _similar_exists(self, task_title: str) -> bool:
+        """True when --similarity-action skip finds an existing issue with a near-identical title"""
+        if self.similarity is None or self.similarity_action != 'skip':
+            return False
+        match = self.similarity.query(task_title)
+        if match is None:
+            return False
+        number, title, score = match
+        print(f"⏭️ '{task_title}' looks like #{number} '{title}' (similarity {score:.2f})")
+        return True
+
+    def build_similarity_index(self, threshold: float, action: str = 'flag') -> int:
+        """Index every existing issue title (one listing) for near-duplicate checks"""
+        index = SimilarityIndex(threshold)
+        for issue in self._listed(self.repo.get_issues(state='all')):
+            if issue.pull_request is None:
+                index.add(issue.number, issue.title)
+        self.similarity = index
+        self.similarity_action = action
+        return len(index)
+
+    def _task_exists(self, task: Task) -> bool:
+        return self._issue_exists(task.signature, task.title, task.phase, task.week, task.legacy_signature)
+
+    def _existing_labels(self) -> Set[str]:
+        if self._labels is None:
+            self._labels = {label.name for label in self._listed(self.repo.get_labels())}
+            if self.state is not None:
+                self.state.labels = sorted(self._labels)
+        return self._labels
+
+    def create_labels(self, phases: List[Phase]) -> None:
+        """Create GitHub labels for phases and categories"""
+        existing_labels = self._existing_labels()
+        for label_data in build_label_specs(phases):
+            # Later calls (one per phase in the pipeline) only handle new labels
+            if label_data["name"] in self._labels_done:
+                continue
+            self._labels_done.add(label_data["name"])
+            if label_data["name"] not in existing_labels:
+                self._spend()
+                try:
+                    self.repo.create_label(
+                        name=label_data["name"],
+                        color=label_data["color"],
+                        description=label_data["description"]
+                    )
+                    existing_labels.add(label_data["name"])
+                    if self.state is not None:
+                        self.state.record_labels([label_data["name"]])
+                    print(f"✅ Created label: {label_data['name']}")
+                except GithubException as e:
+                    print(f"❌ Failed to create label {label_data['name']}: {e}")
+            else:
+                print(f"⏭️  Label already exists: {label_data['name']}")
+
+    def create_milestones(self, phases: List[Phase]) -> Dict[str, Any]:
+        """
+        Create GitHub milestones for phases
+
+        Due dates keep accumulating across calls, so creating milestones one
+        phase at a time gives the same dates as one call with every phase.
+        """
+        milestones = {}
+        if self._milestones is None:
+            # One listing up front instead of a failed create per existing milestone
+            self._milestones = {m.title: m for m in self._listed(self.repo.get_milestones(state='all'))}
+            if self.state is not None:
+                self.state.milestones = {title: m.number for title, m in self._milestones.items()}
+            self._base_date = datetime.now()
+        existing = self._milestones
+
+        for phase in phases:
+            self._weeks_offset += phase.duration_weeks
+            if phase.name in existing:
+                milestones[phase.name] = existing[phase.name]
+                print(f"⏭️  Milestone already exists: {phase.name}")
+                continue
+
+            due_date = self._base_date + timedelta(weeks=self._weeks_offset)
+            goals = "\nGoals:\n" + "\n".join(f"- {goal}" for goal in phase.goals) if phase.goals else ""
+            self._spend()
+            try:
+                milestone = self.repo.create_milestone(
+                    title=phase.name,
+                    description=f"{phase.description}\n{goals}" if goals else phase.description,
+                    due_on=due_date
+                )
+                milestones[phase.name] = existing[phase.name] = milestone
+                if self.state is not None:
+                    self.state.record_milestone(phase.name, milestone.number)
+                print(f"✅ Created milestone: {phase.name}")
+            except GithubException as e:
+                print(f"❌ Failed to create milestone {phase.name}: {e}")
+
+        return milestones
+
+    def start_roadmap(self) -> None:
+        """Date the next roadmap's milestones from today; listed labels and milestones stay cached"""
+        self._weeks_offset = 0
+        if self._milestones is not None:
+            self._base_date = datetime.now()
+
+    def ensure_conventions_doc(self, path: str = CONVENTIONS_PATH) -> None:
+        """Commit the shared conventions document that lean bodies link to, unless ``path`` already exists"""
+        self._spend()
+        try:
+            self.repo.get_contents(path)
+            print(f"⏭️  Conventions document already exists: {path}")
+            return
+        except GithubException as e:
+            if e.status != 404:
+                print(f"❌ Failed to check conventions document {path}: {e}")
+                return
+        self._spend()
+        try:
+            self.repo.create_file(path, "Add issue conventions for generated issues", render_conventions())
+            print(f"✅ Created conventions document: {path}")
+        except GithubException as e:
+            print(f"❌ Failed to create conventions document {path}: {e}")
+
+    def warm(self) -> None:
+        """Fetch the repository, labels, milestones and collaborators ahead of the first roadmap"""
+        self._existing_labels()
+        self.create_milestones([])
+        self._validate_assignee(self.repo_owner)
+
+    def _validate_assignee(self, assignee: str) -> bool:
+        """Validate if the assignee is a collaborator in the repository"""
+        if self._collaborators is None:
+            try:
+                self._collaborators = {collaborator.login for collaborator in self._listed(self.repo.get_collaborators())}
+            except GithubException as e:
+                print(f"❌ Error validating assignee {assignee}: {e}")
+                return False
+            if self.state is not None:
+                self.state.collaborators = sorted(self._collaborators)
+        return assignee in self._collaborators
+
+    def _resolve_assignee(self, task: Task) -> Optional[str]:
+        if not task.assignee:
+            return None
+        if self._validate_assignee(task.assignee):
+            return task.assignee
+        print(f"⚠️ Invalid assignee {task.assignee} for '{task.title}'. Using repo owner {self.repo_owner}.")
+        return self.repo_owner
+
+    def _flag_similar(self, title: str, body: str, labels: List[str]) -> Tuple[str, List[str]]:
+        """Body and labels of a new issue, marked when its title is close to an existing issue"""
+        if self.similarity is None or self.similarity_action != 'flag':
+            return body, labels
+        match = self.similarity.query(title)
+        if match is None:
+            return body, labels
+        number, other_title, score = match
+        print(f"⚠️ '{title}' looks like #{number} '{other_title}' (similarity {score:.2f})")
+        return (f"{body}\n\n> ⚠️ Possible duplicate of #{number} ({other_title}, similarity {score:.2f})",
+                labels + ['possible-duplicate'])
+
+    def _create_issue(self, title: str, body: str, labels: List[str], milestone: Any, assignee: Optional[str],
+                      signature: Optional[str] = None):
+        """Create one issue, retrying with the repo owner if the assignee is rejected"""
+        body, labels = self._flag_similar(title, body, labels)
+        issue_kwargs: Dict[str, Any] = {"title": title, "body": body, "labels": labels}
+        if milestone is not None:
+            issue_kwargs["milestone"] = milestone
+        if assignee:
+            issue_kwargs["assignee"] = assignee
+        try:
+            return self._create_once(issue_kwargs, signature)
+        except (GithubException, requests.RequestException) as e:
+            print(f"❌ Failed to create issue '{title}': {e}")
+            if "assignee" not in str(e).lower() or issue_kwargs.get("assignee") == self.repo_owner:
+                return None
+            print(f"⚠️ Assignee issue for '{title}'. Retrying with repo owner {self.repo_owner}.")
+            issue_kwargs["assignee"] = self.repo_owner
+            try:
+                return self._create_once(issue_kwargs, signature)
+            except (GithubException, requests.RequestException) as retry_e:
+                print(f"❌ Retry failed for '{title}': {retry_e}")
+                return None
+
+    def _create_once(self, issue_kwargs: Dict[str, Any], signature: Optional[str]):
+        """
+        ``create_issue`` that is safe to retry
+
+        A timeout, dropped connection or 5xx leaves it unknown whether GitHub
+        created the issue. After such a failure the signature is looked up
+        first (state cache, then the issues created since the attempt), and
+        only if it is missing is the create sent again, with exponential
+        backoff. Without a signature nothing can be checked, so nothing is
+        retried.
+        """
+        delay = self.retry_delay
+        for attempt in range(self.create_retries + 1):
+            started = datetime.now(timezone.utc)
+            try:
+                self._charge()
+                with self._stage('create'):
+                    return self.repo.create_issue(**issue_kwargs)
+            except (GithubException, requests.RequestException) as e:
+                if signature is None or attempt == self.create_retries or not _is_ambiguous(e):
+                    raise
+                print(f"⚠️ Outcome of creating '{issue_kwargs['title']}' unknown ({e}); "
+                      f"checking signature {signature} in {delay:g}s")
+            # Give GitHub time to finish a request that did go through
+            time.sleep(delay)
+            delay = min(delay * 2, MAX_RETRY_DELAY)
+            issue = self._find_created(signature, started)
+            if issue is not None:
+                print(f"🔄 '{issue_kwargs['title']}' was created despite the error: #{issue.number}")
+                return issue
+            print(f"🔄 Retrying '{issue_kwargs['title']}' ({attempt + 1}/{self.create_retries})")
+
+    def _find_created(self, signature: str, since: datetime):
+        """The issue carrying ``signature`` if one was created after ``since``"""
+        number = self.state.signatures.get(signature) if self.state is not None else None
+        try:
+            if number is not None:
+                self._charge()
+                return self.repo.get_issue(number)
+            # The listing is read from the database; search results can lag by minutes.
+            # Newest first, so the first page holds it (and the lookup costs one request)
+            recent = self.repo.get_issues(state='all', sort='created', direction='desc',
+                                          since=since - RECOVERY_CLOCK_SKEW)
+            self._charge()
+            for issue in recent.get_page(0):
+                if issue.pull_request is None and extract_signature(issue.body) == signature:
+                    return issue
+        except (GithubException, requests.RequestException) as e:
+            print(f"⚠️ Could not look up signature {signature}: {e}")
+        return None
+
+    def _issue_record(self, issue, task: Task, estimated_hours: float,
+                      signature: Optional[str] = None) -> Dict[str, Any]:
+        signature = signature or task.signature
+        if self.state is not None and signature:
+            self.state.record_signature(signature, issue.number)
+        record = {
+            'number': issue.number,
+            'title': issue.title,
+            'url': issue.html_url,
+            'phase': task.phase,
+            'week': task.week,
+            'estimated_hours': estimated_hours,
+            'signature': signature
+        }
+        if self.report is not None:
+            self.report.add(record)
+        return record
+
+    def snapshot_rate_limit(self) -> None:
+        """Remember the core rate limit from the last response headers"""
+        if self.state is None:
+            return
+        try:
+            remaining, limit = self.github.rate_limiting
+            self.state.record_rate_limit(remaining, limit, self.github.rate_limiting_resettime)
+        except GithubException as e:
+            print(f"⚠️ Could not read rate limit: {e}")
+
+    def refresh_state(self) -> int:
+        """
+        Rebuild the signature cache from one listing of every issue
+
+        Costs one request per 100 issues and makes the cache complete, so the
+        planner (and --trust-state runs) can skip per-task duplicate searches.
+        """
+        if self.state is None:
+            raise ValueError("refresh_state needs a RepoStateCache")
+        started = time.time()
+        found = 0
+        for issue in self._listed(self.repo.get_issues(state='all')):
+            if issue.pull_request is not None:
+                continue
+            signature = extract_signature(issue.body)
+            if signature:
+                self.state.record_signature(signature, issue.number)
+                found += 1
+        self.state.complete_at = started
+        self.snapshot_rate_limit()
+        self.state.save()
+        return found
+
+    def sync_issue_states(self) -> int:
+        """
+        Pull open/closed state for issues updated since the last sync
+
+        The first sync lists every issue (and so also completes the signature
+        cache); later ones only fetch what changed, using GitHub's own
+        ``updated_at`` as the cursor so local clock skew cannot drop updates.
+        Returns the number of signed issues seen.
+        """
+        if self.state is None:
+            raise ValueError("sync_issue_states needs a RepoStateCache")
+        started = time.time()
+        since = self.state.synced_until
+        kwargs: Dict[str, Any] = {'state': 'all', 'sort': 'updated', 'direction': 'asc'}
+        if since:
+            kwargs['since'] = datetime.fromisoformat(since)
+        seen = 0
+        newest = since
+        for issue in self._listed(self.repo.get_issues(**kwargs)):
+            if issue.pull_request is not None:
+                continue
+            updated = issue.updated_at.isoformat()
+            if newest is None or updated > newest:
+                newest = updated
+            signature = extract_signature(issue.body)
+            if signature:
+                self.state.record_issue_state(signature, issue.number, issue.state)
+                seen += 1
+        if since is None:
+            self.state.complete_at = started
+        self.state.synced_until = newest
+        self.snapshot_rate_limit()
+        self.state.save()
+        return seen
+
+    def export_vault(self, vault, rescan: bool = False) -> int:
+        """
+        Write a note for every signed issue updated since the vault's last export
+
+        Like ``sync_issue_states``, the cursor is GitHub's own ``updated_at``;
+        ``rescan`` ignores it and lists every issue (restoring deleted notes;
+        unchanged ones are still not rewritten). Returns the number of signed
+        issues seen.
+        """
+        since = None if rescan else vault.exported_until
+        kwargs: Dict[str, Any] = {'state': 'all', 'sort': 'updated', 'direction': 'asc'}
+        if since:
+            kwargs['since'] = datetime.fromisoformat(since)
+        seen = 0
+        newest = since
+        for issue in self._listed(self.repo.get_issues(**kwargs)):
+            if issue.pull_request is not None:
+                continue
+            updated = issue.updated_at.isoformat()
+            if newest is None or updated > newest:
+                newest = updated
+            signature = extract_signature(issue.body)
+            if signature:
+                vault.export(signature, issue)
+                seen += 1
+        # Only advance once every note is written, so an interrupted export is redone
+        vault.exported_until = newest
+        vault.save()
+        return seen
+
+    def find_orphans(self, keep: Set[str], action: str = 'close', label: str = DEFAULT_PRUNE_LABEL) -> List[Any]:
+        """
+        Signed issues whose signature is not in ``keep``, from a single listing
+
+        Only issues the action would still change are returned: open issues
+        for close/relabel (minus those already carrying ``label``), unlocked
+        ones for lock.
+        """
+        orphans = []
+        for issue in self._listed(self.repo.get_issues(state='all' if action == 'lock' else 'open')):
+            if issue.pull_request is not None:
+                continue
+            signature = extract_signature(issue.body)
+            if not signature or signature in keep:
+                continue
+            if action == 'lock' and issue.locked:
+                continue
+            if action == 'relabel' and any(existing.name == label for existing in issue.labels):
+                continue
+            orphans.append(issue)
+        return orphans
+
+    def prune_issues(self, orphans: List[Any], action: str = 'close', label: str = DEFAULT_PRUNE_LABEL,
+                     workers: int = DEFAULT_PRUNE_WORKERS) -> int:
+        """Close, lock or relabel ``orphans`` in one concurrent wave; returns how many succeeded"""
+        if action == 'relabel':
+            self.create_label_if_missing(label, "cfd3d7", "Task removed from the roadmap")
+
+        done = {'close': 'Closed', 'lock': 'Locked', 'relabel': f"Labeled '{label}'"}[action]
+
+        def prune(issue) -> bool:
+            try:
+                if action == 'close':
+                    self._charge()
+                    issue.edit(state='closed', state_reason='not_planned')
+                    if self.state is not None:
+                        self.state.record_issue_state(extract_signature(issue.body), issue.number, 'closed')
+                elif action == 'lock':
+                    self._charge()
+                    issue.lock('resolved')
+                else:
+                    self._charge()
+                    issue.add_to_labels(label)
+            except GithubException as e:
+                print(f"❌ Failed to {action} #{issue.number}: {e}")
+                return False
+            print(f"✅ {done} #{issue.number}: {issue.title}")
+            return True
+
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+            return sum(executor.map(prune, orphans))
+
+    def create_label_if_missing(self, name: str, color: str, description: str) -> None:
+        if name in self._existing_labels():
+            return
+        self._spend()
+        try:
+            self.repo.create_label(name=name, color=color, description=description)
+            self._labels.add(name)
+            print(f"✅ Created label: {name}")
+        except GithubException as e:
+            print(f"❌ Failed to create label {name}: {e}")
+
+    def _create_task_issue(self, task: Task, milestone: Any, assignee: Optional[str],
+                           created_issues: List[Dict[str, Any]]) -> None:
+        issue = self._create_issue(task.title, task.description, task.labels or [], milestone, assignee,
+                                   task.signature)
+        if issue is None:
+            return
+        created_issues.append(self._issue_record(issue, task, task.estimated_hours or 0))
+        print(f"✅ Created issue #{issue.number}: {task.title} (signature: {task.signature})")
+
+    def _epic_description(self, task: Task) -> str:
+        return render_yaml_description(
+            task.title, task.description, task.phase, f"Week {task.week}",
+            task.week, task.category, float(task.estimated_hours or 0.0), [], "Unknown Project",
+            task.signature, self.conventions_url
+        ) + "\n\nThis is an epic issue. Sub-issues will be linked below."
+
+    @staticmethod
+    def _sub_issue_hours(task: Task) -> float:
+        return task.estimated_hours / len(task.subtasks) if task.estimated_hours else 0
+
+    def _sub_issue_description(self, task: Task, sub_title: str, subtask_desc: str, sub_signature: str,
+                               main_number: int) -> str:
+        return render_yaml_description(
+            sub_title, subtask_desc, task.phase, f"Week {task.week}",
+            task.week, task.category, self._sub_issue_hours(task), [], "Unknown Project", sub_signature,
+            self.conventions_url
+        ) + f"\n\nThis is a sub-issue of #{main_number}"
+
+    def _create_epic(self, task: Task, milestone: Any, assignee: Optional[str],
+                     created_issues: List[Dict[str, Any]], skipped_issues: List[str]) -> None:
+        """Create a coordination issue plus one linked sub-issue per YAML subtask"""
+        main_issue = self._create_issue(f"{task.title} (Coordination)", self._epic_description(task),
+                                        (task.labels or []) + ['epic', 'coordination'], milestone, assignee,
+                                        task.signature)
+        if main_issue is None:
+            return
+        # Coordination has no direct hours
+        created_issues.append(self._issue_record(main_issue, task, 0))
+        print(f"✅ Created main issue #{main_issue.number}: {main_issue.title} (0h)")
+
+        sub_issues = []
+        sub_estimated_hours = self._sub_issue_hours(task)
+
+        for sub_title, subtask_desc in zip(epic_subtask_titles(task), task.subtasks):
+            sub_signature = compute_signature(sub_title, task.phase, task.week)
+            if self._issue_exists(sub_signature, sub_title, task.phase, task.week):
+                print(f"⏭️ Skipped duplicate sub-issue: {sub_title} (signature: {sub_signature})")
+                skipped_issues.append(sub_title)
+                continue
+
+            sub_description = self._sub_issue_description(task, sub_title, subtask_desc, sub_signature,
+                                                          main_issue.number)
+            sub_issue = self._create_issue(sub_title, sub_description,
+                                           (task.labels or []) + ['sub-task'], milestone, assignee, sub_signature)
+            if sub_issue is None:
+                continue
+            sub_issues.append((sub_issue.number, subtask_desc))
+            created_issues.append(self._issue_record(sub_issue, task, sub_estimated_hours, sub_signature))
+            print(f"✅ Created sub-issue #{sub_issue.number}: {sub_title} ({sub_estimated_hours}h)")
+
+        # Update main issue with sub-issues list
+        if sub_issues:
+            try:
+                self._charge()
+                main_issue.edit(body=main_issue.body + "\n\n" + sub_issue_section(sub_issues))
+                print(f"✅ Updated main issue #{main_issue.number} with sub-issues links")
+            except GithubException as e:
+                print(f"❌ Failed to link sub-issues on #{main_issue.number}: {e}")
+
+    def _create_task(self, task: Task, milestones: Dict[str, Any], source: Optional[RoadmapSource],
+                     created_issues: List[Dict[str, Any]], skipped_issues: List[str]) -> int:
+        """Create the issue(s) of one task; returns 0 when the task was a duplicate, else 1"""
+        # Check for duplicates using the precomputed signature
+        if self._task_exists(task):
+            print(f"⏭️ Skipped duplicate issue: {task.title} (signature: {task.signature})")
+            skipped_issues.append(task.title)
+            return 0
+
+        milestone = milestones.get(task.milestone or "")
+        assignee = self._resolve_assignee(task)
+
+        if task.subtasks:
+            self._create_epic(task, milestone, assignee, created_issues, skipped_issues)
+            return 1
+
+        to_create = source.expand_task(task) if source is not None else [task]
+        for sub_task in to_create:
+            # An unsplit task was already checked above
+            if sub_task is not task and self._task_exists(sub_task):
+                print(f"⏭️ Skipped duplicate sub-issue: {sub_task.title} (signature: {sub_task.signature})")
+                skipped_issues.append(sub_task.title)
+                continue
+
+            self._create_task_issue(sub_task, milestone, assignee, created_issues)
+        return 1
+
+    def create_issues(self, phases: List[Phase], milestones: Dict[str, Any], max_tasks: Optional[int] = None,
+                      source: Optional[RoadmapSource] = None) -> List[Dict[str, Any]]:
+        """
+        Create GitHub issues from tasks
+
+        Tasks with YAML subtasks become a coordination issue with linked
+        sub-issues; other tasks are expanded by ``source.expand_task`` (e.g.
+        the Markdown auth split) and created one issue each.
+        """
+        created_issues: List[Dict[str, Any]] = []
+        skipped_issues: List[str] = []
+        task_count = 0
+        if max_tasks is None:
+            max_tasks = sum(len(phase.tasks) for phase in phases)
+
+        # Tasks loaded from older JSON caches may not carry a signature yet
+        compute_signatures(task for phase in phases for task in phase.tasks)
+        # The import backend collects every issue first and submits them in batches
+        batch = ImportBatch(self) if self.importer is not None else None
+        create_task = batch.add if batch is not None else self._create_task
+
+        for phase in phases:
+            if task_count >= max_tasks:
+                print(f"⏹️ Reached maximum task limit ({max_tasks}). Stopping issue creation.")
+                break
+            if self.budget is not None and self.budget.stop_reason is not None:
+                break
+            print(f"\n🚀 Processing issues for {phase.name}...")
+
+            for task in phase.tasks:
+                if task_count >= max_tasks:
+                    break
+
+                cost = estimate_task_calls(task, source, self.create_retries)
+                if self.budget is not None and not self.budget.admit(*cost):
+                    print(f"⏹️ {self.budget.stop_reason}. Stopping issue creation.")
+                    break
+                added = 0
+                try:
+                    added = create_task(task, milestones, source, created_issues, skipped_issues)
+                    task_count += added
+                finally:
+                    if self.budget is not None:
+                        if batch is not None and added:
+                            # Its imports are sent by batch.finish(); keep the room until then
+                            batch.hold(cost)
+                        else:
+                            self.budget.release(*cost)
+
+        if batch is not None:
+            batch.finish(created_issues, skipped_issues)
+        self.print_issue_summary(phases, created_issues, skipped_issues)
+        return created_issues
+
+    @staticmethod
+    def print_issue_summary(phases: List[Phase], created_issues: List[Dict[str, Any]],
+                            skipped_issues: List[str]) -> None:
+        print(f"\n📊 Issues Summary: Created {len(created_issues)}, Skipped {len(skipped_issues)} duplicates")
+        if has_estimates(phases):
+            total_hours = sum(issue['estimated_hours'] for issue in created_issues)
+            print(f"📊 Total Estimated Hours: {total_hours} hours")
+
+    def generate_summary_report(self, phases: List[Phase], created_issues: List[Dict[str, Any]]) -> str:
+        """Generate summary report of created issues"""
+        buffer = io.StringIO()
+        render_report(created_issues, phases, self.repo.full_name, buffer)
+        return buffer.getvalue()
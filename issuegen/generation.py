@@ -0,0 +1,427 @@
+"""
+Streaming roadmap generation from an OpenAI-compatible chat endpoint
+تولید نقشه راه با هوش مصنوعی به صورت جریانی
+
+The prompts in docs/ are written for an interactive chat; here one of them is
+the system prompt, a short instruction replaces the interview, and the
+project brief is the user message. The completion is requested with
+``stream: true`` and read as server-sent events. Content deltas are joined
+into lines and handed straight to the source's incremental parser
+(``iter_lines``), so with --pipeline the issues of Phase 1 are created while
+the model is still writing the later phases.
+
+With a ``ResponseCache`` every completion is stored under the hash of its
+prompt, variables and model, and an unchanged request is replayed from disk.
+A roadmap can also be generated one request per phase: per ``## `` section
+of the brief, or per line of a phase outline the model writes first. Each
+phase is then its own cached request, so editing one section only
+regenerates that phase, and the phase requests run concurrently; their
+replies are merged back in phase order, so the roadmap is ready about as
+soon as its slowest phase.
+
+Any server implementing ``POST {api_url}/chat/completions`` works (OpenAI,
+vLLM, Ollama, LM Studio, ...); devtools/openai_stub_server.py replays a
+roadmap file for testing without a model.
+"""
+
+import json
+import queue
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from issuegen.ai_cache import ResponseCache, request_key
+from issuegen.defaults import DEFAULT_AI_MODEL, DEFAULT_AI_URL, DEFAULT_CONCURRENCY
+
+REQUEST_TIMEOUT = (10, 300)  # connect, and the longest silence between two chunks
+DOCS_DIR = Path(__file__).resolve().parent.parent / 'docs'
+# Prompt that produces each format, relative to docs/
+PROMPT_FILES = {
+    'markdown': 'ai_prompt_claude.md',
+    'markdown-keywords': 'ai_prompt_claude.md',
+    'yaml': 'ai_prompt_claudev2.md',
+}
+PREAMBLE_LINES = 5  # non-blank lines a reply may have before an opening code fence
+FORMAT_NAMES = {'markdown': 'Markdown', 'markdown-keywords': 'Markdown', 'yaml': 'YAML'}
+NON_INTERACTIVE = (
+    "This conversation is automated: do not ask any questions. The user's message is the complete "
+    "project brief; choose the technology stack yourself where it does not say. Reply with the "
+    "{format} roadmap only, phase by phase in order, with no text before or after it."
+)
+PHASE_ONLY = (
+    "The phases are written one at a time. Write only Phase {number}, covering the part of the project "
+    "described under the brief's last heading; the rest of the brief is context. Title it Phase {number}"
+    "{yaml_note}."
+)
+OUTLINE_PHASE = (
+    "The roadmap's phases are:\n{outline}\n\nThe phases are written one at a time. Write only Phase {number} "
+    "in full, with all of its weeks, categories and tasks, numbering its weeks from Week 1{yaml_note}."
+)
+OUTLINE_INSTRUCTION = (
+    "This conversation is automated: do not ask any questions. The user's message is the complete project "
+    "brief; choose the technology stack yourself where it does not say. Reply with only the roadmap's phase "
+    "outline, one line per phase in order, formatted as `Phase N: <name> (<weeks> weeks) - <what it covers>`."
+)
+YAML_PHASE_NOTE = " and reply with a complete YAML document whose phases list holds just this phase"
+OUTLINE_RE = re.compile(r'^[\W\d]*?(Phase\s+\d+\s*:\s*\S.*?)[\s*`]*$', re.IGNORECASE)
+SECTION_RE = re.compile(r'^##\s')
+PHASES_KEY_RE = re.compile(r'^phases\s*:\s*(#.*)?$')
+
+
+class GenerationError(ValueError):
+    """The endpoint could not be reached or answered with an error"""
+
+
+def default_prompt(source_name: str) -> Path:
+    """The docs/ prompt for a roadmap format"""
+    if source_name not in PROMPT_FILES:
+        raise GenerationError(f"No built-in prompt produces '{source_name}' roadmaps; pass --ai-prompt")
+    return DOCS_DIR / PROMPT_FILES[source_name]
+
+
+def build_messages(system_prompt: str, brief: str, source_name: str) -> List[Dict[str, str]]:
+    output_format = FORMAT_NAMES.get(source_name, source_name)
+    return [
+        {'role': 'system', 'content': system_prompt + "\n\n" + NON_INTERACTIVE.format(format=output_format)},
+        {'role': 'user', 'content': brief},
+    ]
+
+
+def brief_sections(brief: str) -> Tuple[str, List[str]]:
+    """Split a brief into its preamble and its ``## `` sections (one per phase)"""
+    preamble: List[str] = []
+    sections: List[List[str]] = []
+    for line in brief.splitlines(keepends=True):
+        if SECTION_RE.match(line):
+            sections.append([])
+        (sections[-1] if sections else preamble).append(line)
+    return "".join(preamble), ["".join(section) for section in sections]
+
+
+@dataclass
+class GenerationRequest:
+    """One chat completion, with the inputs its cache key is computed from"""
+    messages: List[Dict[str, str]]
+    variables: Dict[str, Any]
+
+    def key(self, api_url: str, model: str) -> str:
+        return request_key(self.messages[0]['content'], self.variables, {'api_url': api_url, 'model': model})
+
+
+def outline_request(system_prompt: str, brief: str) -> GenerationRequest:
+    """The completion that lists the roadmap's phases, one line each"""
+    messages = [
+        {'role': 'system', 'content': system_prompt + "\n\n" + OUTLINE_INSTRUCTION},
+        {'role': 'user', 'content': brief},
+    ]
+    return GenerationRequest(messages, {'brief': brief})
+
+
+def parse_outline(text: str) -> List[str]:
+    """The ``Phase N: ...`` lines of an outline reply, in order"""
+    phases = [match.group(1) for match in map(OUTLINE_RE.match, text.splitlines()) if match]
+    if not phases:
+        raise GenerationError(f"The phase outline lists no 'Phase N:' lines: {text[:300]!r}")
+    return phases
+
+
+def build_requests(system_prompt: str, brief: str, source_name: str, per_phase: bool = False,
+                   outline: Optional[List[str]] = None) -> List[GenerationRequest]:
+    """
+    Completions that together produce the roadmap
+
+    One for the whole brief; with ``outline``, one per outline line; with
+    ``per_phase``, one per ``## `` section of the brief. A section request
+    only carries the preamble and its own section, so it keeps its cache key
+    while other sections are edited.
+    """
+    yaml_note = YAML_PHASE_NOTE if source_name == 'yaml' else ''
+    if outline:
+        listing = "\n".join(outline)
+        outline_requests = []
+        for number in range(1, len(outline) + 1):
+            # Like the prompts, every phase restarts at Week 1 (signatures include the phase name)
+            messages = build_messages(system_prompt, brief, source_name)
+            messages[0]['content'] += "\n\n" + OUTLINE_PHASE.format(outline=listing, number=number,
+                                                                     yaml_note=yaml_note)
+            outline_requests.append(GenerationRequest(messages, {'brief': brief, 'outline': listing,
+                                                                 'phase': number}))
+        return outline_requests
+    if not per_phase:
+        return [GenerationRequest(build_messages(system_prompt, brief, source_name), {'brief': brief})]
+    preamble, sections = brief_sections(brief)
+    if not sections:
+        raise GenerationError("Per-phase generation needs a brief with one '## ' section per phase, or an outline")
+    phase_requests = []
+    for number, section in enumerate(sections, 1):
+        messages = build_messages(system_prompt, preamble + section, source_name)
+        messages[0]['content'] += "\n\n" + PHASE_ONLY.format(number=number, yaml_note=yaml_note)
+        phase_requests.append(GenerationRequest(messages, {'preamble': preamble, 'section': section, 'phase': number}))
+    return phase_requests
+
+
+def stream_chat(messages: List[Dict[str, str]], api_url: str = DEFAULT_AI_URL, api_key: Optional[str] = None,
+                model: str = DEFAULT_AI_MODEL) -> Iterator[str]:
+    """Content deltas of a streamed chat completion, as they arrive"""
+    import requests
+
+    headers = {'Content-Type': 'application/json', 'Accept': 'text/event-stream'}
+    if api_key:
+        headers['Authorization'] = f'Bearer {api_key}'
+    payload = {'model': model, 'messages': messages, 'stream': True}
+    url = api_url.rstrip('/') + '/chat/completions'
+    try:
+        response = requests.post(url, json=payload, headers=headers, stream=True, timeout=REQUEST_TIMEOUT)
+    except requests.RequestException as e:
+        raise GenerationError(f"Cannot reach {url}: {e}")
+    with response:
+        if response.status_code >= 400:
+            raise GenerationError(f"{url} answered {response.status_code}: {response.text[:500]}")
+        # Event streams are always UTF-8, whatever the headers say
+        response.encoding = 'utf-8'
+        try:
+            for line in response.iter_lines(decode_unicode=True):
+                # SSE: "data: {...}" lines separated by blank lines; ":" lines are keep-alive comments
+                if not line or not line.startswith('data:'):
+                    continue
+                data = line[5:].strip()
+                if data == '[DONE]':
+                    return
+                try:
+                    event = json.loads(data)
+                except ValueError as e:
+                    raise GenerationError(f"Unreadable event from {url}: {e}")
+                if event.get('error'):
+                    raise GenerationError(f"Generation failed: {event['error']}")
+                for choice in event.get('choices') or []:
+                    content = (choice.get('delta') or {}).get('content')
+                    if content:
+                        yield content
+        except requests.RequestException as e:
+            raise GenerationError(f"Stream from {url} broke off: {e}")
+
+
+def fetch_completion(request: GenerationRequest, api_url: str = DEFAULT_AI_URL, api_key: Optional[str] = None,
+                     model: str = DEFAULT_AI_MODEL, cache: Optional[ResponseCache] = None) -> str:
+    """The whole reply to ``request``, from the cache when possible"""
+    key = request.key(api_url, model) if cache is not None else None
+    text = cache.get(key) if key is not None else None
+    if text is None:
+        text = "".join(stream_chat(request.messages, api_url, api_key, model))
+        if key is not None:
+            cache.put(key, text)
+    return text
+
+
+def iter_text_lines(chunks: Iterable[str]) -> Iterator[str]:
+    """Re-split arbitrary text chunks into lines (each ending in a newline)"""
+    pending = ''
+    for chunk in chunks:
+        pending += chunk
+        if '\n' not in pending:
+            continue
+        *complete, pending = pending.split('\n')
+        for line in complete:
+            yield line + '\n'
+    if pending:
+        yield pending + '\n'
+
+
+def strip_code_fence(lines: Iterable[str]) -> Iterator[str]:
+    """
+    Drop a ```markdown / ```yaml fence wrapped around the whole reply
+
+    Up to PREAMBLE_LINES lines before the opening fence ("Here is your
+    roadmap:") and anything after the closing one are dropped with it.
+    """
+    preamble: List[str] = []
+    fenced = None
+    inner = False  # inside a fenced block of the roadmap itself
+    closed = False
+    for line in lines:
+        stripped = line.strip()
+        if fenced is None:
+            if stripped.startswith('```'):
+                fenced = True
+                continue
+            preamble.append(line)
+            if sum(1 for text in preamble if text.strip()) <= PREAMBLE_LINES:
+                continue
+            # No fence near the top: the reply is the roadmap itself
+            fenced = False
+            yield from preamble
+            continue
+        if fenced and stripped.startswith('```'):
+            if stripped == '```' and not inner:
+                closed = True
+            else:
+                inner = stripped != '```'
+        if not closed:
+            yield line
+    if fenced is None:
+        yield from preamble
+
+
+def merge_yaml_phases(documents: Iterable[Iterable[str]]) -> Iterator[str]:
+    """
+    One YAML roadmap from several documents that each hold some phases
+
+    The header (everything up to ``phases:``) comes from the first document;
+    the phases lists of all of them follow, re-indented to the first one's
+    item indent. Top-level keys after a phases list are dropped.
+    """
+    item_indent = None
+    for index, lines in enumerate(documents):
+        in_phases = False
+        shift = None
+        for line in lines:
+            if not in_phases:
+                in_phases = PHASES_KEY_RE.match(line) is not None
+                if index == 0:
+                    yield line
+                continue
+            stripped = line.lstrip(' ')
+            indent = len(line) - len(stripped)
+            if stripped.strip() and not stripped.startswith('#'):
+                if indent == 0 and not stripped.startswith('-'):
+                    in_phases = False
+                    continue
+                if shift is None and stripped.startswith('-'):
+                    if item_indent is None:
+                        item_indent = indent
+                    shift = item_indent - indent
+            if shift and stripped.strip():
+                line = ' ' * max(0, indent + shift) + stripped
+            yield line
+
+
+class RoadmapStream:
+    """
+    Lines of a roadmap as the model writes it
+
+    Iterating drives the requests, up to ``concurrency`` of them at a time;
+    replies are passed on strictly in request order, the first one as it
+    streams and the later ones from what their requests have buffered
+    meanwhile. The generated text is written to ``save_path`` as it is
+    passed on, so an interrupted run still leaves what was received. With a
+    ``cache``, completed responses are stored and identical requests are
+    replayed without calling the model.
+    """
+
+    def __init__(self, requests: List[GenerationRequest], api_url: str = DEFAULT_AI_URL,
+                 api_key: Optional[str] = None, model: str = DEFAULT_AI_MODEL, save_path: Optional[str] = None,
+                 cache: Optional[ResponseCache] = None, source_name: str = 'markdown',
+                 concurrency: int = DEFAULT_CONCURRENCY):
+        self.requests = requests
+        self.api_url = api_url
+        self.api_key = api_key
+        self.model = model
+        self.save_path = save_path
+        self.cache = cache
+        self.source_name = source_name
+        self.concurrency = max(1, concurrency)
+        self.chunks = 0
+        self.lines = 0
+        self.cached = 0
+        self.first_chunk_seconds: Optional[float] = None
+        self.seconds = 0.0
+        self._started = 0.0
+        self._lock = threading.Lock()
+
+    def _responses(self, request: GenerationRequest) -> Iterator[str]:
+        """Raw chunks of one completion"""
+        key = request.key(self.api_url, self.model) if self.cache is not None else None
+        text = self.cache.get(key) if key is not None else None
+        if text is not None:
+            with self._lock:
+                self.cached += 1
+            yield text
+            return
+        received: List[str] = []
+        for chunk in stream_chat(request.messages, self.api_url, self.api_key, self.model):
+            received.append(chunk)
+            yield chunk
+        # Only a response that ran to completion is worth replaying
+        if key is not None:
+            self.cache.put(key, "".join(received))
+
+    def _produce(self, request: GenerationRequest, chunks: queue.Queue, stop: threading.Event) -> None:
+        """Worker: run one request into its queue, ending with None or the exception"""
+        try:
+            for chunk in self._responses(request):
+                if stop.is_set():
+                    return
+                chunks.put(chunk)
+        except Exception as e:
+            chunks.put(e)
+            return
+        chunks.put(None)
+
+    @staticmethod
+    def _drain(chunks: queue.Queue) -> Iterator[str]:
+        while True:
+            chunk = chunks.get()
+            if chunk is None:
+                return
+            if isinstance(chunk, Exception):
+                raise chunk
+            yield chunk
+
+    def _document(self, chunks: Iterable[str], saved) -> Iterator[str]:
+        """Lines of one reply, counted and saved as they are passed on"""
+        def recorded() -> Iterator[str]:
+            for chunk in chunks:
+                if self.first_chunk_seconds is None:
+                    self.first_chunk_seconds = time.perf_counter() - self._started
+                self.chunks += 1
+                if saved is not None:
+                    saved.write(chunk)
+                    saved.flush()
+                yield chunk
+        return strip_code_fence(iter_text_lines(recorded()))
+
+    def _documents(self, saved) -> Iterator[Iterator[str]]:
+        if self.concurrency == 1 or len(self.requests) == 1:
+            for request in self.requests:
+                yield self._document(self._responses(request), saved)
+            return
+        stop = threading.Event()
+        pool = ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix='generate')
+        try:
+            pending = []
+            for request in self.requests:
+                chunks: queue.Queue = queue.Queue()
+                pool.submit(self._produce, request, chunks, stop)
+                pending.append(chunks)
+            for chunks in pending:
+                yield self._document(self._drain(chunks), saved)
+        finally:
+            # Abandoned early (error or interrupt): let running requests stop at their next chunk
+            stop.set()
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    def _lines(self) -> Iterator[str]:
+        self._started = time.perf_counter()
+        with open(self.save_path, 'w', encoding='utf-8') if self.save_path else nullcontext() as saved:
+            documents = self._documents(saved)
+            if self.source_name == 'yaml' and len(self.requests) > 1:
+                yield from merge_yaml_phases(documents)
+            else:
+                for document in documents:
+                    yield from document
+        self.seconds = time.perf_counter() - self._started
+
+    def __iter__(self) -> Iterator[str]:
+        for line in self._lines():
+            self.lines += 1
+            yield line
+
+    def summary(self) -> str:
+        first = f", first token after {self.first_chunk_seconds:.1f}s" if self.first_chunk_seconds is not None else ""
+        cached = f", {self.cached} of {len(self.requests)} responses from cache" if self.cache is not None else ""
+        return f"{self.lines} lines in {self.chunks} chunks over {self.seconds:.1f}s{first}{cached}"
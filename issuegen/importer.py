@@ -0,0 +1,349 @@
+"""
+Bulk issue creation through GitHub's Issue Import API
+ساخت دسته‌ای ایشوها با Issue Import API
+
+``POST /repos/{owner}/{repo}/import/issues`` queues an issue that GitHub
+creates in the background, without notifying watchers or assignees and
+without the secondary rate limits that ``create_issue`` runs into when
+seeding a repository. ``IssueImporter`` submits issues in batches and, while
+the next batch is being sent, collects the finished ones with a single
+status listing (``GET .../import/issues?since=``) instead of one request per
+issue. The imported issue numbers are mapped back to the signatures through
+the usual ``_issue_record``.
+
+Epics need the coordination issue's number in their sub-issue bodies, so
+``ImportBatch`` imports in two waves: every plain issue plus every
+coordination issue, then the sub-issues, then one edit per epic to list them.
+
+With a run budget, each queued task keeps the room it was admitted with
+until ``finish``, and every import request is drawn from that room (status
+polls beyond it are admitted one by one). A refused request stops the
+import; the issues not yet submitted are simply not created, so the next run
+picks them up.
+
+The API root is configurable (GitHub Enterprise, or the stand-in server in
+devtools/issue_import_server.py for local testing).
+"""
+
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from issuegen.budget import BudgetExhausted
+from issuegen.defaults import DEFAULT_API_URL, DEFAULT_BATCH_SIZE
+from issuegen.models import Task, epic_subtask_titles
+from issuegen.signature import compute_signature
+
+IMPORT_MEDIA_TYPE = 'application/vnd.github.golden-comet-preview+json'
+DEFAULT_POLL_INTERVAL = 1.0
+DEFAULT_IMPORT_TIMEOUT = 600.0
+REQUEST_TIMEOUT = 30
+
+
+def sub_issue_section(sub_issues: List[Tuple[int, str]]) -> str:
+    """The checklist appended to an epic's coordination issue"""
+    return "### Sub-issues\n" + "\n".join(f"- [ ] [#{num}] {desc}" for num, desc in sub_issues)
+
+
+@dataclass
+class ImportedIssue:
+    """The fields of a created issue that the engine's records and reports use"""
+    number: int
+    title: str
+    html_url: str
+    body: str
+
+
+class IssueImporter:
+    """Thin client for the import endpoints of one repository"""
+
+    def __init__(self, token: Optional[str], repo_owner: str, repo_name: str, api_url: str = DEFAULT_API_URL,
+                 batch_size: int = DEFAULT_BATCH_SIZE, poll_interval: float = DEFAULT_POLL_INTERVAL,
+                 timeout: float = DEFAULT_IMPORT_TIMEOUT, on_request: Optional[Callable[[int], None]] = None,
+                 auth: Any = None):
+        """
+        Args:
+            token: Token with write access to the repository
+            repo_owner: Repository owner username
+            repo_name: Repository name
+            api_url: REST API root
+            batch_size: Imports submitted between two status checks
+            poll_interval: Seconds between status checks once everything is submitted
+            timeout: Give up on imports still pending after this many seconds
+            on_request: Called with 1 before every request; may raise BudgetExhausted to stop the import
+            auth: PyGithub ``Auth`` asked for the token on every request instead (GitHub App tokens expire)
+        """
+        # requests comes with PyGithub; imported here so the module loads without it
+        import requests
+
+        self.session = requests.Session()
+        self.session.headers.update({'Accept': IMPORT_MEDIA_TYPE, 'User-Agent': 'issuegen'})
+        if auth is None:
+            self.session.headers['Authorization'] = f'token {token}'
+        self.auth = auth
+        self.repo_url = f"{api_url.rstrip('/')}/repos/{repo_owner}/{repo_name}"
+        self.batch_size = max(1, batch_size)
+        self.poll_interval = poll_interval
+        self.timeout = timeout
+        self.on_request = on_request
+        self._status_listing = True
+        # Why the last import_issues stopped early (the budget refused a request)
+        self.stop_reason: Optional[str] = None
+
+    def _request(self, method: str, path: str, **kwargs) -> Any:
+        if self.on_request is not None:
+            self.on_request(1)
+        if self.auth is not None:
+            kwargs['headers'] = {'Authorization': f'{self.auth.token_type} {self.auth.token}',
+                                 **kwargs.get('headers', {})}
+        response = self.session.request(method, self.repo_url + path, timeout=REQUEST_TIMEOUT, **kwargs)
+        response.raise_for_status()
+        return response.json() if response.content else None
+
+    def import_issues(self, issues: List[Dict[str, Any]]) -> List[Optional[int]]:
+        """
+        Import ``issues`` (the import API's ``issue`` objects)
+
+        Returns the issue number of each one, in order; None where the import
+        failed, did not finish within the timeout, or was not sent because
+        the budget ran out (``stop_reason`` then says why).
+        """
+        import requests
+
+        numbers: List[Optional[int]] = [None] * len(issues)
+        pending: Dict[int, int] = {}  # import id -> index into issues
+        since: Optional[str] = None
+        submitted = 0
+        self.stop_reason = None
+        try:
+            for start in range(0, len(issues), self.batch_size):
+                for index in range(start, min(start + self.batch_size, len(issues))):
+                    submitted = index
+                    try:
+                        status = self._request('POST', '/import/issues', json={'issue': issues[index]})
+                    except requests.RequestException as e:
+                        print(f"❌ Failed to queue import of '{issues[index]['title']}': {e}")
+                        continue
+                    pending[status['id']] = index
+                    # The listing filter takes a date; later imports cannot be older
+                    since = since or (status.get('created_at') or '')[:10] or None
+                submitted = min(start + self.batch_size, len(issues))
+                # GitHub works through this batch while the next one is sent
+                if pending:
+                    self._collect(pending, numbers, issues, since)
+
+            deadline = time.monotonic() + self.timeout
+            while pending and time.monotonic() < deadline:
+                time.sleep(self.poll_interval)
+                self._collect(pending, numbers, issues, since)
+        except BudgetExhausted as e:
+            self.stop_reason = str(e)
+            # Queued imports still complete on GitHub; the next run's duplicate check finds them
+            print(f"⏹️ {e}. Stopped importing: {len(issues) - submitted} issues left for the next run, "
+                  f"{len(pending)} queued ones not confirmed")
+            return numbers
+        for index in pending.values():
+            print(f"⚠️ Import of '{issues[index]['title']}' still pending after {self.timeout:g}s")
+        return numbers
+
+    def _statuses(self, pending: Dict[int, int], since: Optional[str]) -> List[Dict[str, Any]]:
+        """Status of every pending import: one listing, or one request each where listing is unavailable"""
+        import requests
+
+        if self._status_listing and since:
+            try:
+                return self._request('GET', '/import/issues', params={'since': since})
+            except requests.HTTPError as e:
+                if e.response is None or e.response.status_code != 404:
+                    raise
+                self._status_listing = False
+        return [self._request('GET', f'/import/issues/{import_id}') for import_id in list(pending)]
+
+    def _collect(self, pending: Dict[int, int], numbers: List[Optional[int]], issues: List[Dict[str, Any]],
+                 since: Optional[str]) -> None:
+        import requests
+
+        try:
+            statuses = self._statuses(pending, since)
+        except requests.RequestException as e:
+            print(f"⚠️ Could not check import status: {e}")
+            return
+        for status in statuses:
+            index = pending.get(status.get('id'))
+            if index is None:
+                continue
+            if status.get('status') == 'imported':
+                numbers[index] = int(status['issue_url'].rstrip('/').rsplit('/', 1)[1])
+                del pending[status['id']]
+            elif status.get('status') == 'failed':
+                errors = status.get('errors') or []
+                details = "; ".join(f"{e.get('field', '?')}: {e.get('code', e)}" for e in errors) or 'unknown error'
+                print(f"❌ Import of '{issues[index]['title']}' failed: {details}")
+                del pending[status['id']]
+
+    def edit_body(self, number: int, body: str) -> None:
+        self._request('PATCH', f'/issues/{number}', json={'body': body},
+                      headers={'Accept': 'application/vnd.github+json'})
+
+
+@dataclass
+class _Planned:
+    payload: Dict[str, Any]
+    task: Task
+    hours: float
+    signature: Optional[str]
+    label: str  # "issue", "main issue" or "sub-issue", for the progress output
+
+
+class ImportBatch:
+    """
+    Drop-in for ``GitHubIssueGenerator._create_task`` that collects issues
+
+    ``add`` does the same duplicate checks as the per-issue path and queues
+    what should be created; ``finish`` imports everything.
+    """
+
+    def __init__(self, generator):
+        self.generator = generator
+        self.importer: IssueImporter = generator.importer
+        self.importer.on_request = self._draw
+        self.first_wave: List[_Planned] = []
+        # (task, index of its coordination issue in first_wave, milestone, assignee)
+        self.epics: List[Tuple[Task, int, Any, Optional[str]]] = []
+        # Budget room (all, core requests) of the queued tasks, held until finish
+        self.held_calls = 0
+        self.held_core = 0
+
+    def hold(self, cost: Tuple[int, int]) -> None:
+        """Keep a queued task's admitted room reserved until its imports are sent"""
+        self.held_calls += cost[0]
+        self.held_core += cost[1]
+
+    def _draw(self, count: int) -> None:
+        budget = self.generator.budget
+        if budget is None:
+            return
+        if self.held_calls >= count:
+            core = min(count, self.held_core)
+            budget.draw(count, core)
+            self.held_calls -= count
+            self.held_core -= core
+        else:
+            # More status polls than the queued tasks reserved room for
+            budget.spend(count)
+
+    def _release_held(self) -> None:
+        if self.generator.budget is not None and self.held_calls:
+            self.generator.budget.release(self.held_calls, self.held_core)
+        self.held_calls = self.held_core = 0
+
+    def _payload(self, title: str, body: str, labels: List[str], milestone: Any,
+                 assignee: Optional[str]) -> Dict[str, Any]:
+        body, labels = self.generator._flag_similar(title, body, labels)
+        payload: Dict[str, Any] = {'title': title, 'body': body, 'labels': labels}
+        if milestone is not None:
+            payload['milestone'] = milestone.number
+        if assignee:
+            payload['assignee'] = assignee
+        return payload
+
+    def add(self, task: Task, milestones: Dict[str, Any], source, created_issues: List[Dict[str, Any]],
+            skipped_issues: List[str]) -> int:
+        generator = self.generator
+        if generator._task_exists(task):
+            print(f"⏭️ Skipped duplicate issue: {task.title} (signature: {task.signature})")
+            skipped_issues.append(task.title)
+            return 0
+
+        milestone = milestones.get(task.milestone or "")
+        assignee = generator._resolve_assignee(task)
+        if task.subtasks:
+            payload = self._payload(f"{task.title} (Coordination)", generator._epic_description(task),
+                                    (task.labels or []) + ['epic', 'coordination'], milestone, assignee)
+            self.epics.append((task, len(self.first_wave), milestone, assignee))
+            self.first_wave.append(_Planned(payload, task, 0, task.signature, 'main issue'))
+            return 1
+
+        for sub_task in source.expand_task(task) if source is not None else [task]:
+            if sub_task is not task and generator._task_exists(sub_task):
+                print(f"⏭️ Skipped duplicate sub-issue: {sub_task.title} (signature: {sub_task.signature})")
+                skipped_issues.append(sub_task.title)
+                continue
+            payload = self._payload(sub_task.title, sub_task.description, sub_task.labels or [], milestone, assignee)
+            self.first_wave.append(_Planned(payload, sub_task, sub_task.estimated_hours or 0,
+                                            sub_task.signature, 'issue'))
+        return 1
+
+    def _import(self, planned: List[_Planned], created_issues: List[Dict[str, Any]]) -> List[Optional[ImportedIssue]]:
+        if not planned:
+            return []
+        print(f"\n📦 Importing {len(planned)} issues in batches of {self.importer.batch_size}...")
+        with self.generator._stage('import'):
+            numbers = self.importer.import_issues([item.payload for item in planned])
+        html_root = self.generator.repo.html_url
+        imported: List[Optional[ImportedIssue]] = []
+        for item, number in zip(planned, numbers):
+            if number is None:
+                imported.append(None)
+                continue
+            issue = ImportedIssue(number, item.payload['title'], f"{html_root}/issues/{number}", item.payload['body'])
+            imported.append(issue)
+            created_issues.append(self.generator._issue_record(issue, item.task, item.hours, item.signature))
+            print(f"✅ Imported {item.label} #{number}: {issue.title}")
+        return imported
+
+    def finish(self, created_issues: List[Dict[str, Any]], skipped_issues: List[str]) -> None:
+        try:
+            self._finish(created_issues, skipped_issues)
+        finally:
+            self._release_held()
+
+    def _finish(self, created_issues: List[Dict[str, Any]], skipped_issues: List[str]) -> None:
+        import requests
+
+        generator = self.generator
+        first = self._import(self.first_wave, created_issues)
+        if self.importer.stop_reason is not None:
+            orphaned = [first[index].number for _, index, _, _ in self.epics if first[index] is not None]
+            if orphaned:
+                print(f"⚠️ Coordination issues without their sub-issues: "
+                      f"{', '.join(f'#{number}' for number in orphaned)}")
+            return
+
+        second_wave: List[_Planned] = []
+        epic_subs: List[Tuple[ImportedIssue, List[Tuple[int, str]]]] = []
+        for task, index, milestone, assignee in self.epics:
+            main_issue = first[index]
+            if main_issue is None:
+                continue
+            subs: List[Tuple[int, str]] = []
+            for sub_title, subtask_desc in zip(epic_subtask_titles(task), task.subtasks):
+                sub_signature = compute_signature(sub_title, task.phase, task.week)
+                if generator._issue_exists(sub_signature, sub_title, task.phase, task.week):
+                    print(f"⏭️ Skipped duplicate sub-issue: {sub_title} (signature: {sub_signature})")
+                    skipped_issues.append(sub_title)
+                    continue
+                body = generator._sub_issue_description(task, sub_title, subtask_desc, sub_signature,
+                                                        main_issue.number)
+                payload = self._payload(sub_title, body, (task.labels or []) + ['sub-task'], milestone, assignee)
+                # Position in second_wave, resolved to a number once it is imported
+                subs.append((len(second_wave), subtask_desc))
+                second_wave.append(_Planned(payload, task, generator._sub_issue_hours(task), sub_signature,
+                                            'sub-issue'))
+            epic_subs.append((main_issue, subs))
+
+        second = self._import(second_wave, created_issues)
+        if self.importer.stop_reason is not None:
+            return
+        for main_issue, subs in epic_subs:
+            linked = [(second[i].number, desc) for i, desc in subs if second[i] is not None]
+            if not linked:
+                continue
+            try:
+                self.importer.edit_body(main_issue.number, main_issue.body + "\n\n" + sub_issue_section(linked))
+                print(f"✅ Updated main issue #{main_issue.number} with sub-issues links")
+            except requests.RequestException as e:
+                print(f"❌ Failed to link sub-issues on #{main_issue.number}: {e}")
+            except BudgetExhausted as e:
+                print(f"⏹️ {e}. Sub-issue links not added to #{main_issue.number} and later epics")
+                return
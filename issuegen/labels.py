@@ -0,0 +1,73 @@
+"""
+Label definitions shared by the engine and the offline planner
+"""
+
+import re
+from typing import Dict, List
+
+from issuegen.models import Phase, has_estimates
+
+STANDARD_LABELS = [
+    {"name": "high", "color": "d73a4a", "description": "High priority task"},
+    {"name": "medium", "color": "fbca04", "description": "Medium priority task"},
+    {"name": "low", "color": "0075ca", "description": "Low priority task"},
+    {"name": "backend", "color": "1d76db", "description": "Backend development"},
+    {"name": "frontend", "color": "0e8a16", "description": "Frontend development"},
+    {"name": "testing", "color": "5319e7", "description": "Testing related tasks"},
+    {"name": "ui-ux", "color": "f9d0c4", "description": "UI/UX design and implementation"},
+    {"name": "api", "color": "c2e0c6", "description": "API development"},
+    {"name": "database", "color": "fef2c0", "description": "Database related tasks"},
+    {"name": "authentication", "color": "d4c5f9", "description": "Authentication and security"},
+    {"name": "ai-integration", "color": "ff6b6b", "description": "AI and machine learning"},
+    {"name": "devops", "color": "bfd4f2", "description": "DevOps and deployment"},
+    {"name": "integration", "color": "c5def5", "description": "External integrations"},
+    {"name": "development", "color": "7057ff", "description": "General development"},
+    {"name": "documentation", "color": "0052cc", "description": "Documentation tasks"},
+    {"name": "sub-task", "color": "00ccff", "description": "Sub-task of a larger issue"},
+    {"name": "epic", "color": "8b5cf6", "description": "Epic or coordination issue"},
+    {"name": "coordination", "color": "f59e0b", "description": "Coordination task"},
+    {"name": "possible-duplicate", "color": "cfd3d7", "description": "Looks like an existing issue"}
+]
+
+ESTIMATE_HOURS = [1, 2, 3, 4, 5, 8, 12, 16, 24, 40]
+
+WEEK_COLORS = ["e4e669", "c7e9b4", "7fcdbb", "41b6c4", "1d91c0",
+               "225ea8", "253494", "081d58", "f03b20", "bd0026"]
+
+PHASE_NUMBER_RE = re.compile(r'Phase (\d+)')
+
+
+def build_label_specs(phases: List[Phase]) -> List[Dict[str, str]]:
+    """Every label a run over ``phases`` may need"""
+    labels = list(STANDARD_LABELS)
+
+    if has_estimates(phases):
+        for hours in ESTIMATE_HOURS:
+            labels.append({
+                "name": f"estimate-{hours}h",
+                "color": "e5e7eb",
+                "description": f"Estimated {hours} hours of work"
+            })
+        labels.append({
+            "name": "estimate-unknown",
+            "color": "9ca3af",
+            "description": "Time estimate not provided"
+        })
+
+    for phase in phases:
+        phase_match = PHASE_NUMBER_RE.search(phase.name)
+        phase_num = phase_match.group(1) if phase_match else "unknown"
+        labels.append({
+            "name": f"phase-{phase_num}",
+            "color": "b60205" if "Backend" in phase.name or "Infrastructure" in phase.name else "0e8a16",
+            "description": f"{phase.name}"
+        })
+
+    max_weeks = max([phase.duration_weeks for phase in phases] + [10])
+    for i in range(1, max_weeks + 1):
+        labels.append({
+            "name": f"week-{i}",
+            "color": WEEK_COLORS[(i - 1) % len(WEEK_COLORS)],
+            "description": f"Week {i} tasks"
+        })
+    return labels
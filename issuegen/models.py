@@ -0,0 +1,57 @@
+"""
+Roadmap data structures shared by every source adapter
+"""
+
+from dataclasses import dataclass
+from typing import Iterable, List, Optional
+
+
+@dataclass
+class Task:
+    """Task data structure"""
+    title: str
+    description: str
+    phase: str
+    week: int
+    day_range: str
+    category: str
+    priority: str = "medium"
+    labels: Optional[List[str]] = None
+    assignee: Optional[str] = None
+    milestone: Optional[str] = None
+    estimated_hours: Optional[float] = None
+    subtasks: Optional[List[str]] = None
+    signature: Optional[str] = None
+    # Baseline MD5 marker when it is not the MD5 of ``title`` (split sub-issues)
+    legacy_signature: Optional[str] = None
+
+    def __post_init__(self):
+        if self.labels is None:
+            self.labels = []
+        if self.subtasks is None:
+            self.subtasks = []
+
+
+@dataclass
+class Phase:
+    """Phase data structure"""
+    name: str
+    description: str
+    duration_weeks: int
+    tasks: List[Task]
+    labels: List[str]
+    goals: Optional[List[str]] = None
+
+    def __post_init__(self):
+        if self.goals is None:
+            self.goals = []
+
+
+def has_estimates(phases: Iterable[Phase]) -> bool:
+    """True if any task carries an hour estimate (YAML roadmaps)"""
+    return any(task.estimated_hours is not None for phase in phases for task in phase.tasks)
+
+
+def epic_subtask_titles(task: Task) -> List[str]:
+    """Issue titles of the sub-issues created under a YAML task's coordination issue"""
+    return [f"Subtask {i}: {subtask} (part of {task.title})" for i, subtask in enumerate(task.subtasks or [], 1)]
@@ -0,0 +1,180 @@
+"""
+Streaming issue creation: parse -> setup -> dedup -> render -> submit
+خط لوله‌ی همزمان ساخت ایشوها
+
+Each stage is a coroutine connected to the next by a bounded ``asyncio.Queue``,
+so at most ``queue_size`` items wait between two stages and a slow stage
+throttles the ones before it. Parsing and every blocking PyGithub call run in
+worker threads (``asyncio.to_thread``), which lets the duplicate search for
+one task overlap the creation of the previous one while the next phase is
+still being parsed.
+
+Stages, in order:
+
+* parse  - pulls phases from ``source.iter_phases`` as each one is complete
+* setup  - creates the phase's labels and milestone before its tasks move on
+* dedup  - drops tasks whose signature is already on GitHub; applies max_tasks
+           and the run budget (``issuegen.budget``)
+* render - expands tasks into the issues to create (e.g. the auth split)
+* submit - creates issues and epics, one request at a time
+"""
+
+import asyncio
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from issuegen.budget import BudgetExhausted, estimate_task_calls
+from issuegen.defaults import DEFAULT_QUEUE_SIZE
+from issuegen.models import Phase, Task
+from issuegen.signature import compute_signatures
+from issuegen.sources.base import RoadmapSource
+
+_DONE = object()
+
+
+class IssuePipeline:
+    """Runs ``create_labels`` / ``create_milestones`` / ``create_issues`` as overlapping stages"""
+
+    def __init__(self, generator, source: RoadmapSource, max_tasks: Optional[int] = None,
+                 queue_size: int = DEFAULT_QUEUE_SIZE):
+        """
+        Args:
+            generator: GitHubIssueGenerator doing the actual requests
+            source: Adapter whose ``expand_task`` splits tasks into issues
+            max_tasks: Stop creating after this many non-duplicate tasks
+            queue_size: Items allowed to wait between two stages
+        """
+        self.generator = generator
+        self.source = source
+        self.max_tasks = max_tasks
+        self.queue_size = queue_size
+        self.phases: List[Phase] = []
+        self.created_issues: List[Dict[str, Any]] = []
+        self.skipped_issues: List[str] = []
+
+    async def run(self, phases: Iterable[Phase]) -> List[Dict[str, Any]]:
+        """Push ``phases`` (any iterable, typically a lazy parser) through every stage"""
+        phase_queue: asyncio.Queue = asyncio.Queue(self.queue_size)
+        task_queue: asyncio.Queue = asyncio.Queue(self.queue_size)
+        render_queue: asyncio.Queue = asyncio.Queue(self.queue_size)
+        submit_queue: asyncio.Queue = asyncio.Queue(self.queue_size)
+
+        stages = [
+            self._parse(iter(phases), phase_queue),
+            self._setup(phase_queue, task_queue),
+            self._dedup(task_queue, render_queue),
+            self._render(render_queue, submit_queue),
+            self._submit(submit_queue),
+        ]
+        await _run_stages(stages)
+        self.generator.print_issue_summary(self.phases, self.created_issues, self.skipped_issues)
+        return self.created_issues
+
+    async def _parse(self, phases: Iterator[Phase], out: asyncio.Queue) -> None:
+        while True:
+            phase = await asyncio.to_thread(next, phases, _DONE)
+            if phase is _DONE:
+                break
+            self.phases.append(phase)
+            await out.put(phase)
+        await out.put(_DONE)
+
+    async def _setup(self, queue: asyncio.Queue, out: asyncio.Queue) -> None:
+        generator = self.generator
+        stopped = False
+        while (phase := await queue.get()) is not _DONE:
+            if stopped:
+                continue
+            try:
+                await asyncio.to_thread(generator.create_labels, [phase])
+                milestones = await asyncio.to_thread(generator.create_milestones, [phase])
+            except BudgetExhausted as e:
+                # No task can be admitted either; the remaining phases are only read
+                print(f"⏹️ {e}. Skipping setup of the remaining phases.")
+                stopped = True
+                continue
+            print(f"\n🚀 Processing issues for {phase.name}...")
+            # Tasks loaded from older JSON caches may not carry a signature yet
+            compute_signatures(phase.tasks)
+            for task in phase.tasks:
+                await out.put((task, milestones.get(task.milestone or "")))
+        await out.put(_DONE)
+
+    async def _dedup(self, queue: asyncio.Queue, out: asyncio.Queue) -> None:
+        task_count = 0
+        budget = self.generator.budget
+        stopped = False
+        while (item := await queue.get()) is not _DONE:
+            if stopped or (self.max_tasks is not None and task_count >= self.max_tasks):
+                # Keep draining so labels and milestones still cover every phase,
+                # exactly like the sequential run
+                continue
+            task, milestone = item
+            cost = estimate_task_calls(task, self.source, self.generator.create_retries)
+            if budget is not None and not budget.admit(*cost):
+                # Tasks already admitted further down the pipeline still finish
+                print(f"⏹️ {budget.stop_reason}. Stopping issue creation.")
+                stopped = True
+                continue
+            if await asyncio.to_thread(self.generator._task_exists, task):
+                print(f"⏭️ Skipped duplicate issue: {task.title} (signature: {task.signature})")
+                self.skipped_issues.append(task.title)
+                if budget is not None:
+                    budget.release(*cost)
+                continue
+            task_count += 1
+            if self.max_tasks is not None and task_count == self.max_tasks:
+                print(f"⏹️ Reached maximum task limit ({self.max_tasks}). Stopping issue creation.")
+            await out.put((task, milestone, cost))
+        await out.put(_DONE)
+
+    async def _render(self, queue: asyncio.Queue, out: asyncio.Queue) -> None:
+        while (item := await queue.get()) is not _DONE:
+            task, milestone, cost = item
+            assignee = await asyncio.to_thread(self.generator._resolve_assignee, task)
+            to_create = [task] if task.subtasks else self.source.expand_task(task)
+            await out.put((task, to_create, milestone, assignee, cost))
+        await out.put(_DONE)
+
+    async def _submit(self, queue: asyncio.Queue) -> None:
+        while (item := await queue.get()) is not _DONE:
+            await asyncio.to_thread(self._submit_one, *item)
+
+    def _submit_one(self, task: Task, to_create: List[Task], milestone: Any, assignee: Optional[str],
+                    cost: Tuple[int, int]) -> None:
+        try:
+            self._submit_task(task, to_create, milestone, assignee)
+        finally:
+            if self.generator.budget is not None:
+                self.generator.budget.release(*cost)
+
+    def _submit_task(self, task: Task, to_create: List[Task], milestone: Any, assignee: Optional[str]) -> None:
+        generator = self.generator
+        if task.subtasks:
+            generator._create_epic(task, milestone, assignee, self.created_issues, self.skipped_issues)
+            return
+        for sub_task in to_create:
+            # An unsplit task was already checked by the dedup stage
+            if sub_task is not task and generator._task_exists(sub_task):
+                print(f"⏭️ Skipped duplicate sub-issue: {sub_task.title} (signature: {sub_task.signature})")
+                self.skipped_issues.append(sub_task.title)
+                continue
+            generator._create_task_issue(sub_task, milestone, assignee, self.created_issues)
+
+
+async def _run_stages(stages: List) -> None:
+    """Run every stage; if one fails, cancel the rest instead of leaving them blocked on a queue"""
+    tasks = [asyncio.create_task(stage) for stage in stages]
+    done, pending = await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+    for task in pending:
+        task.cancel()
+    await asyncio.gather(*pending, return_exceptions=True)
+    for task in done:
+        task.result()
+
+
+def run_pipeline(generator, source: RoadmapSource, phases: Iterable[Phase], max_tasks: Optional[int] = None,
+                 queue_size: int = DEFAULT_QUEUE_SIZE) -> Tuple[List[Phase], List[Dict[str, Any]]]:
+    """Blocking entry point: returns the parsed phases and the created issue records"""
+    pipeline = IssuePipeline(generator, source, max_tasks, queue_size)
+    created_issues = asyncio.run(pipeline.run(phases))
+    return pipeline.phases, created_issues
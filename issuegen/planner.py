@@ -0,0 +1,275 @@
+"""
+Offline planner for --dry-run: API calls and estimated wall time
+برنامه‌ریزی آفلاین: تعداد درخواست‌ها و زمان تقریبی اجرا
+
+The planner walks the parsed phases the same way ``create_issues`` does and
+counts every request the engine would send, using the repository state cache
+for what is already known (labels, milestones, signatures). It never touches
+the network. Setup requests (repository lookup, conventions document,
+--refresh-state and similarity listings) are counted too; the conventions
+create and the Issue Import API status polls depend on what the repository
+holds at run time, so they are counted at their upper and lower bound and
+called out in the plan.
+"""
+
+import math
+import time
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+from issuegen.labels import build_label_specs
+from issuegen.models import Phase, Task, epic_subtask_titles
+from issuegen.signature import compute_signature, compute_signatures, legacy_signature
+from issuegen.sources.base import RoadmapSource
+from issuegen.state import RepoStateCache
+
+# Documented GitHub REST limits for a personal access token
+CORE_LIMIT_PER_HOUR = 5000
+SEARCH_LIMIT_PER_MINUTE = 30
+CONTENT_LIMIT_PER_MINUTE = 80
+CONTENT_LIMIT_PER_HOUR = 500
+PAGE_SIZE = 30  # PyGithub default per_page for listings
+DEFAULT_REQUEST_LATENCY = 0.4  # seconds per request, sequential client
+
+
+@dataclass
+class RunPlan:
+    """Requests a real run would make, grouped the way GitHub rate-limits them"""
+    repo_lookups: int = 0
+    conventions_requests: int = 0
+    issue_listings: int = 0
+    label_listings: int = 0
+    label_creates: int = 0
+    milestone_listings: int = 0
+    milestone_creates: int = 0
+    collaborator_listings: int = 0
+    searches: int = 0
+    issue_creates: int = 0
+    issue_edits: int = 0
+    # --backend import: status polls, at least one per batch
+    import_polls: int = 0
+    import_batch_size: Optional[int] = None
+    known_duplicates: int = 0
+    tasks_planned: int = 0
+    state_complete: bool = False
+    core_remaining: int = CORE_LIMIT_PER_HOUR
+    core_reset_in: float = 3600.0
+    request_latency: float = DEFAULT_REQUEST_LATENCY
+    notes: List[str] = field(default_factory=list)
+
+    @property
+    def core_calls(self) -> int:
+        return (self.repo_lookups + self.conventions_requests + self.issue_listings
+                + self.label_listings + self.label_creates + self.milestone_listings + self.milestone_creates
+                + self.collaborator_listings + self.issue_creates + self.issue_edits + self.import_polls)
+
+    @property
+    def content_calls(self) -> int:
+        """Requests that create content and count against the secondary limits"""
+        return (self.label_creates + self.milestone_creates + self.issue_creates + self.issue_edits
+                + max(0, self.conventions_requests - 1))
+
+    @property
+    def total_calls(self) -> int:
+        return self.core_calls + self.searches
+
+    def estimate_seconds(self) -> float:
+        """Lower bound on wall time: the slowest of latency and each rate limit"""
+        latency = self.total_calls * self.request_latency
+        search = max(0, self.searches - SEARCH_LIMIT_PER_MINUTE) / SEARCH_LIMIT_PER_MINUTE * 60
+        content = self.content_calls / CONTENT_LIMIT_PER_MINUTE * 60
+        content_hours = math.ceil(self.content_calls / CONTENT_LIMIT_PER_HOUR) - 1
+        if content_hours > 0:
+            content = max(content, content_hours * 3600)
+        core = 0.0
+        if self.core_calls > self.core_remaining:
+            extra_windows = math.ceil((self.core_calls - self.core_remaining) / CORE_LIMIT_PER_HOUR) - 1
+            core = self.core_reset_in + extra_windows * 3600
+        return max(latency, search, content, core)
+
+    def hourly_windows(self) -> int:
+        """How many rate-limit hours the run spans"""
+        return max(1, math.ceil(self.estimate_seconds() / 3600))
+
+    def format(self) -> str:
+        seconds = self.estimate_seconds()
+        lines = [
+            "📊 API plan (no requests sent):",
+            f"  Repository:    {self.repo_lookups} lookup",
+        ]
+        if self.conventions_requests:
+            lines.append(f"  Conventions:   1 lookup + up to {self.conventions_requests - 1} create")
+        if self.issue_listings:
+            lines.append(f"  Issue list:    {self.issue_listings} pages (--refresh-state / --similarity-threshold)")
+        lines += [
+            f"  Labels:        {self.label_listings} listing + {self.label_creates} creates",
+            f"  Milestones:    {self.milestone_listings} listing + {self.milestone_creates} creates",
+            f"  Collaborators: {self.collaborator_listings} listing",
+            f"  Searches:      {self.searches} duplicate checks",
+            f"  Issues:        {self.issue_creates} creates + {self.issue_edits} edits "
+            f"({self.tasks_planned} tasks, {self.known_duplicates} known duplicates skipped)",
+        ]
+        if self.import_batch_size is not None:
+            lines.append(f"  Import polls:  at least {self.import_polls} "
+                         f"(batches of {self.import_batch_size}; more while GitHub is still importing)")
+        lines += [
+            f"  Total:         {self.total_calls} requests "
+            f"({self.core_calls} core of {self.core_remaining} remaining, {self.content_calls} content-creating)",
+            f"⏱️ Estimated wall time: {_format_duration(seconds)} across {self.hourly_windows()} rate-limit hour(s)",
+        ]
+        lines.extend(f"⚠️ {note}" for note in self.notes)
+        return "\n".join(lines)
+
+
+def _format_duration(seconds: float) -> str:
+    if seconds < 60:
+        return f"{seconds:.0f}s"
+    minutes, seconds = divmod(int(seconds), 60)
+    if minutes < 60:
+        return f"{minutes}m {seconds:02d}s"
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}h {minutes:02d}m"
+
+
+def _pages(count: int) -> int:
+    return max(1, math.ceil(count / PAGE_SIZE))
+
+
+class _SignatureCheck:
+    """Mirrors ``GitHubIssueGenerator._issue_exists`` against the cache only"""
+
+    def __init__(self, plan: RunPlan, state: Optional[RepoStateCache], legacy_signatures: bool,
+                 trust_state: bool):
+        self.plan = plan
+        self.state = state
+        self.legacy_signatures = legacy_signatures
+        self.skip_search = trust_state and plan.state_complete
+
+    def exists(self, signature: str, title: str, phase: str, week: int, legacy: Optional[str] = None) -> bool:
+        if not self.legacy_signatures:
+            legacy = None
+        elif legacy is None:
+            legacy = legacy_signature(title, phase, week)
+        if self.state is not None and self.state.knows_signature(signature, legacy):
+            return True
+        if not self.skip_search:
+            # Assume the search misses: anything it would find is a saved create
+            self.plan.searches += 1
+        return False
+
+
+def plan_run(phases: List[Phase], state: Optional[RepoStateCache] = None,
+             source: Optional[RoadmapSource] = None, max_tasks: Optional[int] = None,
+             legacy_signatures: bool = True, trust_state: bool = False,
+             request_latency: float = DEFAULT_REQUEST_LATENCY,
+             rate_limit_remaining: Optional[int] = None, conventions_doc: bool = False,
+             refresh_state: bool = False, similarity_index: bool = False,
+             import_batch_size: Optional[int] = None) -> RunPlan:
+    """
+    Count the requests labels -> milestones -> issues would send
+
+    Args:
+        phases: Parsed roadmap
+        state: Cached repository state (None plans against an empty repository)
+        source: Adapter whose ``expand_task`` splits tasks into issues
+        max_tasks: Same limit as ``create_issues``
+        legacy_signatures: Whether legacy MD5 markers also count as duplicates
+        trust_state: Plan without searches when the cache holds a full listing
+        request_latency: Assumed seconds per request
+        rate_limit_remaining: Override for the cached core rate limit
+        conventions_doc: The run checks for (and creates) the lean-body conventions document
+        refresh_state: The run starts with a --refresh-state listing
+        similarity_index: The run lists every issue title for --similarity-threshold
+        import_batch_size: Batch size of --backend import (None for create_issue)
+    """
+    plan = RunPlan(request_latency=request_latency, import_batch_size=import_batch_size)
+    plan.repo_lookups = 1
+    if conventions_doc:
+        plan.conventions_requests = 2
+    plan.state_complete = state is not None and state.complete_at is not None
+    if state is None or state.updated_at is None:
+        plan.notes.append("No state cache for this repository; planning against an empty repository")
+    elif not plan.state_complete:
+        plan.notes.append("State cache has no full issue listing; run with --refresh-state for exact search counts")
+
+    _plan_rate_limit(plan, state, rate_limit_remaining)
+
+    specs = build_label_specs(phases)
+    known_labels = set(state.labels or []) if state is not None else set()
+    plan.label_listings = _pages(len(known_labels))
+    plan.label_creates = sum(1 for spec in specs if spec["name"] not in known_labels)
+
+    known_milestones = (state.milestones or {}) if state is not None else {}
+    plan.milestone_listings = _pages(len(known_milestones))
+    plan.milestone_creates = sum(1 for phase in phases if phase.name not in known_milestones)
+
+    compute_signatures(task for phase in phases for task in phase.tasks)
+    check = _SignatureCheck(plan, state, legacy_signatures, trust_state)
+    if max_tasks is None:
+        max_tasks = sum(len(phase.tasks) for phase in phases)
+
+    needs_collaborators = False
+    for phase in phases:
+        for task in phase.tasks:
+            if plan.tasks_planned >= max_tasks:
+                break
+            if check.exists(task.signature, task.title, task.phase, task.week, task.legacy_signature):
+                plan.known_duplicates += 1
+                continue
+            plan.tasks_planned += 1
+            needs_collaborators = needs_collaborators or bool(task.assignee)
+            if task.subtasks:
+                _plan_epic(plan, check, task)
+                continue
+            to_create = source.expand_task(task) if source is not None else [task]
+            for sub_task in to_create:
+                if sub_task is not task and check.exists(sub_task.signature, sub_task.title, sub_task.phase,
+                                                         sub_task.week, sub_task.legacy_signature):
+                    plan.known_duplicates += 1
+                    continue
+                plan.issue_creates += 1
+
+    # Full issue listings; the cache knows the signed issues, so this is a lower bound
+    known_issues = len(state.signatures) if state is not None else 0
+    plan.issue_listings = (int(refresh_state) + int(similarity_index)) * _pages(known_issues)
+    if plan.issue_listings and (state is None or not plan.state_complete):
+        plan.notes.append("Issue listings are sized from the cached signatures; unsigned issues add pages")
+    if import_batch_size is not None and plan.issue_creates:
+        # Epics import in two waves (coordination issues, then their sub-issues)
+        waves = 2 if plan.issue_edits else 1
+        plan.import_polls = waves * math.ceil(plan.issue_creates / max(1, import_batch_size))
+
+    if needs_collaborators:
+        known = (state.collaborators or []) if state is not None else []
+        plan.collaborator_listings = _pages(len(known))
+    return plan
+
+
+def _plan_epic(plan: RunPlan, check: _SignatureCheck, task: Task) -> None:
+    plan.issue_creates += 1
+    created_subs = 0
+    for sub_title in epic_subtask_titles(task):
+        if check.exists(compute_signature(sub_title, task.phase, task.week), sub_title, task.phase, task.week):
+            plan.known_duplicates += 1
+            continue
+        plan.issue_creates += 1
+        created_subs += 1
+    if created_subs:
+        plan.issue_edits += 1
+
+
+def _plan_rate_limit(plan: RunPlan, state: Optional[RepoStateCache], override: Optional[int]) -> None:
+    if override is not None:
+        plan.core_remaining = override
+        return
+    cached = state.rate_limit if state is not None else None
+    if not cached:
+        return
+    reset = cached.get('reset')
+    now = time.time()
+    if reset and reset > now:
+        plan.core_remaining = cached.get('remaining', CORE_LIMIT_PER_HOUR)
+        plan.core_reset_in = reset - now
+    else:
+        # The window seen last time has rolled over
+        plan.core_remaining = cached.get('limit') or CORE_LIMIT_PER_HOUR
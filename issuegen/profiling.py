@@ -0,0 +1,174 @@
+"""
+--profile: per-stage timings, optional cProfile and tracemalloc snapshots
+پروفایل زمان و حافظه‌ی هر مرحله از اجرا
+
+``StageProfiler.stage`` times a named block. Stages opened inside another
+stage on the same thread are reported under its path (``issues/dedup``), so
+the table shows both where the run spends its time and how the total splits
+up. Work done in pipeline worker threads has no parent stage and is summed
+across threads, which can exceed the wall time of the run.
+
+Issue descriptions are rendered while parsing (Markdown) or while creating
+(YAML epics); the ``render_*`` helpers are wrapped for the duration of the
+run so that time shows up as its own ``render`` stage wherever it happens.
+"""
+
+import io
+import sys
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from datetime import datetime
+from typing import Any, Callable, ContextManager, Dict, List, Optional
+
+# Modules that bind the render helpers with ``from issuegen.render import ...``
+RENDER_FUNCTIONS = ('render_markdown_description', 'render_yaml_description')
+RENDER_MODULES = ('issuegen.render', 'issuegen.sources.markdown', 'issuegen.sources.yaml_file', 'issuegen.engine')
+CPROFILE_TOP = 30
+
+
+class StageProfiler:
+    """Collects stage timings for one run and writes them as a Markdown report"""
+
+    def __init__(self, use_cprofile: bool = False, tracemalloc_top: int = 0):
+        """
+        Args:
+            use_cprofile: Also run the whole run under cProfile (slows it down noticeably)
+            tracemalloc_top: Report this many top allocation sites (0 = do not trace memory)
+        """
+        self.use_cprofile = use_cprofile
+        self.tracemalloc_top = tracemalloc_top
+        self.stages: Dict[str, List[float]] = {}
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        # cProfile.Profile / tracemalloc.Snapshot; both modules are imported only when asked for
+        self._profile: Optional[Any] = None
+        self._snapshot: Optional[Any] = None
+        self._traced_peak = 0
+        self._started = 0.0
+        self.elapsed = 0.0
+
+    @contextmanager
+    def stage(self, name: str):
+        stack = getattr(self._local, 'stack', None)
+        if stack is None:
+            stack = self._local.stack = []
+        stack.append(name)
+        path = '/'.join(stack)
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            duration = time.perf_counter() - started
+            stack.pop()
+            with self._lock:
+                totals = self.stages.setdefault(path, [0, 0.0])
+                totals[0] += 1
+                totals[1] += duration
+
+    def _timed(self, func: Callable, name: str) -> Callable:
+        def wrapper(*args, **kwargs):
+            with self.stage(name):
+                return func(*args, **kwargs)
+        wrapper.__wrapped__ = func
+        return wrapper
+
+    def _instrument_render(self) -> None:
+        import issuegen.render  # noqa: F401  (so later imports bind the wrapped helpers)
+        for module_name in RENDER_MODULES:
+            module = sys.modules.get(module_name)
+            for func_name in RENDER_FUNCTIONS:
+                func = getattr(module, func_name, None) if module is not None else None
+                if func is not None:
+                    setattr(module, func_name, self._timed(func, 'render'))
+
+    def start(self) -> None:
+        self._instrument_render()
+        if self.tracemalloc_top:
+            import tracemalloc
+            tracemalloc.start()
+        if self.use_cprofile:
+            import cProfile
+            self._profile = cProfile.Profile()
+            self._profile.enable()
+        self._started = time.perf_counter()
+
+    def stop(self) -> None:
+        self.elapsed = time.perf_counter() - self._started
+        if self._profile is not None:
+            self._profile.disable()
+        if self.tracemalloc_top:
+            import tracemalloc
+            if tracemalloc.is_tracing():
+                self._snapshot = tracemalloc.take_snapshot()
+                self._traced_peak = tracemalloc.get_traced_memory()[1]
+                tracemalloc.stop()
+        # Modules imported during the run bound the wrapper too; they get the original back
+        for module_name in RENDER_MODULES:
+            module = sys.modules.get(module_name)
+            for func_name in RENDER_FUNCTIONS:
+                func = getattr(module, func_name, None) if module is not None else None
+                if func is not None and hasattr(func, '__wrapped__'):
+                    setattr(module, func_name, func.__wrapped__)
+
+    def format(self, command: str = '') -> str:
+        lines = [
+            "# Profile report",
+            "",
+            f"**Date:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+        ]
+        if command:
+            lines.append(f"**Command:** `{command}`")
+        lines.append(f"**Wall time:** {self.elapsed:.3f}s")
+        peak_rss = _peak_rss_mib()
+        if peak_rss is not None:
+            lines.append(f"**Peak RSS:** {peak_rss:.1f} MiB")
+        lines += [
+            "",
+            "## Stages",
+            "",
+            "| Stage | Calls | Total (s) | Mean (ms) | % of run |",
+            "|-------|------:|----------:|----------:|---------:|",
+        ]
+        for path in sorted(self.stages):
+            calls, total = self.stages[path]
+            share = total / self.elapsed * 100 if self.elapsed else 0.0
+            lines.append(f"| {path} | {calls} | {total:.3f} | {total / calls * 1000:.2f} | {share:.1f} |")
+
+        if self._profile is not None:
+            import pstats
+            buffer = io.StringIO()
+            pstats.Stats(self._profile, stream=buffer).sort_stats('cumulative').print_stats(CPROFILE_TOP)
+            lines += ["", f"## cProfile (top {CPROFILE_TOP} by cumulative time)", "", "```",
+                      buffer.getvalue().strip(), "```"]
+
+        if self._snapshot is not None:
+            lines += ["", f"## Top {self.tracemalloc_top} allocation sites", "",
+                      f"Peak traced memory: {self._traced_peak / 1024 / 1024:.1f} MiB", "", "```"]
+            for stat in self._snapshot.statistics('lineno')[:self.tracemalloc_top]:
+                lines.append(str(stat))
+            lines.append("```")
+        return "\n".join(lines) + "\n"
+
+    def write(self, path: str, command: str = '') -> None:
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(self.format(command))
+        if self._profile is not None:
+            # Raw stats for snakeviz / pstats
+            self._profile.dump_stats(f"{path}.prof")
+
+
+def profile_stage(profiler: Optional[StageProfiler], name: str) -> ContextManager:
+    """``profiler.stage(name)``, or a no-op when the run is not being profiled"""
+    return profiler.stage(name) if profiler is not None else nullcontext()
+
+
+def _peak_rss_mib() -> Optional[float]:
+    try:
+        import resource
+    except ImportError:
+        # Not available on Windows
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Kilobytes on Linux, bytes on macOS
+    return peak / 1024 / 1024 if sys.platform == 'darwin' else peak / 1024
@@ -0,0 +1,42 @@
+"""
+Find issues whose task is no longer in the roadmap
+پاک‌سازی ایشوهای تسک‌های حذف‌شده از نقشه راه
+
+An issue is orphaned when the signature in its body is not produced by any
+task of the current parse. The roadmap side is computed here, offline; the
+engine does the one listing and the edits (``find_orphans`` / ``prune_issues``).
+"""
+
+from typing import Iterable, Optional, Set
+
+from issuegen.models import Phase, epic_subtask_titles
+from issuegen.signature import compute_signature, compute_signatures, legacy_signature
+from issuegen.sources.base import RoadmapSource
+
+PRUNE_ACTIONS = ('close', 'lock', 'relabel')
+DEFAULT_PRUNE_LABEL = 'obsolete'
+DEFAULT_PRUNE_WORKERS = 4
+
+
+def roadmap_signatures(phases: Iterable[Phase], source: Optional[RoadmapSource] = None,
+                       legacy_signatures: bool = True) -> Set[str]:
+    """Every signature the roadmap's issues carry: tasks, split sub-issues and epic sub-issues"""
+    signatures: Set[str] = set()
+
+    def add(title: str, phase: str, week: int, signature: Optional[str] = None, legacy: Optional[str] = None) -> None:
+        signatures.add(signature or compute_signature(title, phase, week))
+        if legacy_signatures:
+            signatures.add(legacy or legacy_signature(title, phase, week))
+
+    for phase in phases:
+        compute_signatures(phase.tasks)
+        for task in phase.tasks:
+            add(task.title, task.phase, task.week, task.signature, task.legacy_signature)
+            for sub_title in epic_subtask_titles(task):
+                add(sub_title, task.phase, task.week)
+            if source is not None and not task.subtasks:
+                for sub_task in source.expand_task(task):
+                    if sub_task is not task:
+                        add(sub_task.title, sub_task.phase, sub_task.week, sub_task.signature,
+                            sub_task.legacy_signature)
+    return signatures
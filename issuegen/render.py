@@ -0,0 +1,190 @@
+"""
+Issue body templates for generated tasks
+قالب توضیحات ایشوها
+
+Full bodies repeat the same acceptance criteria, technical notes, closing
+instructions and definition of done in every issue (most of each body).
+Given a ``conventions_url``, the templates render lean bodies instead: only
+the task-specific fields, the signature marker and a link to one shared
+conventions document (``render_conventions``).
+"""
+
+from typing import List, Optional
+
+from issuegen.signature import signature_marker
+
+
+CONVENTIONS_PATH = 'docs/ISSUE_CONVENTIONS.md'
+
+
+def render_conventions() -> str:
+    """The shared document lean bodies link to, holding what full bodies repeat"""
+    return """# Issue Conventions
+
+Every issue generated from the roadmap follows these conventions. Issue
+bodies only describe the task itself and link here.
+
+## Acceptance Criteria
+- [ ] Code implementation completed according to specifications
+- [ ] Unit tests written with >80% coverage
+- [ ] Integration tests implemented and passing
+- [ ] Code review completed and approved
+- [ ] Documentation updated (API docs, README, comments)
+- [ ] Security review completed (if applicable)
+- [ ] Performance benchmarks met (if applicable)
+
+## Technical Requirements
+- Follow Clean Architecture principles
+- Implement comprehensive error handling
+- Add structured logging with appropriate levels
+- Ensure security best practices are followed
+- Write maintainable and readable code
+- Follow project coding standards and conventions
+
+## Definition of Done
+- ✅ All acceptance criteria met
+- ✅ All tests passing
+- ✅ Code reviewed and approved
+- ✅ Documentation updated and reviewed
+- ✅ No blocking bugs or security issues
+- ✅ Performance meets requirements
+
+## Closing an Issue
+Include one of these keywords followed by the issue number in the commit message:
+- `close`, `closes`, `closed`
+- `fix`, `fixes`, `fixed`
+- `resolve`, `resolves`, `resolved`
+
+Example: `git commit -m "Implement the login endpoint, closes #42"`
+
+The commit must be pushed to the default branch (main/master) to trigger automatic closure.
+"""
+
+
+def _conventions_link(conventions_url: str) -> str:
+    return f"Acceptance criteria, technical requirements, closing keywords and definition of done: " \
+           f"[issue conventions]({conventions_url})"
+
+
+def render_markdown_description(task_title: str, phase_name: str, week_number: int,
+                                week_title: str, signature: str, conventions_url: Optional[str] = None) -> str:
+    """Generate detailed task description with unique signature (lean with ``conventions_url``)"""
+    if conventions_url:
+        return (f"{signature_marker(signature)}\n"
+                f"**Phase:** {phase_name}\n**Week:** Week {week_number} - {week_title}\n\n"
+                f"{task_title}\n\n{_conventions_link(conventions_url)}\n")
+    return f"""{signature_marker(signature)}
+
+## Task Description
+**Phase:** {phase_name}
+**Week:** Week {week_number} - {week_title}
+
+### Task Details
+{task_title}
+
+### Acceptance Criteria
+- [ ] Code implementation completed
+- [ ] Unit tests written (>80% coverage)
+- [ ] Code review completed
+- [ ] Documentation updated
+- [ ] Integration tests passed
+
+### Technical Notes
+- Follow Clean Architecture principles
+- Implement proper error handling
+- Add comprehensive logging
+- Ensure security best practices
+
+### Closing the Issue
+- To close this issue, include one of these keywords in your commit message followed by the issue number:
+  - `close`, `closes`, `closed`, `fix`, `fixes`, `fixed`, `resolve`, `resolves`, `resolved`
+- Example: `git commit -m "Implement {task_title}, closes #<issue_number>"`
+- Push to the default branch (e.g., main) to trigger automatic closure.
+
+### Definition of Done
+- ✅ Feature implemented according to requirements
+- ✅ All tests passing
+- ✅ Code reviewed and approved
+- ✅ Documentation updated
+- ✅ No critical bugs
+    """
+
+
+def render_yaml_description(title: str, description: str, phase_name: str,
+                            week_title: str, week_number: int, category: str,
+                            estimated_hours: float, subtasks: List[str],
+                            project_name: str, signature: str, conventions_url: Optional[str] = None) -> str:
+    """Generate detailed task description from YAML data with unique signature (lean with ``conventions_url``)"""
+    if conventions_url:
+        estimate = f" · **Estimated Hours:** {estimated_hours}" if estimated_hours > 0 else ""
+        body = (f"{signature_marker(signature)}\n"
+                f"**Project:** {project_name} · **Phase:** {phase_name}\n"
+                f"**Week:** Week {week_number} - {week_title} · **Category:** {category}{estimate}\n\n")
+        if description and description != title:
+            body += f"{description}\n\n"
+        body += f"**Goal:** {title}\n"
+        if subtasks:
+            body += "\n### Subtasks\n" + "".join(f"- [ ] {subtask}\n" for subtask in subtasks)
+        return body + f"\n{_conventions_link(conventions_url)}\n"
+
+    subtasks_section = ""
+    if subtasks:
+        subtasks_section = f"""
+### Subtasks
+"""
+        for i, subtask in enumerate(subtasks, 1):
+            subtasks_section += f"- [ ] {subtask}\n"
+
+    estimate_section = f"**Estimated Hours:** {estimated_hours} hours\n" if estimated_hours > 0 else ""
+
+    return f"""{signature_marker(signature)}
+
+## Task Overview
+**Project:** {project_name}
+**Phase:** {phase_name}
+**Week:** Week {week_number} - {week_title}
+**Category:** {category}
+{estimate_section}
+
+### Task Description
+{description}
+
+### Primary Goal
+{title}
+{subtasks_section}
+
+### Acceptance Criteria
+- [ ] Code implementation completed according to specifications
+- [ ] Unit tests written with >80% coverage
+- [ ] Integration tests implemented and passing
+- [ ] Code review completed and approved
+- [ ] Documentation updated (API docs, README, comments)
+- [ ] Security review completed (if applicable)
+- [ ] Performance benchmarks met (if applicable)
+
+### Technical Requirements
+- Follow Clean Architecture principles
+- Implement comprehensive error handling
+- Add structured logging with appropriate levels
+- Ensure security best practices are followed
+- Write maintainable and readable code
+- Follow project coding standards and conventions
+
+### Definition of Done
+- ✅ All acceptance criteria met
+- ✅ Code deployed to staging environment
+- ✅ Feature tested by QA/stakeholders
+- ✅ Documentation updated and reviewed
+- ✅ No blocking bugs or security issues
+- ✅ Performance meets requirements
+
+### Closing Instructions
+To close this issue automatically, include one of these keywords in your commit message followed by the issue number:
+- `close`, `closes`, `closed`
+- `fix`, `fixes`, `fixed`
+- `resolve`, `resolves`, `resolved`
+
+Example: `git commit -m "Implement {title}, closes #<issue_number>"`
+
+**Note:** The commit must be pushed to the default branch (main/master) to trigger automatic closure.
+    """
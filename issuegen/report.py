@@ -0,0 +1,201 @@
+"""
+Streaming summary reports (Markdown, JSON, CSV)
+گزارش ایشوهای ساخته‌شده
+
+Writers receive issue records one at a time while issues are being created
+(``GitHubIssueGenerator.report``) and group them in the same pass, so a
+report costs O(issues) time whatever the number of phases.
+
+* CSV and JSON rows go straight to the output file and are flushed as each
+  issue is created, so an interrupted run still leaves a usable report.
+* Markdown keeps its familiar layout (summary first, then one section per
+  phase). Each phase's lines are spooled to a temporary file that only stays
+  in memory while it is small, and the document is assembled on ``close``.
+"""
+
+import csv
+import json
+import shutil
+import tempfile
+from datetime import datetime
+from typing import IO, Any, Dict, Iterable, List, Optional
+
+from issuegen.models import Phase, has_estimates
+
+REPORT_FORMATS = ('markdown', 'json', 'csv')
+CSV_FIELDS = ['number', 'title', 'url', 'phase', 'week', 'estimated_hours', 'signature']
+# Per-phase spool size kept in memory before rolling over to disk
+SPOOL_MAX_SIZE = 64 * 1024
+
+
+def report_format_for(path: Optional[str]) -> str:
+    """Infer the format from an output file extension (Markdown by default)"""
+    if path:
+        lowered = path.lower()
+        if lowered.endswith('.json'):
+            return 'json'
+        if lowered.endswith('.csv'):
+            return 'csv'
+    return 'markdown'
+
+
+class _PhaseTotals:
+    __slots__ = ('count', 'hours')
+
+    def __init__(self):
+        self.count = 0
+        self.hours = 0
+
+
+class ReportWriter:
+    """Accumulates totals per phase; subclasses decide where each record goes"""
+
+    def __init__(self, stream: IO[str], repository: str):
+        self.stream = stream
+        self.repository = repository
+        self.generated = datetime.now()
+        self.created = 0
+        self.total_hours = 0
+        self.phase_totals: Dict[str, _PhaseTotals] = {}
+
+    def add(self, record: Dict[str, Any]) -> None:
+        """Called once per created issue, in creation order"""
+        self.created += 1
+        self.total_hours += record['estimated_hours']
+        totals = self.phase_totals.get(record['phase'])
+        if totals is None:
+            totals = self.phase_totals[record['phase']] = _PhaseTotals()
+        totals.count += 1
+        totals.hours += record['estimated_hours']
+        self._write_record(record)
+
+    def _write_record(self, record: Dict[str, Any]) -> None:
+        raise NotImplementedError
+
+    def close(self, phases: List[Phase]) -> None:
+        """Finish the document; ``phases`` gives section order and the task totals"""
+        raise NotImplementedError
+
+
+class MarkdownReportWriter(ReportWriter):
+    """The original Markdown report, produced in one pass over the records"""
+
+    def __init__(self, stream: IO[str], repository: str):
+        super().__init__(stream, repository)
+        self._spools: Dict[str, IO[str]] = {}
+
+    def _write_record(self, record: Dict[str, Any]) -> None:
+        spool = self._spools.get(record['phase'])
+        if spool is None:
+            spool = self._spools[record['phase']] = tempfile.SpooledTemporaryFile(
+                max_size=SPOOL_MAX_SIZE, mode='w+', encoding='utf-8')
+        hours_info = f" ({record['estimated_hours']}h)" if record.get('estimated_hours') else ""
+        spool.write(f"- [#{record['number']}]({record['url']}) {record['title']} (Week {record['week']}){hours_info}\n")
+
+    def close(self, phases: List[Phase]) -> None:
+        with_hours = has_estimates(phases)
+        out = self.stream
+        out.write(f"""# GitHub Issues Creation Report
+**Generated:** {self.generated.strftime('%Y-%m-%d %H:%M:%S')}
+**Repository:** {self.repository}
+
+## Summary
+- **Total Phases:** {len(phases)}
+- **Total Tasks Processed:** {sum(len(phase.tasks) for phase in phases)}
+- **Created Issues:** {self.created}
+""")
+        if with_hours:
+            out.write(f"- **Total Estimated Hours:** {self.total_hours} hours\n")
+        out.write("\n## Created Issues by Phase\n\n")
+
+        for phase in phases:
+            totals = self.phase_totals.get(phase.name) or _PhaseTotals()
+            out.write(f"### {phase.name}\n")
+            out.write(f"**Issues Created:** {totals.count}\n")
+            if with_hours:
+                out.write(f"**Estimated Hours:** {totals.hours} hours\n")
+                out.write(f"**Duration:** {phase.duration_weeks} weeks\n")
+            out.write("\n")
+            spool = self._spools.get(phase.name)
+            if spool is not None:
+                spool.seek(0)
+                shutil.copyfileobj(spool, out)
+            out.write("\n")
+
+        for spool in self._spools.values():
+            spool.close()
+        self._spools.clear()
+
+
+class JsonReportWriter(ReportWriter):
+    """One JSON document whose ``issues`` array is written as issues are created"""
+
+    def __init__(self, stream: IO[str], repository: str):
+        super().__init__(stream, repository)
+        header = {'repository': repository, 'generated': self.generated.isoformat(timespec='seconds')}
+        stream.write(json.dumps(header, ensure_ascii=False)[:-1] + ', "issues": [')
+        stream.flush()
+
+    def _write_record(self, record: Dict[str, Any]) -> None:
+        self.stream.write(("\n  " if self.created == 1 else ",\n  ") + json.dumps(record, ensure_ascii=False))
+        self.stream.flush()
+
+    def close(self, phases: List[Phase]) -> None:
+        with_hours = has_estimates(phases)
+        phase_summaries = []
+        for phase in phases:
+            totals = self.phase_totals.get(phase.name) or _PhaseTotals()
+            summary = {'name': phase.name, 'issues_created': totals.count, 'duration_weeks': phase.duration_weeks}
+            if with_hours:
+                summary['estimated_hours'] = totals.hours
+            phase_summaries.append(summary)
+        summary = {
+            'total_phases': len(phases),
+            'total_tasks': sum(len(phase.tasks) for phase in phases),
+            'created_issues': self.created,
+        }
+        if with_hours:
+            summary['total_estimated_hours'] = self.total_hours
+        self.stream.write("\n], " + json.dumps({'phases': phase_summaries, 'summary': summary},
+                                               ensure_ascii=False, indent=2)[1:] + "\n")
+        self.stream.flush()
+
+
+class CsvReportWriter(ReportWriter):
+    """One row per created issue"""
+
+    def __init__(self, stream: IO[str], repository: str):
+        super().__init__(stream, repository)
+        self._csv = csv.DictWriter(stream, fieldnames=CSV_FIELDS, extrasaction='ignore')
+        self._csv.writeheader()
+        stream.flush()
+
+    def _write_record(self, record: Dict[str, Any]) -> None:
+        self._csv.writerow(record)
+        self.stream.flush()
+
+    def close(self, phases: List[Phase]) -> None:
+        self.stream.flush()
+
+
+_WRITERS = {
+    'markdown': MarkdownReportWriter,
+    'json': JsonReportWriter,
+    'csv': CsvReportWriter,
+}
+
+
+def make_report_writer(report_format: str, stream: IO[str], repository: str) -> ReportWriter:
+    try:
+        return _WRITERS[report_format](stream, repository)
+    except KeyError:
+        raise ValueError(f"Unknown report format '{report_format}'. Available: {', '.join(REPORT_FORMATS)}")
+
+
+def render_report(records: Iterable[Dict[str, Any]], phases: List[Phase], repository: str,
+                  stream: IO[str], report_format: str = 'markdown') -> None:
+    """Write a complete report for already created issues"""
+    writer = make_report_writer(report_format, stream, repository)
+    for record in records:
+        writer.add(record)
+    writer.close(phases)
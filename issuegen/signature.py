@@ -0,0 +1,73 @@
+"""
+Task signatures embedded in issue bodies for duplicate detection
+امضای یکتای تسک‌ها برای جلوگیری از ایشوی تکراری
+"""
+
+import hashlib
+import re
+from typing import Iterable, Optional
+
+# Keyed so our markers cannot be confused with other hex strings in issue bodies
+SIGNATURE_KEY = b'reval-issuegen-v2'
+SIGNATURE_DIGEST_SIZE = 10  # 80 bits -> 20 hex characters
+LEGACY_SIGNATURE_LENGTH = 32  # hex length of the original MD5 markers
+
+SIGNATURE_MARKER = '<!-- UNIQUE_SIGNATURE: {signature} -->'
+SIGNATURE_MARKER_RE = re.compile(r'<!--\s*UNIQUE_SIGNATURE:\s*([0-9a-f]{20}|[0-9a-f]{32})\s*-->')
+
+# Hashing a pre-keyed state with .copy() skips re-processing the key block per task
+_KEYED_BLAKE2B = hashlib.blake2b(key=SIGNATURE_KEY, digest_size=SIGNATURE_DIGEST_SIZE)
+
+
+def normalize_title(text: str) -> str:
+    """Collapse whitespace and case so cosmetic edits keep the same signature"""
+    return ' '.join(text.split()).casefold()
+
+
+def compute_signature(task_title: str, phase_name: str, week_number: int) -> str:
+    """Keyed BLAKE2b signature over the normalized phase, week and title"""
+    hasher = _KEYED_BLAKE2B.copy()
+    # \x1f cannot occur in normalized text, so field boundaries are unambiguous
+    hasher.update(f"{normalize_title(phase_name)}\x1f{week_number}\x1f{normalize_title(task_title)}".encode('utf-8'))
+    return hasher.hexdigest()
+
+
+def legacy_signature(task_title: str, phase_name: str, week_number: int) -> str:
+    """The original MD5 signature, kept to recognize markers in existing issues"""
+    unique_string = f"{phase_name}-{week_number}-{task_title}"
+    return hashlib.md5(unique_string.encode('utf-8')).hexdigest()
+
+
+def task_legacy_signature(task) -> str:
+    """
+    The MD5 marker the baseline script wrote into ``task``'s issue
+
+    Usually the MD5 of the title; split sub-issues were signed with their
+    title before the " (Sub-task i/n)" suffix, which the source records in
+    ``task.legacy_signature``.
+    """
+    return task.legacy_signature or legacy_signature(task.title, task.phase, task.week)
+
+
+def compute_signatures(tasks: Iterable) -> None:
+    """Fill in ``task.signature`` for every task that does not have one yet"""
+    for task in tasks:
+        if not task.signature:
+            task.signature = compute_signature(task.title, task.phase, task.week)
+
+
+def signature_marker(signature: str) -> str:
+    """HTML comment placed at the top of generated issue bodies"""
+    return SIGNATURE_MARKER.format(signature=signature)
+
+
+def extract_signature(body: Optional[str]) -> Optional[str]:
+    """Return the signature (new or legacy) embedded in an issue body"""
+    if not body:
+        return None
+    match = SIGNATURE_MARKER_RE.search(body)
+    return match.group(1) if match else None
+
+
+def is_legacy_signature(signature: str) -> bool:
+    return len(signature) == LEGACY_SIGNATURE_LENGTH
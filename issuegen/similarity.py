@@ -0,0 +1,99 @@
+"""
+Near-duplicate detection for reworded tasks (MinHash + LSH banding)
+تشخیص ایشوهای تقریباً تکراری
+
+Signatures only match when phase, week and title are unchanged, so a
+regenerated roadmap that rewords "Set up FastAPI project" into "Setup the
+FastAPI project" would get a second issue. ``SimilarityIndex`` keeps a
+MinHash of every existing issue title, split into LSH bands; a lookup only
+compares against issues that share at least one band, so it stays sub-linear
+in the size of the tracker instead of comparing every pair.
+"""
+
+import hashlib
+import random
+from typing import Dict, List, Optional, Tuple
+
+from issuegen.signature import normalize_title
+
+DEFAULT_NUM_PERM = 64
+SHINGLE_SIZE = 4
+
+
+def shingles(text: str, size: int = SHINGLE_SIZE) -> set:
+    """Character n-grams of the normalized text (short texts become one shingle)"""
+    normalized = normalize_title(text)
+    if len(normalized) <= size:
+        return {normalized}
+    return {normalized[i:i + size] for i in range(len(normalized) - size + 1)}
+
+
+def choose_bands(num_perm: int, threshold: float) -> Tuple[int, int]:
+    """(bands, rows) whose LSH S-curve midpoint (1/b)^(1/r) is closest to ``threshold``"""
+    best = (num_perm, 1)
+    best_error = float('inf')
+    for rows in range(1, num_perm + 1):
+        if num_perm % rows:
+            continue
+        bands = num_perm // rows
+        error = abs((1 / bands) ** (1 / rows) - threshold)
+        if error < best_error:
+            best, best_error = (bands, rows), error
+    return best
+
+
+class SimilarityIndex:
+    """MinHash/LSH index of issue titles"""
+
+    def __init__(self, threshold: float = 0.7, num_perm: int = DEFAULT_NUM_PERM, seed: int = 1):
+        """
+        Args:
+            threshold: Estimated Jaccard similarity at which a title counts as a near duplicate
+            num_perm: MinHash size; larger is more precise and slower
+            seed: Seed for the hash masks (fixed so results are reproducible)
+        """
+        if not 0 < threshold <= 1:
+            raise ValueError("Similarity threshold must be in (0, 1]")
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.bands, self.rows = choose_bands(num_perm, threshold)
+        rng = random.Random(seed)
+        # One 64-bit hash per shingle, XOR-ed with a mask per permutation
+        self._masks = [rng.getrandbits(64) for _ in range(num_perm)]
+        self._buckets: List[Dict[Tuple[int, ...], List[int]]] = [{} for _ in range(self.bands)]
+        self._signatures: Dict[int, Tuple[int, ...]] = {}
+        self._titles: Dict[int, str] = {}
+
+    def __len__(self) -> int:
+        return len(self._signatures)
+
+    def minhash(self, text: str) -> Tuple[int, ...]:
+        hashes = [int.from_bytes(hashlib.blake2b(s.encode('utf-8'), digest_size=8).digest(), 'little')
+                  for s in shingles(text)]
+        return tuple(min(map(mask.__xor__, hashes)) for mask in self._masks)
+
+    def _band_keys(self, signature: Tuple[int, ...]):
+        rows = self.rows
+        for band in range(self.bands):
+            yield band, signature[band * rows:(band + 1) * rows]
+
+    def add(self, number: int, title: str) -> None:
+        signature = self.minhash(title)
+        self._signatures[number] = signature
+        self._titles[number] = title
+        for band, key in self._band_keys(signature):
+            self._buckets[band].setdefault(key, []).append(number)
+
+    def query(self, title: str) -> Optional[Tuple[int, str, float]]:
+        """Best (number, title, similarity) at or above the threshold, or None"""
+        signature = self.minhash(title)
+        candidates = set()
+        for band, key in self._band_keys(signature):
+            candidates.update(self._buckets[band].get(key, ()))
+        best = None
+        for number in candidates:
+            other = self._signatures[number]
+            score = sum(1 for a, b in zip(signature, other) if a == b) / self.num_perm
+            if score >= self.threshold and (best is None or score > best[2]):
+                best = (number, self._titles[number], score)
+        return best
@@ -0,0 +1,50 @@
+"""
+Roadmap source adapters
+
+Adapters are registered by dotted path and imported only when requested, so
+a CLI that reads Markdown never imports PyYAML. Third-party adapters can be
+added through the ``issuegen.sources`` entry-point group.
+"""
+
+import importlib
+from typing import Dict, List, Tuple, Type
+
+from issuegen.sources.base import RoadmapSource
+
+_BUILTIN_SOURCES: Dict[str, Tuple[str, str]] = {
+    'markdown': ('issuegen.sources.markdown', 'MarkdownSource'),
+    'markdown-keywords': ('issuegen.sources.markdown', 'KeywordMarkdownSource'),
+    'yaml': ('issuegen.sources.yaml_file', 'YamlSource'),
+    'json': ('issuegen.sources.json_cache', 'JsonCacheSource'),
+}
+
+ENTRY_POINT_GROUP = 'issuegen.sources'
+
+_loaded: Dict[str, Type[RoadmapSource]] = {}
+
+
+def _entry_point_sources() -> Dict[str, object]:
+    from importlib.metadata import entry_points
+    return {ep.name: ep for ep in entry_points(group=ENTRY_POINT_GROUP)}
+
+
+def available_sources() -> List[str]:
+    """Names of every known adapter (built-in and installed plugins)"""
+    return sorted(set(_BUILTIN_SOURCES) | set(_entry_point_sources()))
+
+
+def get_source(name: str) -> Type[RoadmapSource]:
+    """Import and return the adapter class registered under ``name``"""
+    if name in _loaded:
+        return _loaded[name]
+    if name in _BUILTIN_SOURCES:
+        module_name, class_name = _BUILTIN_SOURCES[name]
+        source_cls = getattr(importlib.import_module(module_name), class_name)
+    else:
+        entry_point = _entry_point_sources().get(name)
+        if entry_point is None:
+            raise ValueError(f"Unknown roadmap source '{name}' (available: {', '.join(available_sources())})")
+        source_cls = entry_point.load()
+    _loaded[name] = source_cls
+    return source_cls
+
@@ -0,0 +1,43 @@
+"""
+Base class for roadmap source adapters
+"""
+
+from typing import Iterator, List, Optional
+
+from issuegen.classifier import KeywordClassifier
+from issuegen.models import Phase, Task
+
+
+class RoadmapSource:
+    """
+    A roadmap format that can be turned into phases and tasks
+
+    Subclasses implement ``iter_phases``; everything downstream (labels,
+    milestones, issue creation, reports) only sees ``Phase`` and ``Task``.
+    """
+
+    name = ''
+
+    def __init__(self, assignee: Optional[str] = None, classifier: Optional[KeywordClassifier] = None):
+        """
+        Args:
+            assignee: Default assignee for every parsed task
+            classifier: Keyword classifier used to derive priorities/categories
+        """
+        self.assignee = assignee
+        self.classifier = classifier or KeywordClassifier()
+        # Link to a shared conventions document instead of repeating it in every body
+        self.conventions_url: Optional[str] = None
+
+    def iter_phases(self, file_path: str) -> Iterator[Phase]:
+        """Yield phases in roadmap order as soon as each one is complete"""
+        raise NotImplementedError
+
+    def parse(self, file_path: str) -> List[Phase]:
+        """Parse the whole roadmap file"""
+        return list(self.iter_phases(file_path))
+
+    def expand_task(self, task: Task) -> List[Task]:
+        """Tasks that should actually be created as issues for ``task``"""
+        return [task]
+
@@ -0,0 +1,36 @@
+"""
+JSON cache of already-parsed phases (written by --save-parsed / the save prompt)
+"""
+
+import json
+from dataclasses import asdict
+from typing import Iterator, List
+
+from issuegen.models import Phase, Task
+from issuegen.sources.base import RoadmapSource
+
+
+class JsonCacheSource(RoadmapSource):
+    """Phases previously saved with ``save_parsed_to_file``"""
+
+    name = 'json'
+
+    def iter_phases(self, file_path: str) -> Iterator[Phase]:
+        with open(file_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        for p_data in data:
+            yield Phase(
+                name=p_data['name'],
+                description=p_data['description'],
+                duration_weeks=p_data['duration_weeks'],
+                tasks=[Task(**t_data) for t_data in p_data['tasks']],
+                labels=p_data['labels'],
+                goals=p_data.get('goals', [])
+            )
+
+
+def save_parsed_to_file(phases: List[Phase], file_path: str) -> None:
+    """Save parsed phases to JSON file"""
+    with open(file_path, 'w', encoding='utf-8') as f:
+        json.dump([asdict(phase) for phase in phases], f, indent=4, ensure_ascii=False)
+    print(f"✅ Parsed data saved to: {file_path}")
@@ -0,0 +1,232 @@
+"""
+Markdown checklist roadmaps (## 📋 Phase / ### Week / **Day X-Y: ...** / - [ ] or - [x] ...)
+"""
+
+import os
+import re
+from typing import Dict, Iterable, Iterator, List, Optional
+
+from issuegen.models import Phase, Task
+from issuegen.render import render_markdown_description
+from issuegen.signature import compute_signature, legacy_signature
+from issuegen.sources.base import RoadmapSource
+
+PHASE_RE = re.compile(r'^##\s*📋\s*Phase\s*(\d+):\s*(.+?)\s*\((\d+)(?:-\d+)?\s*weeks?\)', re.IGNORECASE)
+WEEK_RE = re.compile(r'^###\s*Week\s*(\d+):\s*(.+)', re.IGNORECASE)
+DAY_CATEGORY_RE = re.compile(r'^\*\*Day\s*(\d+-\d+):\s*(.+)\*\*')
+# Checked items too: --sync marks finished tasks - [x], and they are still part of the roadmap
+TASK_RE = re.compile(r'^-\s*\[\s*[xX]?\s*\]\s*(.+)')
+
+AUTH_KEYWORDS = ('auth', 'oauth2', 'jwt')
+
+
+class MarkdownRoadmapParser:
+    """
+    Incremental line-by-line parser
+
+    ``feed`` returns a finished ``Phase`` whenever a new phase header closes
+    the previous one, so callers can start working on early phases before the
+    rest of the roadmap has been read.
+    """
+
+    def __init__(self, source: 'MarkdownSource', initial_week: Optional[Dict] = None):
+        """
+        Args:
+            source: Adapter that turns checklist lines into tasks
+            initial_week: Week in effect before the first line (when parsing a chunk
+                that starts mid-file); the week survives phase headers
+        """
+        self.source = source
+        self.current_phase: Optional[Dict] = None
+        self.current_week: Optional[Dict] = initial_week
+        self.current_day_range: Optional[str] = None
+        self.current_category: Optional[str] = None
+        self.current_tasks: List[Task] = []
+        # A category/task line inside a phase was dropped for lack of a week,
+        # i.e. the result depends on the week carried in from earlier text
+        self.missing_week = False
+
+    def _finish_phase(self) -> Optional[Phase]:
+        if not self.current_phase:
+            return None
+        return Phase(
+            name=self.current_phase['name'],
+            description=self.current_phase['description'],
+            duration_weeks=self.current_phase['duration'],
+            tasks=self.current_tasks,
+            labels=self.current_phase['labels']
+        )
+
+    def feed(self, line: str) -> Optional[Phase]:
+        """Consume one line; return the previous phase if this line starts a new one"""
+        line = line.strip()
+        # Every pattern is anchored, so cheap prefix checks skip the regexes for prose lines
+        first = line[:1]
+        if first == '#':
+            return self._feed_heading(line)
+        if first == '*':
+            # Category/Day range detection (**Day X-Y: Category**)
+            category_match = DAY_CATEGORY_RE.match(line)
+            if category_match and self.current_phase:
+                if self.current_week:
+                    self.current_day_range = category_match.group(1)
+                    self.current_category = category_match.group(2).strip()
+                else:
+                    self.missing_week = True
+        elif first == '-':
+            # Task detection (- [ ] ... / - [x] ...)
+            task_match = TASK_RE.match(line)
+            if task_match and self.current_phase:
+                if not self.current_week:
+                    self.missing_week = True
+                    return None
+                task = self.source.make_task(task_match.group(1).strip(), self.current_phase, self.current_week,
+                                             self.current_day_range, self.current_category)
+                if task is not None:
+                    self.current_tasks.append(task)
+        return None
+
+    def _feed_heading(self, line: str) -> Optional[Phase]:
+        # Phase detection (## 📋 Phase X: ...)
+        phase_match = PHASE_RE.match(line)
+        if phase_match:
+            finished = self._finish_phase()
+
+            phase_num = phase_match.group(1)
+            phase_name = phase_match.group(2).strip()
+            self.current_phase = {
+                'name': f"Phase {phase_num}: {phase_name}",
+                'description': f"Phase {phase_num} - {phase_name}",
+                'duration': int(phase_match.group(3)),
+                'labels': [f"phase-{phase_num}", "backend" if "Backend" in phase_name else "frontend"]
+            }
+            self.current_tasks = []
+            self.current_day_range = None
+            self.current_category = None
+            return finished
+
+        # Week detection (### Week X: ...)
+        week_match = WEEK_RE.match(line)
+        if week_match:
+            self.current_week = {
+                'number': int(week_match.group(1)),
+                'title': week_match.group(2).strip()
+            }
+            self.current_day_range = None
+            self.current_category = None
+        return None
+
+    def close(self) -> Optional[Phase]:
+        """Return the last phase once the input is exhausted"""
+        finished = self._finish_phase()
+        self.current_phase = None
+        return finished
+
+
+class MarkdownSource(RoadmapSource):
+    """Markdown roadmap whose categories come from **Day X-Y: Category** headings"""
+
+    name = 'markdown'
+    # Split auth-related tasks into OAuth2/JWT/bcrypt/test sub-issues
+    split_auth_tasks = True
+    # Worker processes for large files (see markdown_parallel); 1 parses serially
+    parse_workers = 1
+
+    def iter_phases(self, file_path: str) -> Iterator[Phase]:
+        if self.parse_workers > 1:
+            from issuegen.sources.markdown_parallel import PARALLEL_MIN_BYTES, iter_phases_parallel
+            if os.path.getsize(file_path) >= PARALLEL_MIN_BYTES:
+                yield from iter_phases_parallel(self, file_path, self.parse_workers)
+                return
+        with open(file_path, 'r', encoding='utf-8') as f:
+            yield from self.iter_lines(f)
+
+    def iter_lines(self, lines: Iterable[str]) -> Iterator[Phase]:
+        """Yield phases from any iterable of lines (file, network stream, ...)"""
+        parser = MarkdownRoadmapParser(self)
+        for line in lines:
+            phase = parser.feed(line)
+            if phase is not None:
+                yield phase
+        phase = parser.close()
+        if phase is not None:
+            yield phase
+
+    def make_task(self, task_title: str, phase: Dict, week: Dict,
+                  day_range: Optional[str], category: Optional[str]) -> Optional[Task]:
+        """Build a Task for a checklist line; None if it is outside a category"""
+        if not category:
+            return None
+        priority = self.classifier.priority(task_title)
+        return self._build_task(task_title, phase, week, day_range or "", category, priority)
+
+    def _build_task(self, task_title: str, phase: Dict, week: Dict, day_range: str,
+                    category: str, priority: str) -> Task:
+        signature = compute_signature(task_title, phase['name'], week['number'])
+        labels = [
+            f"week-{week['number']}",
+            category.lower().replace(' ', '-'),
+            priority
+        ] + phase['labels']
+        return Task(
+            title=task_title,
+            description=render_markdown_description(task_title, phase['name'], week['number'],
+                                                    week['title'], signature, self.conventions_url),
+            phase=phase['name'],
+            week=week['number'],
+            day_range=day_range,
+            category=category,
+            priority=priority,
+            labels=labels,
+            assignee=self.assignee,
+            milestone=phase['name'],
+            signature=signature
+        )
+
+    def expand_task(self, task: Task) -> List[Task]:
+        """Split a task into sub-issues based on complexity"""
+        task_lower = task.title.lower()
+        if not self.split_auth_tasks or not any(word in task_lower for word in AUTH_KEYWORDS):
+            return [task]
+
+        sub_task_titles = [
+            f"Implement OAuth2 setup for {task.title}",
+            f"Add JWT handling for {task.title}",
+            f"Integrate bcrypt password hashing for {task.title}",
+            f"Write authentication tests for {task.title}"
+        ]
+        sub_tasks = []
+        for i, sub_title in enumerate(sub_task_titles, 1):
+            full_title = f"{sub_title} (Sub-task {i}/{len(sub_task_titles)})"
+            # Sign the title the issue is created with, so reruns find it again
+            signature = compute_signature(full_title, task.phase, task.week)
+            sub_tasks.append(Task(
+                title=full_title,
+                description=render_markdown_description(sub_title, task.phase, task.week,
+                                                        f"Sub-task of Week {task.week}", signature,
+                                                        self.conventions_url),
+                phase=task.phase,
+                week=task.week,
+                day_range=task.day_range,
+                category=task.category,
+                priority=task.priority,
+                labels=(task.labels or []) + ['sub-task'],
+                assignee=task.assignee,
+                milestone=task.milestone,
+                signature=signature,
+                # The baseline script signed these bodies with the title before the suffix
+                legacy_signature=legacy_signature(sub_title, task.phase, task.week)
+            ))
+        return sub_tasks
+
+
+class KeywordMarkdownSource(MarkdownSource):
+    """Markdown roadmap without Day headings: categories are inferred from task titles"""
+
+    name = 'markdown-keywords'
+    split_auth_tasks = False
+
+    def make_task(self, task_title: str, phase: Dict, week: Dict,
+                  day_range: Optional[str], category: Optional[str]) -> Optional[Task]:
+        priority, category = self.classifier.classify(task_title)
+        return self._build_task(task_title, phase, week, "", category, priority)
@@ -0,0 +1,108 @@
+"""
+Multi-process parsing of very large Markdown roadmaps
+پردازش موازی فایل‌های Markdown بزرگ
+
+The file is memory-mapped and scanned for the 📋 bytes of ``## 📋 Phase``
+headers. Each candidate line is confirmed with the full ``PHASE_RE`` and the
+confirmed header offsets split the file into chunks of whole phases. Worker
+processes run the ordinary ``MarkdownRoadmapParser`` over their chunk and the
+results are yielded back in file order.
+
+The only state the serial parser carries across a phase header is the current
+week (phase headers do not reset it). Workers therefore start without a week
+and report whether that mattered (``missing_week``). The merge threads the
+last week of each chunk into the next one and re-parses, in this process, only
+those chunks that both needed a week and have one carried in. The output is
+identical to ``MarkdownSource.iter_lines`` over the whole file.
+"""
+
+import io
+import mmap
+import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from issuegen.models import Phase
+from issuegen.sources.markdown import PHASE_RE, MarkdownRoadmapParser
+
+PHASE_MARKER = '📋'.encode('utf-8')
+# Below this size process start-up costs more than it saves
+PARALLEL_MIN_BYTES = 4 * 1024 * 1024
+# Several chunks per worker so one slow chunk does not leave the others idle
+CHUNKS_PER_WORKER = 4
+
+
+def _line_bounds(mm: mmap.mmap, pos: int) -> Tuple[int, int]:
+    """Start and end of the line containing ``pos`` (\\n, \\r\\n and bare \\r endings)"""
+    newline = mm.rfind(b'\n', 0, pos)
+    start = max(newline, mm.rfind(b'\r', newline + 1, pos)) + 1
+    end = mm.find(b'\n', pos)
+    if end == -1:
+        end = len(mm)
+    carriage = mm.find(b'\r', pos, end)
+    return start, carriage if carriage != -1 else end
+
+
+def find_phase_offsets(mm: mmap.mmap) -> List[int]:
+    """Byte offsets of every line the serial parser would treat as a phase header"""
+    offsets: List[int] = []
+    pos = mm.find(PHASE_MARKER)
+    while pos != -1:
+        start, end = _line_bounds(mm, pos)
+        if (not offsets or offsets[-1] != start) and PHASE_RE.match(mm[start:end].decode('utf-8', 'replace').strip()):
+            offsets.append(start)
+        pos = mm.find(PHASE_MARKER, max(end, pos + len(PHASE_MARKER)))
+    return offsets
+
+
+def split_chunks(offsets: List[int], size: int, chunks: int) -> List[Tuple[int, int]]:
+    """Group phase boundaries into about ``chunks`` byte ranges of similar size"""
+    target = max(1, size // max(1, chunks))
+    boundaries = [0]
+    for offset in offsets:
+        if offset - boundaries[-1] >= target:
+            boundaries.append(offset)
+    boundaries.append(size)
+    return [(start, end) for start, end in zip(boundaries, boundaries[1:]) if end > start]
+
+
+def _parse_chunk(source, file_path: str, start: int, end: int,
+                 initial_week: Optional[Dict]) -> Tuple[List[Phase], bool, Optional[Dict]]:
+    """Worker: parse one byte range; returns (phases, missing_week, last week)"""
+    with open(file_path, 'rb') as f:
+        f.seek(start)
+        text = f.read(end - start).decode('utf-8')
+    parser = MarkdownRoadmapParser(source, initial_week)
+    phases = []
+    # newline=None gives the same universal-newline lines as open() in text mode
+    for line in io.StringIO(text, newline=None):
+        phase = parser.feed(line)
+        if phase is not None:
+            phases.append(phase)
+    phase = parser.close()
+    if phase is not None:
+        phases.append(phase)
+    return phases, parser.missing_week, parser.current_week
+
+
+def iter_phases_parallel(source, file_path: str, workers: Optional[int] = None) -> Iterator[Phase]:
+    """Yield the phases of ``file_path`` in order, parsed by a pool of ``workers`` processes"""
+    workers = workers or os.cpu_count() or 1
+    size = os.path.getsize(file_path)
+    if size == 0:
+        return
+    with open(file_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        offsets = find_phase_offsets(mm)
+    ranges = split_chunks(offsets, size, workers * CHUNKS_PER_WORKER)
+
+    carried: Optional[Dict] = None
+    with ProcessPoolExecutor(max_workers=min(workers, len(ranges))) as executor:
+        results = executor.map(_parse_chunk, repeat(source), repeat(file_path),
+                               [start for start, _ in ranges], [end for _, end in ranges], repeat(None))
+        for (start, end), (phases, missing_week, last_week) in zip(ranges, results):
+            if missing_week and carried is not None:
+                phases, _, last_week = _parse_chunk(source, file_path, start, end, carried)
+            yield from phases
+            if last_week is not None:
+                carried = last_week
@@ -0,0 +1,207 @@
+"""
+YAML roadmaps (project / phases / weeks / categories / tasks)
+"""
+
+import re
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+import yaml
+
+from issuegen.classifier import YAML_PRIORITY_KEYWORDS, KeywordClassifier
+from issuegen.models import Phase, Task
+from issuegen.render import render_yaml_description
+from issuegen.signature import compute_signature
+from issuegen.sources.base import RoadmapSource
+from issuegen.sources.yaml_schema import RoadmapValidationError, validate_roadmap
+
+PHASE_NUMBER_RE = re.compile(r'Phase (\d+)')
+DAY_RANGE_RE = re.compile(r'\(Day (\d+(?:-\d+)?)\)')
+DAY_SUFFIX_RE = re.compile(r'\s*\(Day.*?\)')
+BACKEND_KEYWORDS = ('backend', 'api', 'server', 'infrastructure')
+PHASES_KEY_RE = re.compile(r'^phases\s*:\s*(#.*)?$')
+ERROR_LINE_RE = re.compile(r'^line (\d+):')
+
+
+class YamlSource(RoadmapSource):
+    """YAML roadmap as produced by the prompts in docs/ai_prompt_claudev2.md"""
+
+    name = 'yaml'
+
+    def __init__(self, assignee=None, classifier=None):
+        super().__init__(assignee, classifier or KeywordClassifier(priority_tiers=YAML_PRIORITY_KEYWORDS))
+
+    def load(self, file_path: str) -> Dict:
+        """
+        Read the YAML document and check it against the roadmap schema
+
+        The document is composed once, validated on the node tree, and then
+        constructed from the same nodes, so validation costs no second parse.
+        Raises RoadmapValidationError listing every problem with its line.
+        """
+        try:
+            with open(file_path, 'r', encoding='utf-8') as f:
+                return self._load_document(f, file_path)
+        except FileNotFoundError:
+            raise ValueError(f"File not found: {file_path}")
+
+    @staticmethod
+    def _load_document(stream, name: str, shift: Tuple[int, int] = (0, 0)) -> Dict:
+        """``load`` for any stream; ``shift`` = (after, by) moves line numbers past ``after`` down by ``by``"""
+        after, by = shift
+
+        def moved(line: int) -> int:
+            return line + by if line >= after else line
+
+        try:
+            node = yaml.compose(stream, Loader=yaml.SafeLoader)
+        except yaml.YAMLError as e:
+            for mark in (getattr(e, 'problem_mark', None), getattr(e, 'context_mark', None)):
+                if mark is not None:
+                    mark.line = moved(mark.line)
+            raise ValueError(f"Error parsing YAML file: {e}")
+
+        errors = validate_roadmap(node)
+        if errors:
+            if by:
+                errors = [ERROR_LINE_RE.sub(lambda m: f"line {moved(int(m.group(1)) - 1) + 1}:", error, count=1)
+                          for error in errors]
+            raise RoadmapValidationError(name, errors)
+
+        loader = yaml.SafeLoader('')
+        try:
+            return loader.construct_document(node)
+        finally:
+            loader.dispose()
+
+    def iter_phases(self, file_path: str) -> Iterator[Phase]:
+        data = self.load(file_path)
+        project_name = (data.get('project') or {}).get('name', 'Unknown Project')
+        for phase_data in data['phases']:
+            yield self.build_phase(phase_data, project_name)
+
+    def iter_lines(self, lines: Iterable[str], name: str = '<stream>') -> Iterator[Phase]:
+        """
+        Yield phases from a block-style YAML roadmap as each one is complete
+
+        Lines up to ``phases:`` are kept as the header. Each phase is loaded on
+        its own as header + phase once the next item of the ``phases`` list (or
+        the end of the input) shows it is complete, so a roadmap arriving over
+        the network yields Phase 1 long before the last phase is read. Error
+        line numbers are shifted back to their place in the whole input. A
+        roadmap without a block-style ``phases:`` key is loaded whole
+        at the end.
+        """
+        header: List[str] = []
+        phase: List[str] = []
+        skipped = 0  # lines of phases already yielded
+        item_indent = None
+        in_phases = False
+
+        def load_phase() -> Phase:
+            data = self._load_document("".join(header) + "".join(phase), name, (len(header), skipped))
+            project_name = (data.get('project') or {}).get('name', 'Unknown Project')
+            return self.build_phase(data['phases'][0], project_name)
+
+        for line in lines:
+            if not in_phases:
+                header.append(line)
+                in_phases = item_indent is None and PHASES_KEY_RE.match(line) is not None
+                continue
+            stripped = line.lstrip(' ')
+            indent = len(line) - len(stripped)
+            if stripped.strip() and not stripped.startswith('#'):
+                if item_indent is None and stripped.startswith('-'):
+                    item_indent = indent
+                starts_item = indent == item_indent and stripped.startswith('-')
+                # A top-level key after the list (or the next item) completes the current phase
+                if phase and (starts_item or (indent == 0 and not stripped.startswith('-'))):
+                    yield load_phase()
+                    skipped += len(phase)
+                    phase = []
+                if indent == 0 and not stripped.startswith('-'):
+                    in_phases = False
+                    header.append(line)
+                    continue
+            phase.append(line)
+        if phase:
+            yield load_phase()
+        elif item_indent is None:
+            # No block-style phases list; load what arrived as one document
+            data = self._load_document("".join(header), name)
+            project_name = (data.get('project') or {}).get('name', 'Unknown Project')
+            for phase_data in data['phases']:
+                yield self.build_phase(phase_data, project_name)
+
+    def build_phase(self, phase_data: Dict, project_name: str) -> Phase:
+        """Convert one entry of the ``phases`` list"""
+        phase_name = phase_data.get('name', 'Unknown Phase')
+
+        # Extract phase number for labeling
+        phase_match = PHASE_NUMBER_RE.search(phase_name)
+        phase_num = phase_match.group(1) if phase_match else "unknown"
+        phase_lower = phase_name.lower()
+        phase_labels = [
+            f"phase-{phase_num}",
+            "backend" if any(keyword in phase_lower for keyword in BACKEND_KEYWORDS) else "frontend",
+            phase_lower.replace(' ', '-').replace(':', '')
+        ]
+
+        tasks: List[Task] = []
+        for week_data in phase_data.get('weeks', []):
+            week_number = week_data.get('week_number', 1)
+            week_title = week_data.get('title', f'Week {week_number}')
+
+            for category_data in week_data.get('categories', []):
+                category_name = category_data.get('category', 'General')
+                # Extract day range from category name
+                day_range_match = DAY_RANGE_RE.search(category_name)
+                day_range = day_range_match.group(1) if day_range_match else f"{week_number*7-6}-{week_number*7}"
+                clean_category = DAY_SUFFIX_RE.sub('', category_name).strip()
+
+                for task_data in category_data.get('tasks', []):
+                    tasks.append(self._build_task(task_data, phase_name, phase_labels, week_number,
+                                                  week_title, day_range, clean_category, project_name))
+
+        return Phase(
+            name=phase_name,
+            description=phase_data.get('description', ''),
+            duration_weeks=phase_data.get('duration_weeks', 1),
+            tasks=tasks,
+            labels=phase_labels,
+            goals=phase_data.get('goals', [])
+        )
+
+    def _build_task(self, task_data: Dict, phase_name: str, phase_labels: List[str], week_number: int,
+                    week_title: str, day_range: str, category: str, project_name: str) -> Task:
+        task_title = task_data.get('title', 'Untitled Task')
+        estimated_hours = task_data.get('estimated_hours', 0)
+        # An explicit priority wins; otherwise the title's keywords decide (medium when none match)
+        task_priority = task_data.get('priority') or self.classifier.priority(task_title)
+        subtasks = task_data.get('subtasks', [])
+        signature = compute_signature(task_title, phase_name, week_number)
+
+        task_labels = [
+            f"week-{week_number}",
+            category.lower().replace(' ', '-'),
+            task_priority,
+            f"estimate-{int(estimated_hours)}h" if estimated_hours > 0 else "estimate-unknown"
+        ] + phase_labels
+
+        return Task(
+            title=task_title,
+            description=render_yaml_description(
+                task_title, task_data.get('description', ''), phase_name, week_title,
+                week_number, category, estimated_hours, subtasks, project_name, signature, self.conventions_url
+            ),
+            phase=phase_name,
+            week=week_number,
+            day_range=day_range,
+            category=category,
+            priority=task_priority,
+            labels=task_labels,
+            assignee=self.assignee,
+            milestone=phase_name,
+            estimated_hours=estimated_hours,
+            subtasks=subtasks,
+            signature=signature
+        )
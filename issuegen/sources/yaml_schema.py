@@ -0,0 +1,192 @@
+"""
+Schema check for YAML roadmaps, run on the composed node tree
+اعتبارسنجی ساختار فایل YAML قبل از هر درخواست شبکه
+
+The schema is declared once with a few small spec classes and compiled into
+plain closures at import time. ``validate_roadmap`` then walks the
+``yaml.compose`` node tree in a single pass and collects every problem with
+its line number, so a broken roadmap is reported in full before any GitHub
+request is made. Unknown keys (``sprint_goals``, ``definition_of_done``, ...)
+are allowed; only the fields the generator reads are checked.
+"""
+
+from typing import Callable, Dict, List, Optional, Sequence
+
+from yaml.nodes import MappingNode, Node, ScalarNode, SequenceNode
+
+STR_TAG = 'tag:yaml.org,2002:str'
+INT_TAG = 'tag:yaml.org,2002:int'
+FLOAT_TAG = 'tag:yaml.org,2002:float'
+SCALAR_TAGS = {STR_TAG, INT_TAG, FLOAT_TAG, 'tag:yaml.org,2002:bool', 'tag:yaml.org,2002:timestamp'}
+
+Check = Callable[[Node, str, List[str]], None]
+
+
+class RoadmapValidationError(ValueError):
+    """Raised with every schema error found in a roadmap"""
+
+    def __init__(self, file_path: str, errors: List[str]):
+        self.file_path = file_path
+        self.errors = errors
+        super().__init__(f"{file_path} has {len(errors)} schema error(s):\n" + "\n".join(f"  - {e}" for e in errors))
+
+
+def _error(errors: List[str], node: Node, path: str, message: str) -> None:
+    errors.append(f"line {node.start_mark.line + 1}: {path or '<root>'}: {message}")
+
+
+def _describe(node: Node) -> str:
+    if isinstance(node, MappingNode):
+        return "a mapping"
+    if isinstance(node, SequenceNode):
+        return "a list"
+    if node.tag == 'tag:yaml.org,2002:null':
+        return "null"
+    return repr(node.value)
+
+
+class Spec:
+    def compile(self) -> Check:
+        raise NotImplementedError
+
+
+class Text(Spec):
+    """A string (or, with ``any_scalar``, any plain scalar that renders as text)"""
+
+    def __init__(self, any_scalar: bool = False, choices: Optional[Sequence[str]] = None):
+        self.any_scalar = any_scalar
+        self.choices = tuple(choices) if choices else None
+
+    def compile(self) -> Check:
+        allowed = SCALAR_TAGS if self.any_scalar else {STR_TAG}
+        choices = self.choices
+        expected = f"one of {', '.join(choices)}" if choices else ("text" if self.any_scalar else "a string")
+
+        def check(node: Node, path: str, errors: List[str]) -> None:
+            if not isinstance(node, ScalarNode) or node.tag not in allowed:
+                _error(errors, node, path, f"expected {expected}, got {_describe(node)}")
+            elif choices and node.value not in choices:
+                _error(errors, node, path, f"expected {expected}, got {node.value!r}")
+            elif not choices and not self.any_scalar and not node.value.strip():
+                _error(errors, node, path, "must not be empty")
+        return check
+
+
+class Number(Spec):
+    def __init__(self, minimum: float = 0, integer: bool = False):
+        self.minimum = minimum
+        self.integer = integer
+
+    def compile(self) -> Check:
+        tags = {INT_TAG} if self.integer else {INT_TAG, FLOAT_TAG}
+        minimum = self.minimum
+        expected = f"{'an integer' if self.integer else 'a number'} >= {minimum}"
+
+        def check(node: Node, path: str, errors: List[str]) -> None:
+            if not isinstance(node, ScalarNode) or node.tag not in tags:
+                _error(errors, node, path, f"expected {expected}, got {_describe(node)}")
+                return
+            try:
+                value = int(node.value.replace('_', ''), 0) if node.tag == INT_TAG else float(node.value)
+            except ValueError:
+                # Octal/sexagesimal spellings: leave them to the YAML constructor
+                return
+            if value < minimum:
+                _error(errors, node, path, f"expected {expected}, got {node.value}")
+        return check
+
+
+class ListOf(Spec):
+    def __init__(self, item: Spec, min_items: int = 0):
+        self.item = item
+        self.min_items = min_items
+
+    def compile(self) -> Check:
+        check_item = self.item.compile()
+        min_items = self.min_items
+
+        def check(node: Node, path: str, errors: List[str]) -> None:
+            if not isinstance(node, SequenceNode):
+                _error(errors, node, path, f"expected a list, got {_describe(node)}")
+                return
+            if len(node.value) < min_items:
+                _error(errors, node, path, f"expected at least {min_items} item(s)")
+            for index, item in enumerate(node.value):
+                check_item(item, f"{path}[{index}]", errors)
+        return check
+
+
+class Record(Spec):
+    """A mapping with known fields; unknown keys are ignored"""
+
+    def __init__(self, fields: Dict[str, Spec], required: Sequence[str] = ()):
+        self.fields = fields
+        self.required = tuple(required)
+
+    def compile(self) -> Check:
+        checks = {name: spec.compile() for name, spec in self.fields.items()}
+        required = self.required
+
+        def check(node: Node, path: str, errors: List[str]) -> None:
+            if not isinstance(node, MappingNode):
+                _error(errors, node, path, f"expected a mapping, got {_describe(node)}")
+                return
+            seen = set()
+            prefix = f"{path}." if path else ""
+            for key_node, value_node in node.value:
+                key = key_node.value if isinstance(key_node, ScalarNode) else None
+                if key is not None and key in seen:
+                    _error(errors, key_node, prefix + key, "duplicate key")
+                seen.add(key)
+                field_check = checks.get(key)
+                if field_check is not None:
+                    field_check(value_node, prefix + key, errors)
+            for name in required:
+                if name not in seen:
+                    _error(errors, node, prefix + name, "required key is missing")
+        return check
+
+
+TASK = Record({
+    'title': Text(),
+    'description': Text(any_scalar=True),
+    'estimated_hours': Number(minimum=0),
+    'priority': Text(choices=('high', 'medium', 'low')),
+    'subtasks': ListOf(Text(any_scalar=True)),
+    'status': Text(choices=('open', 'closed')),
+}, required=('title',))
+
+CATEGORY = Record({
+    'category': Text(),
+    'tasks': ListOf(TASK),
+}, required=('category',))
+
+WEEK = Record({
+    'week_number': Number(minimum=1, integer=True),
+    'title': Text(any_scalar=True),
+    'categories': ListOf(CATEGORY),
+})
+
+PHASE = Record({
+    'name': Text(),
+    'description': Text(any_scalar=True),
+    'duration_weeks': Number(minimum=1, integer=True),
+    'goals': ListOf(Text(any_scalar=True)),
+    'weeks': ListOf(WEEK),
+}, required=('name',))
+
+ROADMAP = Record({
+    'project': Record({'name': Text(any_scalar=True)}),
+    'phases': ListOf(PHASE, min_items=1),
+}, required=('phases',))
+
+_check_roadmap = ROADMAP.compile()
+
+
+def validate_roadmap(node: Optional[Node]) -> List[str]:
+    """All schema errors of a composed roadmap document (empty if it is valid)"""
+    errors: List[str] = []
+    if node is None:
+        return ["line 1: <root>: the document is empty"]
+    _check_roadmap(node, '', errors)
+    return errors
@@ -0,0 +1,127 @@
+"""
+On-disk cache of what a repository already contains
+کش وضعیت ریپازیتوری (امضاها، لیبل‌ها، مایلستون‌ها، همکاران)
+
+A real run records every label, milestone, collaborator and task signature
+it learns about, plus the last rate-limit headers it saw. The offline planner
+and later runs read it back instead of asking GitHub again.
+"""
+
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+STATE_VERSION = 1
+
+
+def default_state_dir() -> Path:
+    base = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return Path(base) / 'issuegen'
+
+
+class RepoStateCache:
+    """Cached view of one repository, persisted as a single JSON file"""
+
+    def __init__(self, path: Path, repo: str):
+        self.path = Path(path)
+        self.repo = repo
+        # signature -> issue number (None when only a search hit is known)
+        self.signatures: Dict[str, Optional[int]] = {}
+        self.labels: Optional[List[str]] = None
+        self.milestones: Optional[Dict[str, int]] = None
+        self.collaborators: Optional[List[str]] = None
+        self.rate_limit: Optional[Dict[str, Any]] = None
+        # Set by a full issue listing; a miss in ``signatures`` then means "not on GitHub"
+        self.complete_at: Optional[float] = None
+        self.updated_at: Optional[float] = None
+        # signature -> 'open' / 'closed', kept current by --sync
+        self.issue_states: Dict[str, str] = {}
+        # GitHub's updated_at (ISO 8601) of the newest issue seen by --sync
+        self.synced_until: Optional[str] = None
+
+    @classmethod
+    def for_repo(cls, repo: str, state_dir: Optional[str] = None) -> 'RepoStateCache':
+        """Load (or start) the cache for ``owner/name``"""
+        directory = Path(state_dir) if state_dir else default_state_dir()
+        state = cls(directory / (repo.replace('/', '__') + '.json'), repo)
+        state.load()
+        return state
+
+    def load(self) -> None:
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            print(f"⚠️ Ignoring unreadable state cache {self.path}: {e}")
+            return
+        if data.get('version') != STATE_VERSION or data.get('repo') != self.repo:
+            return
+        self.signatures = data.get('signatures', {})
+        self.labels = data.get('labels')
+        self.milestones = data.get('milestones')
+        self.collaborators = data.get('collaborators')
+        self.rate_limit = data.get('rate_limit')
+        self.complete_at = data.get('complete_at')
+        self.updated_at = data.get('updated_at')
+        self.issue_states = data.get('issue_states', {})
+        self.synced_until = data.get('synced_until')
+
+    def save(self) -> None:
+        """Write atomically so an interrupted run never leaves a truncated cache"""
+        self.updated_at = time.time()
+        data = {
+            'version': STATE_VERSION,
+            'repo': self.repo,
+            'updated_at': self.updated_at,
+            'complete_at': self.complete_at,
+            'signatures': self.signatures,
+            'labels': self.labels,
+            'milestones': self.milestones,
+            'collaborators': self.collaborators,
+            'rate_limit': self.rate_limit,
+            'issue_states': self.issue_states,
+            'synced_until': self.synced_until,
+        }
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.path.parent, prefix=self.path.name, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False)
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    def knows_signature(self, *signatures: str) -> bool:
+        return any(signature in self.signatures for signature in signatures if signature)
+
+    def record_signature(self, signature: str, number: Optional[int] = None) -> None:
+        if number is not None or signature not in self.signatures:
+            self.signatures[signature] = number
+
+    def record_issue_state(self, signature: str, number: int, state: str) -> None:
+        self.signatures[signature] = number
+        self.issue_states[signature] = state
+
+    def issue_state(self, *signatures: str) -> Optional[str]:
+        """Last synced state of the first known signature"""
+        for signature in signatures:
+            if signature and signature in self.issue_states:
+                return self.issue_states[signature]
+        return None
+
+    def record_labels(self, names: Iterable[str]) -> None:
+        self.labels = sorted(set(self.labels or []) | set(names))
+
+    def record_milestone(self, title: str, number: int) -> None:
+        if self.milestones is None:
+            self.milestones = {}
+        self.milestones[title] = number
+
+    def record_rate_limit(self, remaining: int, limit: int, reset: Optional[float]) -> None:
+        self.rate_limit = {'remaining': remaining, 'limit': limit, 'reset': reset, 'observed_at': time.time()}
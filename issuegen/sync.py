@@ -0,0 +1,188 @@
+"""
+Write GitHub issue state back into the roadmap file
+همگام‌سازی وضعیت ایشوها با فایل نقشه راه
+
+Each task is mapped to its issue through the same signature the generator
+embedded in the issue body. Markdown checklists flip between ``- [ ]`` and
+``- [x]``; YAML tasks get a ``status: open|closed`` field. Both rewrites are
+a single pass that copies the file to a temporary sibling and only replaces
+the original if some task actually changed.
+"""
+
+import os
+import re
+import tempfile
+from typing import Callable, List, Optional, Tuple
+
+from issuegen.models import Task
+from issuegen.signature import compute_signature, task_legacy_signature
+from issuegen.sources.base import RoadmapSource
+from issuegen.sources.markdown import PHASE_RE, WEEK_RE, MarkdownSource
+from issuegen.state import RepoStateCache
+
+# Any checklist item, checked or not, so reopened issues can be unchecked again
+CHECKLIST_RE = re.compile(r'^(\s*-\s*\[)(\s*|[xX])(\]\s*)(\S.*)$')
+
+StatusLookup = Callable[[Task], Optional[str]]
+
+
+def task_status(state: RepoStateCache, source: RoadmapSource, legacy_signatures: bool = True) -> StatusLookup:
+    """
+    Map a task to 'open' / 'closed', or None if none of its issues were synced
+
+    A task split into several issues (the Markdown auth split) is closed only
+    once every one of its issues is closed.
+    """
+    def lookup(task: Task) -> Optional[str]:
+        states = []
+        for issue_task in source.expand_task(task):
+            signature = issue_task.signature or compute_signature(issue_task.title, issue_task.phase, issue_task.week)
+            legacy = task_legacy_signature(issue_task) if legacy_signatures else None
+            states.append(state.issue_state(signature, legacy))
+        if any(s == 'open' for s in states):
+            return 'open'
+        if states and all(s == 'closed' for s in states):
+            return 'closed'
+        return None
+    return lookup
+
+
+def sync_markdown(path: str, status_of: StatusLookup) -> int:
+    """Check or uncheck ``- [ ]`` items in one streaming pass; returns the number changed"""
+    changed = 0
+    phase_name: Optional[str] = None
+    week_number: Optional[int] = None
+
+    def rewrite(out) -> None:
+        nonlocal changed, phase_name, week_number
+        with open(path, 'r', encoding='utf-8', newline='') as f:
+            for line in f:
+                stripped = line.strip()
+                first = stripped[:1]
+                if first == '#':
+                    phase_match = PHASE_RE.match(stripped)
+                    if phase_match:
+                        phase_name = f"Phase {phase_match.group(1)}: {phase_match.group(2).strip()}"
+                    else:
+                        week_match = WEEK_RE.match(stripped)
+                        if week_match:
+                            week_number = int(week_match.group(1))
+                elif first == '-' and phase_name and week_number is not None:
+                    body = line.rstrip('\r\n')
+                    item = CHECKLIST_RE.match(body)
+                    if item:
+                        title = item.group(4).strip()
+                        status = status_of(Task(title=title, description='', phase=phase_name,
+                                                week=week_number, day_range='', category=''))
+                        checked = item.group(2) in ('x', 'X')
+                        if status is not None and checked != (status == 'closed'):
+                            mark = 'x' if status == 'closed' else ' '
+                            line = item.group(1) + mark + item.group(3) + item.group(4) + line[len(body):]
+                            changed += 1
+                out.write(line)
+
+    _replace_file_if_changed(path, rewrite, lambda: changed)
+    return changed
+
+
+def _replace_file_if_changed(path: str, write: Callable, count: Callable[[], int]) -> None:
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=os.path.basename(path), suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8', newline='') as out:
+            write(out)
+        if count():
+            os.replace(tmp_path, path)
+        else:
+            os.unlink(tmp_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+
+def _yaml_edits(text: str, status_of: StatusLookup) -> List[Tuple[int, int, str]]:
+    """(start, end, replacement) spans that set ``status`` on every synced task"""
+    import yaml
+    from yaml.constructor import SafeConstructor
+    from yaml.nodes import MappingNode, ScalarNode, SequenceNode
+
+    constructor = SafeConstructor()
+
+    def value(node, default=None):
+        if node is None:
+            return default
+        return constructor.construct_object(node, deep=True)
+
+    def fields(node) -> dict:
+        if not isinstance(node, MappingNode):
+            return {}
+        return {key.value: (key, val) for key, val in node.value if isinstance(key, ScalarNode)}
+
+    def items(node) -> list:
+        return node.value if isinstance(node, SequenceNode) else []
+
+    def get(mapping: dict, key: str):
+        pair = mapping.get(key)
+        return pair[1] if pair else None
+
+    root = yaml.compose(text, Loader=yaml.SafeLoader)
+    edits: List[Tuple[int, int, str]] = []
+    for phase_node in items(get(fields(root), 'phases')):
+        phase = fields(phase_node)
+        phase_name = value(get(phase, 'name'), 'Unknown Phase')
+        for week_node in items(get(phase, 'weeks')):
+            week_number = value(get(fields(week_node), 'week_number'), 1)
+            for category_node in items(get(fields(week_node), 'categories')):
+                for task_node in items(get(fields(category_node), 'tasks')):
+                    task = fields(task_node)
+                    if not task:
+                        continue
+                    title = value(get(task, 'title'), 'Untitled Task')
+                    status = status_of(Task(title=title, description='', phase=phase_name,
+                                            week=week_number, day_range='', category=''))
+                    if status is None:
+                        continue
+                    current = get(task, 'status')
+                    if current is not None:
+                        if value(current) != status:
+                            edits.append((current.start_mark.index, current.end_mark.index, status))
+                        continue
+                    # Insert before the first key: valid for "- title: ..." items and flow mappings alike
+                    first_key = task_node.value[0][0]
+                    if task_node.flow_style:
+                        insert = f"status: {status}, "
+                    else:
+                        insert = f"status: {status}\n" + ' ' * first_key.start_mark.column
+                    edits.append((first_key.start_mark.index, first_key.start_mark.index, insert))
+    return edits
+
+
+def sync_yaml(path: str, status_of: StatusLookup) -> int:
+    """Set ``status`` on YAML tasks, keeping comments and formatting; returns the number changed"""
+    with open(path, 'r', encoding='utf-8', newline='') as f:
+        text = f.read()
+    edits = sorted(_yaml_edits(text, status_of))
+
+    def rewrite(out) -> None:
+        position = 0
+        for start, end, replacement in edits:
+            out.write(text[position:start])
+            out.write(replacement)
+            position = end
+        out.write(text[position:])
+
+    _replace_file_if_changed(path, rewrite, lambda: len(edits))
+    return len(edits)
+
+
+def sync_roadmap(path: str, source: RoadmapSource, state: RepoStateCache, legacy_signatures: bool = True) -> int:
+    """Rewrite ``path`` in ``source``'s format from the synced issue states"""
+    from issuegen.sources.yaml_file import YamlSource
+
+    status_of = task_status(state, source, legacy_signatures)
+    if isinstance(source, MarkdownSource):
+        return sync_markdown(path, status_of)
+    if isinstance(source, YamlSource):
+        return sync_yaml(path, status_of)
+    raise ValueError(f"--sync supports markdown and yaml roadmaps, not '{source.name}'")
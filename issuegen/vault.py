@@ -0,0 +1,148 @@
+"""
+Obsidian / Markdown vault export of issue state
+خروجی وضعیت ایشوها به صورت یادداشت‌های Obsidian
+
+One note per signed issue, named after its UNIQUE_SIGNATURE so it stays put
+when the title changes; the title is an alias, so ``[[Title]]`` links still
+resolve. The front matter of each note carries a hash of the note itself.
+An export only lists the issues updated since the previous one (the cursor is
+kept in the vault) and rewrites a note only when its freshly rendered hash
+differs from the one on disk, so syncing a large vault touches just the
+notes whose issue really changed. Comments and reactions bump an issue's
+``updated_at`` but are not part of the note, so they cost a read, not a write.
+"""
+
+import hashlib
+import json
+import os
+import re
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from issuegen.signature import SIGNATURE_MARKER_RE
+
+VAULT_VERSION = 1
+VAULT_STATE_FILE = '.issuegen-vault.json'
+HASH_LENGTH = 16
+HASH_LINE = 'content_hash: {hash}\n'
+HASH_LINE_RE = re.compile(r'^content_hash:\s*([0-9a-f]+)\s*$')
+FRONT_MATTER_FENCE = '---'
+MAX_FRONT_MATTER_LINES = 50
+
+
+def _scalar(value: Any) -> str:
+    # JSON scalars and lists are valid YAML, and quote whatever needs quoting
+    return json.dumps(value, ensure_ascii=False)
+
+
+def _timestamp(value) -> Optional[str]:
+    return value.isoformat() if value is not None else None
+
+
+def note_fields(issue) -> Dict[str, Any]:
+    """Front matter of an issue's note, in display order"""
+    return {
+        'issue': issue.number,
+        'title': issue.title,
+        'aliases': [issue.title],
+        'state': issue.state,
+        'labels': [label.name for label in issue.labels],
+        'milestone': issue.milestone.title if issue.milestone is not None else None,
+        'assignees': [user.login for user in issue.assignees],
+        'url': issue.html_url,
+        'created': _timestamp(issue.created_at),
+        'closed': _timestamp(issue.closed_at),
+    }
+
+
+def content_hash(text: str) -> str:
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()[:HASH_LENGTH]
+
+
+def render_note(signature: str, issue) -> Tuple[str, str]:
+    """The whole note (its own ``content_hash`` included) and that hash"""
+    front = [f"signature: {signature}\n"]
+    front.extend(f"{key}: {_scalar(value)}\n" for key, value in note_fields(issue).items())
+    body = SIGNATURE_MARKER_RE.sub('', issue.body or '').strip()
+    text = f"# {issue.title}\n\n{body}\n" if body else f"# {issue.title}\n"
+    front_matter = "".join(front)
+    digest = content_hash(front_matter + text)
+    return f"{FRONT_MATTER_FENCE}\n{front_matter}{HASH_LINE.format(hash=digest)}{FRONT_MATTER_FENCE}\n\n{text}", digest
+
+
+def stored_hash(path: Path) -> Optional[str]:
+    """``content_hash`` from a note's front matter, reading no further than the front matter"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            if f.readline().rstrip('\n') != FRONT_MATTER_FENCE:
+                return None
+            for _ in range(MAX_FRONT_MATTER_LINES):
+                line = f.readline()
+                if not line or line.rstrip('\n') == FRONT_MATTER_FENCE:
+                    return None
+                match = HASH_LINE_RE.match(line)
+                if match:
+                    return match.group(1)
+    except (FileNotFoundError, UnicodeDecodeError):
+        return None
+    return None
+
+
+class IssueVault:
+    """A directory of issue notes plus the cursor of the last export"""
+
+    def __init__(self, directory: str, repo: str):
+        self.directory = Path(directory)
+        self.repo = repo
+        # GitHub's updated_at (ISO 8601) of the newest issue exported
+        self.exported_until: Optional[str] = None
+        self.written = 0
+        self.unchanged = 0
+
+    @property
+    def state_path(self) -> Path:
+        return self.directory / VAULT_STATE_FILE
+
+    def load(self) -> None:
+        try:
+            with open(self.state_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            print(f"⚠️ Ignoring unreadable vault state {self.state_path}: {e}")
+            return
+        # Another repository's cursor says nothing about this one
+        if data.get('version') == VAULT_VERSION and data.get('repo') == self.repo:
+            self.exported_until = data.get('exported_until')
+
+    def save(self) -> None:
+        self._write(self.state_path, json.dumps({'version': VAULT_VERSION, 'repo': self.repo,
+                                                 'exported_until': self.exported_until}))
+
+    def note_path(self, signature: str) -> Path:
+        return self.directory / f"{signature}.md"
+
+    def export(self, signature: str, issue) -> bool:
+        """Write the issue's note unless the one on disk has the same hash; True when written"""
+        note, digest = render_note(signature, issue)
+        path = self.note_path(signature)
+        if stored_hash(path) == digest:
+            self.unchanged += 1
+            return False
+        self._write(path, note)
+        self.written += 1
+        return True
+
+    def _write(self, path: Path, text: str) -> None:
+        """Replace atomically so Obsidian (or a sync client) never sees half a note"""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, prefix='.' + path.name, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                f.write(text)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
@@ -0,0 +1,58 @@
+"""
+Legacy MD5 markers of split sub-issues, as the baseline script wrote them
+"""
+
+import hashlib
+import unittest
+from pathlib import Path
+
+from issuegen.planner import plan_run
+from issuegen.prune import roadmap_signatures
+from issuegen.sources import get_source
+from issuegen.state import RepoStateCache
+from issuegen.sync import task_status
+
+ROADMAP = Path(__file__).resolve().parent.parent / 'docs' / 'Grok_Road_Map_v1.md'
+
+
+def baseline_marker(title: str, phase: str, week: int) -> str:
+    # issue_generator.py at the baseline: _generate_signature(sub_title, ...) in the body
+    return hashlib.md5(f"{phase}-{week}-{title}".encode('utf-8')).hexdigest()
+
+
+class SplitSubIssueLegacySignatureTest(unittest.TestCase):
+    def setUp(self):
+        self.source = get_source('markdown')()
+        self.phases = self.source.parse(str(ROADMAP))
+        self.auth_task = next(task for phase in self.phases for task in phase.tasks
+                              if len(self.source.expand_task(task)) > 1)
+        # Sub-issue bodies were signed with the title before " (Sub-task i/4)"
+        self.markers = [baseline_marker(f"{prefix} {self.auth_task.title}", self.auth_task.phase,
+                                        self.auth_task.week)
+                        for prefix in ("Implement OAuth2 setup for", "Add JWT handling for",
+                                       "Integrate bcrypt password hashing for", "Write authentication tests for")]
+
+    def test_prune_keeps_baseline_sub_issues(self):
+        keep = roadmap_signatures(self.phases, self.source)
+        for marker in self.markers:
+            self.assertIn(marker, keep)
+
+    def test_sync_maps_baseline_sub_issue_state(self):
+        state = RepoStateCache(Path('unused.json'), 'o/r')
+        for number, marker in enumerate(self.markers, 1):
+            state.record_issue_state(marker, number, 'closed')
+        self.assertEqual(task_status(state, self.source)(self.auth_task), 'closed')
+
+    def test_dedup_finds_baseline_sub_issues(self):
+        state = RepoStateCache(Path('unused.json'), 'o/r')
+        for number, marker in enumerate(self.markers, 1):
+            state.record_signature(marker, number)
+        phase = next(phase for phase in self.phases if self.auth_task in phase.tasks)
+        phase = type(phase)(phase.name, phase.description, phase.duration_weeks, [self.auth_task], phase.labels)
+        plan = plan_run([phase], state, self.source)
+        self.assertEqual(plan.issue_creates, 0)
+        self.assertEqual(plan.known_duplicates, len(self.markers))
+
+
+if __name__ == '__main__':
+    unittest.main()